@@ -0,0 +1,70 @@
+"""Unique index on candidate (supplier_item_id, asin)
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Map each duplicate mapping to the row that survives: a locked or primary
+    # row wins over a plain one, then the oldest
+    op.execute(
+        """
+        CREATE TEMP TABLE candidate_survivors AS
+        SELECT id, FIRST_VALUE(id) OVER (
+            PARTITION BY supplier_item_id, asin
+            ORDER BY is_locked DESC, is_primary DESC, id
+        ) AS survivor_id
+        FROM asin_candidates
+        """
+    )
+    op.execute("DELETE FROM candidate_survivors WHERE id = survivor_id")
+
+    # A duplicate's lock or primary flag carries over to its survivor
+    for flag in ("is_locked", "is_primary"):
+        op.execute(
+            f"""
+            UPDATE asin_candidates SET {flag} = 1
+            WHERE id IN (
+                SELECT s.survivor_id FROM candidate_survivors s
+                JOIN asin_candidates c ON c.id = s.id
+                WHERE c.{flag}
+            )
+            """
+        )
+
+    # Foreign keys are off on migration connections, so the CASCADE would not
+    # fire - move the history onto the survivor before dropping the duplicates
+    for table in ("keepa_snapshots", "spapi_snapshots", "score_history"):
+        op.execute(
+            f"""
+            UPDATE {table}
+            SET candidate_id = (
+                SELECT survivor_id FROM candidate_survivors
+                WHERE candidate_survivors.id = {table}.candidate_id
+            )
+            WHERE candidate_id IN (SELECT id FROM candidate_survivors)
+            """
+        )
+    op.execute("DELETE FROM asin_candidates WHERE id IN (SELECT id FROM candidate_survivors)")
+    op.execute("DROP TABLE candidate_survivors")
+
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_asin_candidates_item_asin "
+        "ON asin_candidates (supplier_item_id, asin)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ux_asin_candidates_item_asin")
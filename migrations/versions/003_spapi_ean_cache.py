@@ -0,0 +1,32 @@
+"""SP-API catalog cache keyed by EAN
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "spapi_ean_cache",
+        sa.Column("ean", sa.String(20), nullable=False),
+        sa.Column("payload", sa.Text(), default="[]"),
+        sa.Column("fetched_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("ean"),
+    )
+    op.create_index("ix_spapi_ean_cache_fetched_at", "spapi_ean_cache", ["fetched_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("spapi_ean_cache")
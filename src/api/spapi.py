@@ -8,6 +8,8 @@ import logging
 logger = logging.getLogger(__name__)
 import hmac
 import json
+import threading
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
@@ -45,6 +47,44 @@ class SpApiAuth:
         return datetime.now(UTC) < self.expires_at
 
 
+class RateLimiter:
+    """Thread-safe token bucket pacing calls to one SP-API operation."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Allow ``rate`` calls per second with bursts of up to ``burst``."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current sustained rate in calls per second."""
+        return self._rate
+
+    def set_rate(self, rate: float) -> None:
+        """Adopt the rate reported by SP-API's x-amzn-RateLimit-Limit header."""
+        if rate > 0:
+            with self._lock:
+                self._rate = rate
+
+    def acquire(self) -> None:
+        """Block until a call may be made, sleeping only for the missing share."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self._burst), self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
 class SpApiClient:
     """Amazon SP-API client with LWA + SigV4 authentication."""
 
@@ -67,6 +107,9 @@ class SpApiClient:
         # Session
         self.session = requests.Session()
 
+        # searchCatalogItems: 2 requests/second, burst of 2
+        self.catalog_limiter = RateLimiter(rate=2.0, burst=2)
+
         # Region
         self.region = "eu-west-1"
         self.service = "execute-api"
@@ -184,11 +227,19 @@ class SpApiClient:
         path: str,
         params: dict[str, Any] | None = None,
         body: dict[str, Any] | None = None,
+        limiter: RateLimiter | None = None,
     ) -> dict:
-        """Make a signed request to the SP-API."""
+        """Make a signed request to the SP-API.
+
+        When ``limiter`` is given the call waits for it first, and its rate is
+        updated from the response's x-amzn-RateLimit-Limit header.
+        """
         if self.mock_mode:
             return self._mock_response(path, params, body)
 
+        if limiter is not None:
+            limiter.acquire()
+
         access_token = self._get_lwa_access_token()
 
         url = f"{SP_API_ENDPOINT}{path}"
@@ -212,6 +263,12 @@ class SpApiClient:
             timeout=30,
         )
 
+        if limiter is not None:
+            try:
+                limiter.set_rate(float(response.headers.get("x-amzn-RateLimit-Limit", "")))
+            except ValueError:
+                pass
+
         if response.status_code == 429:
             # Rate limited
             retry_after = int(response.headers.get("Retry-After", "60"))
@@ -271,8 +328,6 @@ class SpApiClient:
         
         Includes automatic retry with backoff for rate limits.
         """
-        import time
-        
         if not identifiers:
             return {}
         
@@ -289,7 +344,9 @@ class SpApiClient:
         
         for attempt in range(max_retries):
             try:
-                response = self._make_request("GET", path, params=params)
+                response = self._make_request(
+                    "GET", path, params=params, limiter=self.catalog_limiter
+                )
                 items = response.get("items", [])
                 
                 # Map results back to their identifiers
@@ -3,14 +3,131 @@
 from __future__ import annotations
 
 import csv
+import io
+import logging
+import mmap
 import uuid
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from itertools import islice
 from pathlib import Path
 
+import numpy as np
+
 from .models import Brand, ImportResult, SupplierItem
 
+logger = logging.getLogger(__name__)
+
+# Read buffer for supplier files; the default 8 KiB causes excessive read syscalls
+DEFAULT_BUFFER_SIZE = 4 * 1024 * 1024
+# Previews stop after a few rows, so a full import-sized read would be wasted
+PREVIEW_BUFFER_SIZE = 1024 * 1024
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+_NEWLINE = 0x0A
+_QUOTE = 0x22
+_COMMA = 0x2C
+
+
+def _fast_chunker(buf: bytes | mmap.mmap, start: int = 0) -> list[int] | None:
+    """Return the offsets of every unquoted field/record delimiter in ``buf``.
+
+    The "is this byte special?" test runs as one vectorised comparison, so the
+    Python loop only visits commas, quotes and newlines. Buffers without any
+    quotes skip the loop entirely.
+
+    A quote only opens a quoted field at the start of a field; elsewhere in an
+    unquoted field (an inch mark, say) it is plain text, as in csv.reader.
+    Returns None if a quoted field is still open at the end of ``buf``.
+    """
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    mask = (arr == _NEWLINE) | (arr == _QUOTE) | (arr == _COMMA)
+    positions = np.flatnonzero(mask)
+    specials = arr[positions]
+
+    if not (specials == _QUOTE).any():
+        return positions.tolist()
+
+    delimiters: list[int] = []
+    in_quotes = False
+    field_start = start
+    closed_at = -2  # Offset of the last closing quote
+    for pos, byte in zip(positions.tolist(), specials.tolist()):
+        if byte == _QUOTE:
+            if in_quotes:
+                in_quotes = False
+                closed_at = pos
+            elif pos == field_start or pos == closed_at + 1:
+                # Opens a field, or is the second half of an escaped ""
+                in_quotes = True
+        elif not in_quotes:
+            delimiters.append(pos)
+            field_start = pos + 1
+    return None if in_quotes else delimiters
+
+
+def _decode_field(raw: bytes) -> str:
+    """Decode a raw CSV field, unwrapping quotes and escaped quotes."""
+    if raw.endswith(b"\r"):
+        raw = raw[:-1]
+    if raw.startswith(b'"') and raw.endswith(b'"') and len(raw) >= 2:
+        raw = raw[1:-1].replace(b'""', b'"')
+    return raw.decode("utf-8")
+
+
+def _split_fast_records(buf: bytes | mmap.mmap) -> list[list[str]] | None:
+    """Split ``buf`` into records using the offsets from ``_fast_chunker``.
+
+    Returns None if the quoting is unbalanced.
+    """
+    start = len(_UTF8_BOM) if buf[: len(_UTF8_BOM)] == _UTF8_BOM else 0
+    delimiters = _fast_chunker(buf, start)
+    if delimiters is None:
+        return None
+
+    records: list[list[str]] = []
+    fields: list[str] = []
+    for pos in delimiters:
+        fields.append(_decode_field(buf[start:pos]))
+        start = pos + 1
+        if buf[pos] == _NEWLINE:
+            if fields != [""]:  # Skip blank lines like csv.reader
+                records.append(fields)
+            fields = []
+
+    if start < len(buf):
+        fields.append(_decode_field(buf[start:]))
+    if fields and fields != [""]:
+        records.append(fields)
+    return records
+
+
+def _fast_dict_records(
+    buf: bytes | mmap.mmap,
+) -> tuple[list[str] | None, Iterator[dict[str, str]]] | None:
+    """Return (fieldnames, row dicts) for ``buf``, mirroring csv.DictReader.
+
+    Returns None when the file needs csv.DictReader after all: a quoted
+    field left open, or a row whose field count differs from the header's.
+    """
+    records = _split_fast_records(buf)
+    if records is None:
+        return None
+    if not records:
+        return None, iter(())
+    fieldnames = records[0]
+    if any(len(values) != len(fieldnames) for values in records):
+        return None
+    return fieldnames, (dict(zip(fieldnames, values)) for values in records[1:])
+
+
+def _open_text(path: Path, buffer_size: int) -> io.TextIOWrapper:
+    """Open a CSV file for csv.reader with a large read buffer."""
+    raw = open(path, "rb", buffering=buffer_size)
+    return io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+
 
 class CsvValidationError(Exception):
     """Raised when CSV validation fails."""
@@ -57,10 +174,17 @@ class CsvImporter:
 
     VALID_BRANDS = Brand.values()
 
-    def __init__(self) -> None:
-        """Initialize the importer."""
+    def __init__(self, newlines_in_values: bool = True) -> None:
+        """Initialize the importer.
+
+        Args:
+            newlines_in_values: Set to False for supplier files whose values never
+                contain embedded newlines to use the vectorised delimiter scan
+                instead of the stdlib csv reader.
+        """
         self.batch_id = ""
         self.import_time = datetime.now()
+        self.newlines_in_values = newlines_in_values
 
     def validate_headers(self, headers: list[str]) -> None:
         """Validate that all required headers are present."""
@@ -98,18 +222,21 @@ class CsvImporter:
             return default, f"Row {row_num}: Invalid {field_name} value '{value}', using {default}"
 
     def parse_row(self, row: dict[str, str], row_number: int) -> CsvRow:
-        """Parse a single CSV row."""
+        """Parse a single CSV row.
+
+        Columns missing from a short row (None, as csv.DictReader gives) count as blank.
+        """
         errors: list[str] = []
         warnings: list[str] = []
 
         # Get string fields with defaults
-        brand = row.get("Brand", "").strip()
-        supplier = row.get("Supplier", "").strip()
-        part_number = row.get("PartNumber", "").strip()
-        description = row.get("Description", "").strip()
-        ean = row.get("EAN", "").strip()
-        mpn = row.get("MPN", "").strip()
-        asin = row.get("ASIN", "").strip()
+        brand = (row.get("Brand") or "").strip()
+        supplier = (row.get("Supplier") or "").strip()
+        part_number = (row.get("PartNumber") or "").strip()
+        description = (row.get("Description") or "").strip()
+        ean = (row.get("EAN") or "").strip()
+        mpn = (row.get("MPN") or "").strip()
+        asin = (row.get("ASIN") or "").strip()
 
         # Validate brand
         if not brand:
@@ -127,18 +254,18 @@ class CsvImporter:
             errors.append(f"Row {row_number}: PartNumber is required")
 
         # Parse decimal costs
-        cost_1, err = self.parse_decimal(row.get("CostExVAT_1", ""), row_number, "CostExVAT_1")
+        cost_1, err = self.parse_decimal(row.get("CostExVAT_1") or "", row_number, "CostExVAT_1")
         if err:
             warnings.append(err)
 
         cost_5plus, err = self.parse_decimal(
-            row.get("CostExVAT_5Plus", ""), row_number, "CostExVAT_5Plus"
+            row.get("CostExVAT_5Plus") or "", row_number, "CostExVAT_5Plus"
         )
         if err:
             warnings.append(err)
 
         # Parse pack quantity
-        pack_qty, err = self.parse_int(row.get("PackQty", ""), row_number, "PackQty", default=1)
+        pack_qty, err = self.parse_int(row.get("PackQty") or "", row_number, "PackQty", default=1)
         if err:
             warnings.append(err)
         if pack_qty < 1:
@@ -161,9 +288,16 @@ class CsvImporter:
             warnings=warnings,
         )
 
-    def preview(self, file_path: str | Path, max_rows: int = 10) -> tuple[list[CsvRow], list[str]]:
+    def preview(
+        self,
+        file_path: str | Path,
+        max_rows: int = 10,
+        buffer_size: int = PREVIEW_BUFFER_SIZE,
+    ) -> tuple[list[CsvRow], list[str]]:
         """Preview the first N rows of a CSV file.
 
+        Rows are parsed as they are read, so only the start of the file is loaded.
+
         Returns tuple of (rows, validation_errors).
         """
         path = Path(file_path)
@@ -173,7 +307,7 @@ class CsvImporter:
         rows: list[CsvRow] = []
         validation_errors: list[str] = []
 
-        with open(path, newline="", encoding="utf-8-sig") as f:
+        with _open_text(path, buffer_size) as f:
             reader = csv.DictReader(f)
 
             if reader.fieldnames is None:
@@ -185,18 +319,24 @@ class CsvImporter:
                 validation_errors.append(str(e))
                 return rows, validation_errors
 
-            for i, row in enumerate(reader, start=2):  # Start at 2 (1-indexed, after header)
-                if i > max_rows + 1:
-                    break
+            # Start at 2 (1-indexed, after header); islice stops before reading row N+1
+            for i, row in enumerate(islice(reader, max_rows), start=2):
                 parsed = self.parse_row(row, i)
                 rows.append(parsed)
                 validation_errors.extend(parsed.errors)
 
         return rows, validation_errors
 
-    def import_file(self, file_path: str | Path) -> tuple[list[SupplierItem], ImportResult]:
+    def import_file(
+        self,
+        file_path: str | Path,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> tuple[list[SupplierItem], ImportResult]:
         """Import a CSV file and return SupplierItem objects.
 
+        ``buffer_size`` sets the read buffer; large machines may prefer 16 MiB.
+        The vectorised path scans a read-only mmap of the file instead.
+
         Returns tuple of (items, import_result).
         """
         path = Path(file_path)
@@ -208,61 +348,85 @@ class CsvImporter:
 
         items: list[SupplierItem] = []
         result = ImportResult(batch_id=self.batch_id)
+
+        use_reader = self.newlines_in_values
+        if not use_reader and path.stat().st_size == 0:
+            self._import_records(None, iter(()), items, result)
+        elif not use_reader:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                parsed = _fast_dict_records(m)
+                if parsed is None:
+                    # Quoting or row shapes the byte scan can't vouch for
+                    logger.info(f"{path.name}: falling back to csv.DictReader")
+                    use_reader = True
+                else:
+                    self._import_records(*parsed, items, result)
+
+        if use_reader:
+            with _open_text(path, buffer_size) as f:
+                reader = csv.DictReader(f)
+                self._import_records(reader.fieldnames, reader, items, result)
+
+        return items, result
+
+    def _import_records(
+        self,
+        fieldnames: list[str] | None,
+        records: Iterable[dict[str, str]],
+        items: list[SupplierItem],
+        result: ImportResult,
+    ) -> None:
+        """Validate headers and convert parsed records into SupplierItems."""
         all_errors: list[str] = []
         all_warnings: list[str] = []
 
-        with open(path, newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
+        if fieldnames is None:
+            result.errors.append("CSV file is empty or has no headers")
+            return
 
-            if reader.fieldnames is None:
-                result.errors.append("CSV file is empty or has no headers")
-                return items, result
+        try:
+            self.validate_headers(list(fieldnames))
+        except CsvValidationError as e:
+            result.errors.append(str(e))
+            return
+
+        for row_num, row in enumerate(records, start=2):
+            parsed = self.parse_row(row, row_num)
+
+            if parsed.errors:
+                all_errors.extend(parsed.errors)
+                result.items_skipped += 1
+                continue
 
+            all_warnings.extend(parsed.warnings)
+
+            # Create SupplierItem
             try:
-                self.validate_headers(list(reader.fieldnames))
-            except CsvValidationError as e:
-                result.errors.append(str(e))
-                return items, result
-
-            for row_num, row in enumerate(reader, start=2):
-                parsed = self.parse_row(row, row_num)
-
-                if parsed.errors:
-                    all_errors.extend(parsed.errors)
-                    result.items_skipped += 1
-                    continue
-
-                all_warnings.extend(parsed.warnings)
-
-                # Create SupplierItem
-                try:
-                    item = SupplierItem(
-                        brand=Brand.from_string(parsed.brand),
-                        supplier=parsed.supplier,
-                        part_number=parsed.part_number,
-                        description=parsed.description,
-                        ean=parsed.ean,
-                        mpn=parsed.mpn,
-                        asin_hint=parsed.asin,
-                        cost_ex_vat_1=parsed.cost_ex_vat_1,
-                        cost_ex_vat_5plus=parsed.cost_ex_vat_5plus,
-                        pack_qty=parsed.pack_qty,
-                        import_date=self.import_time,
-                        import_batch_id=self.batch_id,
-                        is_active=True,
-                    )
-                    items.append(item)
-                    result.items_imported += 1
-                except ValueError as e:
-                    all_errors.append(f"Row {row_num}: {e}")
-                    result.items_skipped += 1
+                item = SupplierItem(
+                    brand=Brand.from_string(parsed.brand),
+                    supplier=parsed.supplier,
+                    part_number=parsed.part_number,
+                    description=parsed.description,
+                    ean=parsed.ean,
+                    mpn=parsed.mpn,
+                    asin_hint=parsed.asin,
+                    cost_ex_vat_1=parsed.cost_ex_vat_1,
+                    cost_ex_vat_5plus=parsed.cost_ex_vat_5plus,
+                    pack_qty=parsed.pack_qty,
+                    import_date=self.import_time,
+                    import_batch_id=self.batch_id,
+                    is_active=True,
+                )
+                items.append(item)
+                result.items_imported += 1
+            except ValueError as e:
+                all_errors.append(f"Row {row_num}: {e}")
+                result.items_skipped += 1
 
         result.errors = all_errors
         result.warnings = all_warnings
         result.success = len(all_errors) == 0
 
-        return items, result
-
     def get_required_headers(self) -> list[str]:
         """Return the list of required headers."""
         return self.REQUIRED_HEADERS.copy()
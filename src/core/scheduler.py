@@ -31,7 +31,7 @@ class RefreshWorker(QObject):
 
     # Signals
     token_status_updated = pyqtSignal(int, int, int)  # tokensLeft, refillRate, refillIn
-    score_updated = pyqtSignal(str, str, int)  # brand, asin, score
+    scores_updated = pyqtSignal(list)  # [(brand, asin, score)], one emit per fetched batch
     batch_completed = pyqtSignal(str, int, int)  # pass_name, success_count, fail_count
     error_occurred = pyqtSignal(str)
     log_message = pyqtSignal(str)
@@ -56,6 +56,8 @@ class RefreshWorker(QObject):
         self._retry_queue: deque[tuple[str, int, datetime]] = deque()  # (ASIN, retry_count, next_retry_time)
         self._max_retries = 3
         self._retry_delays = [30, 120, 300]  # Seconds to wait before retry attempts
+        # Scores saved since the last scores_updated emit
+        self._score_updates: list[tuple[str, str, int]] = []
 
     def start_refresh(self) -> None:
         """Start the refresh loop."""
@@ -102,16 +104,19 @@ class RefreshWorker(QObject):
         # Save new score
         self.repo.save_score_history(candidate.id, result)
 
-        # Emit score update signal
-        self.score_updated.emit(
-            candidate.brand.value,
-            candidate.asin,
-            result.score,
-        )
+        # Reported with the rest of the batch by _flush_score_updates
+        self._score_updates.append((candidate.brand.value, candidate.asin, result.score))
 
         # Check for alerts
         self.alert_manager.check_for_alerts(result, previous, is_new=is_new)
 
+    def _flush_score_updates(self) -> None:
+        """Emit the scores saved since the last flush as one signal."""
+        if self._score_updates:
+            updates = self._score_updates
+            self._score_updates = []
+            self.scores_updated.emit(updates)
+
     def _add_to_retry_queue(self, asin: str, current_retry: int = 0) -> None:
         """Add an ASIN to the retry queue with exponential backoff."""
         if current_retry >= self._max_retries:
@@ -216,6 +221,7 @@ class RefreshWorker(QObject):
                 self._add_to_retry_queue(asin, retry_count)
             self.error_occurred.emit(f"Retry error: {e}")
 
+        self._flush_score_updates()
         return True
 
     def _process_priority_queue(self) -> bool:
@@ -292,12 +298,14 @@ class RefreshWorker(QObject):
                             self._save_score_and_check_alerts(candidate, result, is_new=True)
                             success_count += 1
 
+            self._flush_score_updates()
             self.batch_completed.emit("priority", success_count, 0)
             self.log_message.emit(f"Priority refresh: Completed {success_count} items")
 
         except Exception as e:
             logger.exception("Priority refresh error")
             self.error_occurred.emit(f"Priority refresh error: {e}")
+            self._flush_score_updates()
 
         return True
 
@@ -455,6 +463,7 @@ class RefreshWorker(QObject):
                 for asin in batch_asins:
                     self._add_to_retry_queue(asin)
 
+            self._flush_score_updates()
             i += batch_size
 
         self.batch_completed.emit("pass1", success_count, fail_count)
@@ -682,7 +691,7 @@ class RefreshController(QObject):
 
     # Forward signals
     token_status_updated = pyqtSignal(int, int, int)
-    score_updated = pyqtSignal(str, str, int)
+    scores_updated = pyqtSignal(list)
     batch_completed = pyqtSignal(str, int, int)
     error_occurred = pyqtSignal(str)
     log_message = pyqtSignal(str)
@@ -710,7 +719,7 @@ class RefreshController(QObject):
 
         # Connect signals
         self._worker.token_status_updated.connect(self.token_status_updated)
-        self._worker.score_updated.connect(self.score_updated)
+        self._worker.scores_updated.connect(self.scores_updated)
         self._worker.batch_completed.connect(self.batch_completed)
         self._worker.error_occurred.connect(self.error_occurred)
         self._worker.log_message.connect(self.log_message)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import platform
+import shutil
 import subprocess
 from enum import Enum
 from pathlib import Path
@@ -31,9 +32,14 @@ class SoundPlayer:
         SoundEffect.ERROR: "Basso",  # Low tone for errors
     }
 
+    LINUX_SOUND = "/usr/share/sounds/freedesktop/stereo/complete.oga"
+
     def __init__(self, enabled: bool = True) -> None:
         self._enabled = enabled
         self._system = platform.system()
+        # Player command per effect, resolved on first use; None rings the bell
+        self._commands: dict[SoundEffect, list[str] | None] = {}
+        self._process: subprocess.Popen | None = None
 
     @property
     def enabled(self) -> bool:
@@ -49,33 +55,45 @@ class SoundPlayer:
             return
 
         try:
-            if self._system == "Darwin":  # macOS
-                self._play_macos(effect)
-            elif self._system == "Windows":
+            if self._system == "Windows":
                 self._play_windows(effect)
-            else:  # Linux/other
-                self._play_linux(effect)
+            else:  # macOS, Linux/other
+                self._play_command(effect)
         except Exception as e:
             logger.debug(f"Failed to play sound: {e}")
 
-    def _play_macos(self, effect: SoundEffect) -> None:
-        """Play sound on macOS using afplay."""
-        sound_name = self.MACOS_SOUNDS.get(effect, "Glass")
-        sound_path = f"/System/Library/Sounds/{sound_name}.aiff"
-
-        if Path(sound_path).exists():
-            subprocess.Popen(
-                ["afplay", sound_path],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        else:
-            # Fallback to system beep
-            subprocess.Popen(
-                ["osascript", "-e", "beep"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+    def _play_command(self, effect: SoundEffect) -> None:
+        """Start the platform's sound player without waiting for it."""
+        if self._process is not None and self._process.poll() is None:
+            return  # Previous sound still playing
+
+        if effect not in self._commands:
+            self._commands[effect] = self._resolve_command(effect)
+        command = self._commands[effect]
+
+        if command is None:
+            # Fallback to terminal bell
+            print("\a", end="", flush=True)
+            return
+        self._process = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _resolve_command(self, effect: SoundEffect) -> list[str] | None:
+        """Get the command playing an effect on this platform."""
+        if self._system == "Darwin":
+            # afplay with a system sound, or the system beep
+            sound_name = self.MACOS_SOUNDS.get(effect, "Glass")
+            sound_path = f"/System/Library/Sounds/{sound_name}.aiff"
+            if Path(sound_path).exists():
+                return ["afplay", sound_path]
+            return ["osascript", "-e", "beep"]
+
+        # paplay (PulseAudio) if installed
+        player = shutil.which("paplay")
+        return [player, self.LINUX_SOUND] if player else None
 
     def _play_windows(self, effect: SoundEffect) -> None:
         """Play sound on Windows."""
@@ -91,19 +109,6 @@ class SoundPlayer:
 
         winsound.MessageBeep(sound_map.get(effect, winsound.MB_OK))
 
-    def _play_linux(self, effect: SoundEffect) -> None:
-        """Play sound on Linux using paplay or aplay."""
-        # Try paplay (PulseAudio) first
-        try:
-            subprocess.Popen(
-                ["paplay", "/usr/share/sounds/freedesktop/stereo/complete.oga"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        except FileNotFoundError:
-            # Fallback to terminal bell
-            print("\a", end="", flush=True)
-
     def play_new_opportunity(self) -> None:
         """Convenience method for new opportunity sound."""
         self.play(SoundEffect.NEW_OPPORTUNITY)
@@ -8,6 +8,7 @@ from .models import (
     GlobalSettingsDB,
     KeepaSnapshotDB,
     ScoreHistoryDB,
+    SpApiEanCacheDB,
     SpApiSnapshotDB,
     SupplierItemDB,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "AsinCandidateDB",
     "KeepaSnapshotDB",
     "SpApiSnapshotDB",
+    "SpApiEanCacheDB",
     "ScoreHistoryDB",
     "BrandSettingsDB",
     "GlobalSettingsDB",
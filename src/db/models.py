@@ -206,6 +206,16 @@ class SpApiSnapshotDB(Base):
     __table_args__ = (Index("ix_spapi_snapshots_asin_time", "asin", "snapshot_time"),)
 
 
+class SpApiEanCacheDB(Base):
+    """Cached SP-API catalog items for an EAN."""
+
+    __tablename__ = "spapi_ean_cache"
+
+    ean: Mapped[str] = mapped_column(String(20), primary_key=True)
+    payload: Mapped[str] = mapped_column(Text, default="[]")  # JSON list of catalog items
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, index=True)
+
+
 class ScoreHistoryDB(Base):
     """Historical score records."""
 
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import and_, case, desc, func, select, update
+from sqlalchemy import and_, bindparam, case, desc, exists, func, or_, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from src.core.models import (
@@ -27,11 +31,15 @@ from .models import (
     GlobalSettingsDB,
     KeepaSnapshotDB,
     ScoreHistoryDB,
+    SpApiEanCacheDB,
     SpApiSnapshotDB,
     SupplierItemDB,
 )
 from .session import session_scope
 
+# Maximum ids bound into a single IN (...) clause
+IN_CLAUSE_CHUNK = 500
+
 
 class Repository:
     """Data access repository for all database operations."""
@@ -39,6 +47,10 @@ class Repository:
     def __init__(self, session: Session | None = None) -> None:
         """Initialize with optional session (creates new if not provided)."""
         self._external_session = session
+        # Session of the open transaction() block, if any
+        self._transaction_session: Session | None = None
+        self._owner_thread = threading.get_ident()
+        self._thread_local = threading.local()
 
     def _get_session(self) -> Session:
         """Get the session to use."""
@@ -47,11 +59,55 @@ class Repository:
         from .session import get_session
         return get_session()
 
+    def for_thread(self) -> Repository:
+        """Get a repository for use on the calling thread.
+
+        Returns this repository on the thread that created it. Other threads
+        each get their own instance, created on first use, since the open
+        transaction is not thread-safe. All instances
+        draw connections from the shared engine pool.
+        """
+        if threading.get_ident() == self._owner_thread:
+            return self
+        repo = getattr(self._thread_local, "repo", None)
+        if repo is None:
+            repo = Repository()
+            self._thread_local.repo = repo
+        return repo
+
+    @contextmanager
+    def _session_scope(self) -> Generator[Session, None, None]:
+        """Use the open transaction's session, or a self-committing one."""
+        if self._transaction_session is not None:
+            yield self._transaction_session
+            return
+        with session_scope() as session:
+            yield session
+
+    @contextmanager
+    def transaction(self) -> Generator[Repository, None, None]:
+        """Group repository calls into a single commit.
+
+        Calls made on this repository inside the block share one session and
+        are committed together on exit, or rolled back on error. Nested blocks
+        join the outer transaction. A repository must not be shared across
+        threads while a transaction is open.
+        """
+        if self._transaction_session is not None:
+            yield self
+            return
+        try:
+            with session_scope() as session:
+                self._transaction_session = session
+                yield self
+        finally:
+            self._transaction_session = None
+
     # ==================== Supplier Items ====================
 
     def save_supplier_item(self, item: SupplierItem) -> SupplierItem:
         """Save a supplier item to the database."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_item = SupplierItemDB(
                 brand=item.brand.value,
                 supplier=item.supplier,
@@ -76,7 +132,7 @@ class Repository:
 
     def save_supplier_items_batch(self, items: list[SupplierItem]) -> list[SupplierItem]:
         """Save multiple supplier items efficiently."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_items = []
             for item in items:
                 db_item = SupplierItemDB(
@@ -108,7 +164,7 @@ class Repository:
 
     def get_supplier_items_by_brand(self, brand: Brand, active_only: bool = True) -> list[SupplierItem]:
         """Get all supplier items for a brand."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = select(SupplierItemDB).where(SupplierItemDB.brand == brand.value)
             if active_only:
                 query = query.where(SupplierItemDB.is_active == True)
@@ -117,19 +173,45 @@ class Repository:
             result = session.execute(query).scalars().all()
             return [self._db_to_supplier_item(db) for db in result]
 
+    def get_supplier_items_by_brands(
+        self, brands: list[Brand], active_only: bool = True
+    ) -> list[SupplierItem]:
+        """Get all supplier items for several brands in one query, by part number."""
+        if not brands:
+            return []
+        with self._session_scope() as session:
+            query = select(SupplierItemDB).where(
+                SupplierItemDB.brand.in_([brand.value for brand in brands])
+            )
+            if active_only:
+                query = query.where(SupplierItemDB.is_active == True)
+            query = query.order_by(SupplierItemDB.part_number)
+
+            result = session.execute(query).scalars().all()
+            return [self._db_to_supplier_item(db) for db in result]
+
     def get_supplier_item_by_id(self, item_id: int) -> SupplierItem | None:
         """Get a supplier item by ID."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_item = session.get(SupplierItemDB, item_id)
             if db_item:
                 return self._db_to_supplier_item(db_item)
             return None
 
+    def get_supplier_items_by_ids(self, item_ids: list[int]) -> list[SupplierItem]:
+        """Get supplier items by ID, in no particular order."""
+        if not item_ids:
+            return []
+        with self._session_scope() as session:
+            query = select(SupplierItemDB).where(SupplierItemDB.id.in_(item_ids))
+            result = session.execute(query).scalars().all()
+            return [self._db_to_supplier_item(db) for db in result]
+
     def get_supplier_item_by_key(
         self, brand: Brand, supplier: str, part_number: str
     ) -> SupplierItem | None:
         """Get a supplier item by unique key."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = select(SupplierItemDB).where(
                 and_(
                     SupplierItemDB.brand == brand.value,
@@ -145,7 +227,7 @@ class Repository:
 
     def deactivate_supplier_items_for_batch(self, brand: Brand, batch_id: str) -> int:
         """Deactivate all supplier items from a previous batch (not the current one)."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             stmt = (
                 update(SupplierItemDB)
                 .where(
@@ -187,7 +269,7 @@ class Repository:
 
     def save_asin_candidate(self, candidate: AsinCandidate) -> AsinCandidate:
         """Save an ASIN candidate."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_candidate = AsinCandidateDB(
                 supplier_item_id=candidate.supplier_item_id,
                 brand=candidate.brand.value,
@@ -206,11 +288,11 @@ class Repository:
             session.add(db_candidate)
             session.flush()
             candidate.id = db_candidate.id
-            return candidate
+        return candidate
 
     def save_asin_candidates_batch(self, candidates: list[AsinCandidate]) -> list[AsinCandidate]:
         """Save multiple ASIN candidates efficiently."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_candidates = []
             for candidate in candidates:
                 db_candidate = AsinCandidateDB(
@@ -236,13 +318,64 @@ class Repository:
             for candidate, db_candidate in zip(candidates, db_candidates):
                 candidate.id = db_candidate.id
 
-            return candidates
+        return candidates
+
+    def save_asin_candidates_upsert(self, candidates: list[AsinCandidate]) -> list[int | None]:
+        """Insert candidates, skipping any (supplier_item_id, asin) already stored.
+
+        Returns the new id for each inserted candidate and None for skipped ones,
+        in input order. Replaces the get_candidate_by_asin check before saving.
+        """
+        if not candidates:
+            return []
+
+        now = datetime.now()
+        rows = [
+            {
+                "supplier_item_id": candidate.supplier_item_id,
+                "brand": candidate.brand.value,
+                "supplier": candidate.supplier,
+                "part_number": candidate.part_number,
+                "asin": candidate.asin,
+                "title": candidate.title,
+                "amazon_brand": candidate.amazon_brand,
+                "match_reason": candidate.match_reason,
+                "confidence_score": candidate.confidence_score,
+                "source": candidate.source.value,
+                "is_active": candidate.is_active,
+                "is_primary": candidate.is_primary,
+                "is_locked": candidate.is_locked,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for candidate in candidates
+        ]
+        stmt = (
+            sqlite_insert(AsinCandidateDB)
+            .on_conflict_do_nothing(index_elements=["supplier_item_id", "asin"])
+            .returning(
+                AsinCandidateDB.id, AsinCandidateDB.supplier_item_id, AsinCandidateDB.asin
+            )
+        )
+        with self._session_scope() as session:
+            inserted = {
+                (row.supplier_item_id, row.asin): row.id
+                for row in session.execute(stmt, rows)
+            }
+
+        ids: list[int | None] = []
+        for candidate in candidates:
+            new_id = inserted.pop((candidate.supplier_item_id, candidate.asin), None)
+            if new_id is not None:
+                candidate.id = new_id
+            ids.append(new_id)
+        return ids
 
     def get_candidates_by_supplier_item(
         self, supplier_item_id: int, active_only: bool = True
     ) -> list[AsinCandidate]:
         """Get all ASIN candidates for a supplier item."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = select(AsinCandidateDB).where(
                 AsinCandidateDB.supplier_item_id == supplier_item_id
             )
@@ -253,9 +386,49 @@ class Repository:
             result = session.execute(query).scalars().all()
             return [self._db_to_asin_candidate(db) for db in result]
 
+    def get_candidates_for_items(
+        self, supplier_item_ids: list[int]
+    ) -> dict[int, dict[str, AsinCandidate]]:
+        """Get candidates for many supplier items, keyed by item id then ASIN.
+
+        Empty placeholder candidates are stored under the "" key. Items with
+        no candidates map to an empty dict.
+        """
+        by_item: dict[int, dict[str, AsinCandidate]] = {
+            item_id: {} for item_id in supplier_item_ids
+        }
+        ids = list(by_item)
+        with self._session_scope() as session:
+            for start in range(0, len(ids), IN_CLAUSE_CHUNK):
+                query = select(AsinCandidateDB).where(
+                    AsinCandidateDB.supplier_item_id.in_(ids[start:start + IN_CLAUSE_CHUNK])
+                )
+                for db in session.execute(query).scalars():
+                    candidate = self._db_to_asin_candidate(db)
+                    by_item[candidate.supplier_item_id][candidate.asin] = candidate
+        return by_item
+
+    def get_item_ids_without_asins(self, brands: list[Brand]) -> set[int]:
+        """Get the active supplier items of the brands that still need an ASIN search.
+
+        An item needs a search unless one of its candidates has an ASIN or
+        records an earlier EAN search that found nothing.
+        """
+        searched = exists().where(
+            AsinCandidateDB.supplier_item_id == SupplierItemDB.id,
+            or_(AsinCandidateDB.asin != "", AsinCandidateDB.source == "spapi_ean_not_found"),
+        )
+        with self._session_scope() as session:
+            query = select(SupplierItemDB.id).where(
+                SupplierItemDB.brand.in_([brand.value for brand in brands]),
+                SupplierItemDB.is_active == True,
+                ~searched,
+            )
+            return set(session.execute(query).scalars())
+
     def get_candidates_by_brand(self, brand: Brand, active_only: bool = True) -> list[AsinCandidate]:
         """Get all ASIN candidates for a brand."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = select(AsinCandidateDB).where(AsinCandidateDB.brand == brand.value)
             if active_only:
                 query = query.where(AsinCandidateDB.is_active == True)
@@ -266,7 +439,7 @@ class Repository:
 
     def get_candidates_by_batch(self, batch_id: str, active_only: bool = True) -> list[AsinCandidate]:
         """Get all ASIN candidates for items in a specific import batch."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             # First get supplier item IDs for the batch
             item_query = select(SupplierItemDB.id).where(
                 SupplierItemDB.import_batch_id == batch_id
@@ -290,7 +463,7 @@ class Repository:
         self, supplier_item_id: int, asin: str
     ) -> AsinCandidate | None:
         """Get a specific ASIN candidate."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = select(AsinCandidateDB).where(
                 and_(
                     AsinCandidateDB.supplier_item_id == supplier_item_id,
@@ -304,7 +477,7 @@ class Repository:
 
     def get_primary_candidate(self, supplier_item_id: int) -> AsinCandidate | None:
         """Get the primary ASIN candidate for a supplier item."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = select(AsinCandidateDB).where(
                 and_(
                     AsinCandidateDB.supplier_item_id == supplier_item_id,
@@ -325,7 +498,7 @@ class Repository:
         is_locked: bool | None = None,
     ) -> None:
         """Update candidate status flags."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             values: dict[str, Any] = {"updated_at": datetime.now()}
             if is_active is not None:
                 values["is_active"] = is_active
@@ -343,7 +516,7 @@ class Repository:
 
     def set_primary_candidate(self, supplier_item_id: int, candidate_id: int) -> None:
         """Set a candidate as primary and unset others."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             # Unset all primaries for this supplier item
             stmt = (
                 update(AsinCandidateDB)
@@ -362,7 +535,7 @@ class Repository:
 
     def clear_other_primaries(self, supplier_item_id: int, keep_asin: str) -> None:
         """Clear primary flag from all candidates except the one with keep_asin."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             stmt = (
                 update(AsinCandidateDB)
                 .where(
@@ -373,9 +546,32 @@ class Repository:
             )
             session.execute(stmt)
 
+    def clear_other_primaries_batch(self, keep: list[tuple[int, str]]) -> None:
+        """Apply clear_other_primaries to many (supplier_item_id, keep_asin) pairs at once."""
+        if not keep:
+            return
+        table = AsinCandidateDB.__table__
+        stmt = (
+            update(table)
+            .where(
+                table.c.supplier_item_id == bindparam("b_item_id"),
+                table.c.asin != bindparam("b_keep_asin"),
+            )
+            .values(is_primary=False, updated_at=bindparam("b_now"))
+        )
+        now = datetime.now()
+        with self._session_scope() as session:
+            session.execute(
+                stmt,
+                [
+                    {"b_item_id": item_id, "b_keep_asin": asin, "b_now": now}
+                    for item_id, asin in keep
+                ],
+            )
+
     def get_empty_candidate(self, supplier_item_id: int) -> AsinCandidate | None:
         """Get an existing candidate with empty ASIN for this supplier item."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_candidate = (
                 session.query(AsinCandidateDB)
                 .filter(
@@ -399,7 +595,7 @@ class Repository:
         match_reason: str,
     ) -> None:
         """Update an existing candidate with ASIN data."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             stmt = (
                 update(AsinCandidateDB)
                 .where(AsinCandidateDB.id == candidate_id)
@@ -418,7 +614,7 @@ class Repository:
 
     def mark_search_attempted(self, candidate_id: int) -> None:
         """Mark a candidate as searched but no ASIN found."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             stmt = (
                 update(AsinCandidateDB)
                 .where(AsinCandidateDB.id == candidate_id)
@@ -434,7 +630,7 @@ class Repository:
         """Find ASINs mapped to multiple part numbers. Returns [(asin, count, part_numbers)]."""
         from sqlalchemy import func
         
-        with session_scope() as session:
+        with self._session_scope() as session:
             # Find ASINs with multiple mappings
             duplicates = (
                 session.query(
@@ -452,7 +648,7 @@ class Repository:
 
     def get_existing_part_numbers(self, brand: str) -> set[str]:
         """Get all existing part numbers for a brand."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             results = (
                 session.query(SupplierItemDB.part_number)
                 .filter(SupplierItemDB.brand == brand, SupplierItemDB.is_active == True)
@@ -460,11 +656,26 @@ class Repository:
             )
             return {r.part_number for r in results}
 
+    def get_existing_pairs(self, pairs: list[tuple[str, str]]) -> set[tuple[str, str]]:
+        """Return the (brand, part_number) pairs that exist as active supplier items."""
+        wanted = list(set(pairs))
+        existing: set[tuple[str, str]] = set()
+        with self._session_scope() as session:
+            for start in range(0, len(wanted), IN_CLAUSE_CHUNK):
+                query = select(SupplierItemDB.brand, SupplierItemDB.part_number).where(
+                    tuple_(SupplierItemDB.brand, SupplierItemDB.part_number).in_(
+                        wanted[start:start + IN_CLAUSE_CHUNK]
+                    ),
+                    SupplierItemDB.is_active == True,
+                )
+                existing.update((row.brand, row.part_number) for row in session.execute(query))
+        return existing
+
     def get_import_stats(self) -> dict[str, int]:
         """Get overall import statistics."""
         from sqlalchemy import func
         
-        with session_scope() as session:
+        with self._session_scope() as session:
             total_items = session.query(func.count(SupplierItemDB.id)).filter(SupplierItemDB.is_active == True).scalar()
             items_with_asin = (
                 session.query(func.count(func.distinct(AsinCandidateDB.supplier_item_id)))
@@ -483,7 +694,7 @@ class Repository:
         amazon_brand: str | None = None,
     ) -> None:
         """Update the title (and optionally brand) of a candidate from Keepa data."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             values: dict[str, Any] = {"updated_at": datetime.now()}
             if title:
                 values["title"] = title
@@ -500,7 +711,7 @@ class Repository:
 
     def get_all_active_candidates(self) -> list[AsinCandidate]:
         """Get all active ASIN candidates across all brands."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = (
                 select(AsinCandidateDB)
                 .where(AsinCandidateDB.is_active == True)
@@ -534,7 +745,7 @@ class Repository:
 
     def save_keepa_snapshot(self, candidate_id: int, snapshot: KeepaSnapshot) -> KeepaSnapshot:
         """Save a Keepa snapshot."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_snapshot = KeepaSnapshotDB(
                 candidate_id=candidate_id,
                 asin=snapshot.asin,
@@ -564,7 +775,7 @@ class Repository:
 
     def get_latest_keepa_snapshot(self, candidate_id: int) -> KeepaSnapshot | None:
         """Get the most recent Keepa snapshot for a candidate."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = (
                 select(KeepaSnapshotDB)
                 .where(KeepaSnapshotDB.candidate_id == candidate_id)
@@ -580,7 +791,7 @@ class Repository:
         self, candidate_id: int, since: datetime | None = None, limit: int = 100
     ) -> list[KeepaSnapshot]:
         """Get Keepa snapshots for a candidate."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = select(KeepaSnapshotDB).where(KeepaSnapshotDB.candidate_id == candidate_id)
             if since:
                 query = query.where(KeepaSnapshotDB.snapshot_time >= since)
@@ -619,7 +830,7 @@ class Repository:
 
     def save_spapi_snapshot(self, candidate_id: int, snapshot: SpApiSnapshot) -> SpApiSnapshot:
         """Save an SP-API snapshot."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_snapshot = SpApiSnapshotDB(
                 candidate_id=candidate_id,
                 asin=snapshot.asin,
@@ -647,7 +858,7 @@ class Repository:
         self, candidate_id: int, sell_price: Decimal | None = None, ttl_minutes: int = 60
     ) -> SpApiSnapshot | None:
         """Get a cached SP-API snapshot if still valid."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = select(SpApiSnapshotDB).where(SpApiSnapshotDB.candidate_id == candidate_id)
 
             if sell_price is not None:
@@ -686,11 +897,46 @@ class Repository:
             created_at=db.created_at,
         )
 
+    # ==================== SP-API EAN Cache ====================
+
+    def get_cached_catalog_items(
+        self, eans: list[str], ttl_days: int = 7
+    ) -> dict[str, list[dict]]:
+        """Get cached catalog search results for EANs fetched within the TTL."""
+        cutoff = datetime.now() - timedelta(days=ttl_days)
+        cached: dict[str, list[dict]] = {}
+        with self._session_scope() as session:
+            for start in range(0, len(eans), IN_CLAUSE_CHUNK):
+                query = select(SpApiEanCacheDB).where(
+                    SpApiEanCacheDB.ean.in_(eans[start:start + IN_CLAUSE_CHUNK]),
+                    SpApiEanCacheDB.fetched_at >= cutoff,
+                )
+                for db in session.execute(query).scalars():
+                    cached[db.ean] = json.loads(db.payload)
+        return cached
+
+    def cache_catalog_items(self, results: dict[str, list[dict]]) -> None:
+        """Store catalog search results by EAN, replacing older entries."""
+        if not results:
+            return
+        now = datetime.now()
+        stmt = sqlite_insert(SpApiEanCacheDB)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SpApiEanCacheDB.ean],
+            set_={"payload": stmt.excluded.payload, "fetched_at": stmt.excluded.fetched_at},
+        )
+        rows = [
+            {"ean": ean, "payload": json.dumps(items), "fetched_at": now}
+            for ean, items in results.items()
+        ]
+        with self._session_scope() as session:
+            session.execute(stmt, rows)
+
     # ==================== Score History ====================
 
     def save_score_history(self, candidate_id: int, result: ScoreResult) -> ScoreHistory:
         """Save a score result to history."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             # Serialize breakdown and flags
             breakdown_json = json.dumps({
                 "velocity_raw": str(result.breakdown.velocity_raw),
@@ -751,7 +997,7 @@ class Repository:
         self, candidate_id: int, limit: int = 100
     ) -> list[ScoreHistory]:
         """Get score history for a candidate."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = (
                 select(ScoreHistoryDB)
                 .where(ScoreHistoryDB.candidate_id == candidate_id)
@@ -759,26 +1005,224 @@ class Repository:
                 .limit(limit)
             )
             result = session.execute(query).scalars().all()
-            return [
-                ScoreHistory(
-                    id=db.id,
-                    asin_candidate_id=db.candidate_id,
-                    asin=db.asin,
-                    score=db.score,
-                    profit_net=db.profit_net,
-                    margin_net=db.margin_net,
-                    sales_proxy_30d=db.sales_proxy_30d,
-                    flags_json=db.flags_json,
-                    calculated_at=db.calculated_at,
+            return [self._db_to_score_history(db) for db in result]
+
+    def get_score_history_for_candidates(
+        self, candidate_ids: list[int], limit: int = 100
+    ) -> dict[int, list[ScoreHistory]]:
+        """Get the newest `limit` score records for each candidate.
+
+        Returns candidate_id -> records, newest first. Candidates without
+        history are omitted.
+        """
+        history: dict[int, list[ScoreHistory]] = {}
+        if not candidate_ids:
+            return history
+        with self._session_scope() as session:
+            for start in range(0, len(candidate_ids), IN_CLAUSE_CHUNK):
+                chunk = candidate_ids[start:start + IN_CLAUSE_CHUNK]
+                self._collect_score_history(
+                    session, history, ScoreHistoryDB.candidate_id.in_(chunk), limit
                 )
-                for db in result
-            ]
+        return history
+
+    def get_brand_score_history(
+        self, brand: Brand, limit: int = 100
+    ) -> dict[int, list[ScoreHistory]]:
+        """Get the newest `limit` score records for each active candidate of a brand.
+
+        Same result as get_score_history_for_candidates, but filtered by
+        brand inside the query so it is one statement however many
+        candidates the brand has.
+        """
+        brand_ids = select(AsinCandidateDB.id).where(
+            AsinCandidateDB.brand == brand.value, AsinCandidateDB.is_active == True
+        )
+        history: dict[int, list[ScoreHistory]] = {}
+        with self._session_scope() as session:
+            self._collect_score_history(
+                session, history, ScoreHistoryDB.candidate_id.in_(brand_ids), limit
+            )
+        return history
+
+    def get_profit_history_for_candidates(
+        self, candidate_ids: list[int], limit: int = 20
+    ) -> dict[int, list[float]]:
+        """Get the newest `limit` net profits for each candidate, oldest first.
+
+        Reads only the profit column, for sparklines that don't need the
+        full score records. Candidates without history are omitted.
+        """
+        history: dict[int, list[float]] = {}
+        if not candidate_ids:
+            return history
+        with self._session_scope() as session:
+            for start in range(0, len(candidate_ids), IN_CLAUSE_CHUNK):
+                chunk = candidate_ids[start:start + IN_CLAUSE_CHUNK]
+                self._collect_profit_history(
+                    session, history, ScoreHistoryDB.candidate_id.in_(chunk), limit
+                )
+        return history
+
+    def get_brand_profit_history(
+        self, brand: Brand, limit: int = 20
+    ) -> dict[int, list[float]]:
+        """Get the newest `limit` net profits for each active candidate of a brand.
+
+        Brand-filtered counterpart of get_profit_history_for_candidates.
+        """
+        brand_ids = select(AsinCandidateDB.id).where(
+            AsinCandidateDB.brand == brand.value, AsinCandidateDB.is_active == True
+        )
+        history: dict[int, list[float]] = {}
+        with self._session_scope() as session:
+            self._collect_profit_history(
+                session, history, ScoreHistoryDB.candidate_id.in_(brand_ids), limit
+            )
+        return history
+
+    @staticmethod
+    def _ranked_score_history(criterion: Any) -> Any:
+        """Subquery numbering the score records matching criterion, newest first."""
+        return (
+            select(
+                ScoreHistoryDB.id,
+                ScoreHistoryDB.candidate_id,
+                ScoreHistoryDB.profit_net,
+                func.row_number().over(
+                    partition_by=ScoreHistoryDB.candidate_id,
+                    order_by=(desc(ScoreHistoryDB.calculated_at), desc(ScoreHistoryDB.id)),
+                ).label("rn"),
+            )
+            .where(criterion)
+            .subquery()
+        )
+
+    def _collect_profit_history(
+        self,
+        session: Session,
+        history: dict[int, list[float]],
+        criterion: Any,
+        limit: int,
+    ) -> None:
+        """Add the newest `limit` profits per candidate matching criterion to history."""
+        ranked = self._ranked_score_history(criterion)
+        query = (
+            select(ranked.c.candidate_id, ranked.c.profit_net)
+            .where(ranked.c.rn <= limit)
+            .order_by(ranked.c.candidate_id, desc(ranked.c.rn))
+        )
+        for candidate_id, profit_net in session.execute(query):
+            history.setdefault(candidate_id, []).append(float(profit_net))
+
+    def _collect_score_history(
+        self,
+        session: Session,
+        history: dict[int, list[ScoreHistory]],
+        criterion: Any,
+        limit: int,
+    ) -> None:
+        """Add the newest `limit` records per candidate matching criterion to history."""
+        ranked = self._ranked_score_history(criterion)
+        query = (
+            select(ScoreHistoryDB)
+            .join(ranked, ranked.c.id == ScoreHistoryDB.id)
+            .where(ranked.c.rn <= limit)
+            .order_by(ScoreHistoryDB.candidate_id, ranked.c.rn)
+        )
+        for db in session.execute(query).scalars():
+            history.setdefault(db.candidate_id, []).append(self._db_to_score_history(db))
 
     def get_latest_score(self, candidate_id: int) -> ScoreHistory | None:
         """Get the most recent score for a candidate."""
         history = self.get_score_history(candidate_id, limit=1)
         return history[0] if history else None
 
+    def get_latest_brand_bundle(
+        self, brand: Brand, spapi_ttl_minutes: int = 60
+    ) -> list[
+        tuple[AsinCandidate, SupplierItem, ScoreHistory, KeepaSnapshot | None, SpApiSnapshot | None]
+    ]:
+        """Get each scored active candidate of a brand with its latest data.
+
+        One query returning, per candidate, its supplier item, latest score,
+        latest Keepa snapshot and latest SP-API snapshot. The SP-API snapshot
+        follows get_latest_spapi_snapshot's TTL. Candidates without a score
+        or supplier item are omitted. Ordered like get_candidates_by_brand.
+        """
+        brand_ids = select(AsinCandidateDB.id).where(
+            AsinCandidateDB.brand == brand.value, AsinCandidateDB.is_active == True
+        )
+        cutoff = datetime.now() - timedelta(minutes=spapi_ttl_minutes)
+
+        def latest(model: Any, time_col: Any, *criteria: Any) -> Any:
+            return (
+                select(
+                    model.id,
+                    model.candidate_id,
+                    func.row_number().over(
+                        partition_by=model.candidate_id,
+                        order_by=(desc(time_col), desc(model.id)),
+                    ).label("rn"),
+                )
+                .where(model.candidate_id.in_(brand_ids), *criteria)
+                .subquery()
+            )
+
+        score_rank = latest(ScoreHistoryDB, ScoreHistoryDB.calculated_at)
+        keepa_rank = latest(KeepaSnapshotDB, KeepaSnapshotDB.snapshot_time)
+        spapi_rank = latest(
+            SpApiSnapshotDB, SpApiSnapshotDB.snapshot_time, SpApiSnapshotDB.snapshot_time >= cutoff
+        )
+
+        query = (
+            select(AsinCandidateDB, SupplierItemDB, ScoreHistoryDB, KeepaSnapshotDB, SpApiSnapshotDB)
+            .join(SupplierItemDB, SupplierItemDB.id == AsinCandidateDB.supplier_item_id)
+            .join(
+                score_rank,
+                and_(score_rank.c.candidate_id == AsinCandidateDB.id, score_rank.c.rn == 1),
+            )
+            .join(ScoreHistoryDB, ScoreHistoryDB.id == score_rank.c.id)
+            .outerjoin(
+                keepa_rank,
+                and_(keepa_rank.c.candidate_id == AsinCandidateDB.id, keepa_rank.c.rn == 1),
+            )
+            .outerjoin(KeepaSnapshotDB, KeepaSnapshotDB.id == keepa_rank.c.id)
+            .outerjoin(
+                spapi_rank,
+                and_(spapi_rank.c.candidate_id == AsinCandidateDB.id, spapi_rank.c.rn == 1),
+            )
+            .outerjoin(SpApiSnapshotDB, SpApiSnapshotDB.id == spapi_rank.c.id)
+            .where(AsinCandidateDB.brand == brand.value, AsinCandidateDB.is_active == True)
+            .order_by(AsinCandidateDB.part_number, desc(AsinCandidateDB.confidence_score))
+        )
+
+        with self._session_scope() as session:
+            return [
+                (
+                    self._db_to_asin_candidate(candidate),
+                    self._db_to_supplier_item(item),
+                    self._db_to_score_history(score),
+                    self._db_to_keepa_snapshot(keepa) if keepa else None,
+                    self._db_to_spapi_snapshot(spapi) if spapi else None,
+                )
+                for candidate, item, score, keepa, spapi in session.execute(query)
+            ]
+
+    def _db_to_score_history(self, db: ScoreHistoryDB) -> ScoreHistory:
+        """Convert database model to domain model."""
+        return ScoreHistory(
+            id=db.id,
+            asin_candidate_id=db.candidate_id,
+            asin=db.asin,
+            score=db.score,
+            profit_net=db.profit_net,
+            margin_net=db.margin_net,
+            sales_proxy_30d=db.sales_proxy_30d,
+            flags_json=db.flags_json,
+            calculated_at=db.calculated_at,
+        )
+
     # ==================== API Logs ====================
 
     def save_api_log(
@@ -795,7 +1239,7 @@ class Repository:
         error_message: str = "",
     ) -> None:
         """Save an API call log entry."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_log = ApiLogDB(
                 api_name=api_name,
                 endpoint=endpoint,
@@ -817,7 +1261,7 @@ class Repository:
         limit: int = 100,
     ) -> list[dict]:
         """Get API logs with optional filtering."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = select(ApiLogDB)
             if api_name:
                 query = query.where(ApiLogDB.api_name == api_name)
@@ -844,7 +1288,7 @@ class Repository:
 
     def get_token_usage_stats(self, hours: int = 24) -> dict:
         """Get token usage statistics for the past N hours."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             since = datetime.now() - timedelta(hours=hours)
             query = (
                 select(
@@ -871,7 +1315,7 @@ class Repository:
 
     def get_global_setting(self, key: str, default: Any = None) -> Any:
         """Get a global setting by key."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             db_setting = session.execute(
                 select(GlobalSettingsDB).where(GlobalSettingsDB.key == key)
             ).scalar_one_or_none()
@@ -894,7 +1338,7 @@ class Repository:
 
     def set_global_setting(self, key: str, value: Any, value_type: str = "string") -> None:
         """Set a global setting."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             str_value = str(value) if value_type != "json" else json.dumps(value)
 
             db_setting = session.execute(
@@ -913,7 +1357,7 @@ class Repository:
 
     def get_item_counts_by_brand(self) -> dict[str, int]:
         """Get count of active supplier items by brand."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = (
                 select(
                     SupplierItemDB.brand,
@@ -927,7 +1371,7 @@ class Repository:
 
     def get_candidate_counts_by_brand(self) -> dict[str, int]:
         """Get count of active candidates by brand."""
-        with session_scope() as session:
+        with self._session_scope() as session:
             query = (
                 select(
                     AsinCandidateDB.brand,
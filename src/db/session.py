@@ -17,6 +17,20 @@ from .models import Base
 
 logger = logging.getLogger(__name__)
 
+# Applied to every new SQLite connection. WAL lets the GUI read while a worker
+# writes; synchronous=NORMAL is durable across app crashes in WAL mode.
+# busy_timeout lets a second writer wait out a long batch commit instead of
+# failing with SQLITE_BUSY.
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
 # Global engine instance
 _engine: Engine | None = None
 _session_factory: sessionmaker[Session] | None = None
@@ -27,18 +41,21 @@ def get_engine() -> Engine:
     global _engine
     if _engine is None:
         db_path = get_db_path()
+        # Each thread checks out its own pooled connection. No pre-ping: a
+        # local file connection cannot go stale, and the ping would cost a
+        # SELECT on every checkout.
         _engine = create_engine(
             f"sqlite:///{db_path}",
             echo=False,
-            pool_pre_ping=True,
             connect_args={"check_same_thread": False},
         )
 
-        # Enable foreign keys for SQLite
+        # Enable foreign keys, WAL and read caching for SQLite
         @event.listens_for(_engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
             cursor.close()
 
     return _engine
@@ -4,7 +4,14 @@ from __future__ import annotations
 
 from typing import Any
 
-from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt, pyqtSignal
+from PyQt6.QtCore import (
+    QAbstractItemModel,
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QAction, QColor
 from PyQt6.QtWidgets import (
     QApplication,
@@ -115,14 +122,82 @@ class ScoreTableModel(QAbstractTableModel):
         titles: dict[str, str] | None = None,
         profit_history: dict[int, list[float]] | None = None,
     ) -> None:
-        """Update the results data."""
-        self.beginResetModel()
-        self._results = results
+        """Update the results data.
+
+        Rows are matched to the current ones by candidate, so views are only
+        told about inserted, removed, moved and changed rows instead of a full
+        reset. This keeps selection and scroll position across refreshes.
+        """
+        old_titles, old_history = self._titles, self._profit_history
         if titles:
             self._titles = titles
         if profit_history:
             self._profit_history = profit_history
-        self.endResetModel()
+
+        new_keys = [self._row_key(r) for r in results]
+        new_key_set = set(new_keys)
+        old_keys = [self._row_key(r) for r in self._results]
+        old_key_set = set(old_keys)
+        if (
+            len(new_key_set) != len(new_keys)
+            or len(old_key_set) != len(old_keys)
+            or old_key_set.isdisjoint(new_key_set)
+        ):
+            # Nothing to match up (e.g. first load); replace everything
+            self.beginResetModel()
+            self._results = list(results)
+            self.endResetModel()
+            return
+
+        # Remove rows that are gone, bottom-up so row numbers stay valid
+        for row in range(len(old_keys) - 1, -1, -1):
+            if old_keys[row] not in new_key_set:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._results[row]
+                del old_keys[row]
+                self.endRemoveRows()
+
+        # Put surviving rows into their new relative order
+        kept = set(old_keys)
+        order = [key for key in new_keys if key in kept]
+        if order != old_keys:
+            self._move_rows(old_keys, order)
+
+        # Insert new rows and refresh changed ones, top-down
+        last_column = len(self.COLUMNS) - 1
+        for row, result in enumerate(results):
+            key = new_keys[row]
+            if key not in kept:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._results.insert(row, result)
+                self.endInsertRows()
+                continue
+            old = self._results[row]
+            self._results[row] = result
+            if (
+                old is not result
+                or old_titles.get(result.asin) != self._titles.get(result.asin)
+                or old_history.get(result.asin_candidate_id)
+                != self._profit_history.get(result.asin_candidate_id)
+            ):
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+    def _move_rows(self, old_keys: list[tuple[int, str]], order: list[tuple[int, str]]) -> None:
+        """Reorder rows in place, keeping persistent indexes on their rows."""
+        hint = QAbstractItemModel.LayoutChangeHint.VerticalSortHint
+        self.layoutAboutToBeChanged.emit([], hint)
+        by_key = dict(zip(old_keys, self._results))
+        new_rows = {key: row for row, key in enumerate(order)}
+        for index in self.persistentIndexList():
+            new_row = new_rows[old_keys[index.row()]]
+            self.changePersistentIndex(index, self.index(new_row, index.column()))
+        self._results = [by_key[key] for key in order]
+        old_keys[:] = order
+        self.layoutChanged.emit([], hint)
+
+    @staticmethod
+    def _row_key(result: ScoreResult) -> tuple[int, str]:
+        return (result.asin_candidate_id, result.asin)
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return len(self._results)
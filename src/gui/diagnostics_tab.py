@@ -10,10 +10,10 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLabel,
+    QPlainTextEdit,
     QPushButton,
     QTableWidget,
     QTableWidgetItem,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -24,6 +24,8 @@ from src.db.repository import Repository
 class DiagnosticsTab(QWidget):
     """Tab widget for diagnostics and API logs."""
 
+    APP_LOG_MAX_LINES = 500
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._repo = Repository()
@@ -93,8 +95,9 @@ class DiagnosticsTab(QWidget):
         app_log_group = QGroupBox("Application Log")
         app_log_layout = QVBoxLayout(app_log_group)
 
-        self.app_log_text = QTextEdit()
+        self.app_log_text = QPlainTextEdit()
         self.app_log_text.setReadOnly(True)
+        self.app_log_text.setMaximumBlockCount(self.APP_LOG_MAX_LINES)
         self.app_log_text.setMaximumHeight(200)
         app_log_layout.addWidget(self.app_log_text)
 
@@ -176,5 +179,11 @@ class DiagnosticsTab(QWidget):
 
     def append_log(self, message: str) -> None:
         """Append a message to the application log."""
+        self.append_logs([message])
+
+    def append_logs(self, messages: list[str]) -> None:
+        """Append several messages to the application log in one write."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.app_log_text.append(f"[{timestamp}] {message}")
+        self.app_log_text.appendPlainText(
+            "\n".join(f"[{timestamp}] {message}" for message in messages)
+        )
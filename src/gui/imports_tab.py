@@ -3,32 +3,131 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal
+from operator import attrgetter
 from pathlib import Path
-
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from typing import TYPE_CHECKING, Any
+
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSignalBlocker,
+    Qt,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import QColor, QTextCharFormat
 from PyQt6.QtWidgets import (
-    QApplication,
     QCheckBox,
     QFileDialog,
     QGroupBox,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QMessageBox,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextEdit,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from src.core.csv_importer import CsvImporter, CsvValidationError
-from src.core.models import AsinCandidate, Brand, CandidateSource, SupplierItem
+from src.core.csv_importer import CsvImporter, CsvRow, CsvValidationError
+from src.core.models import AsinCandidate, Brand, CandidateSource, ImportResult, SupplierItem
 from src.db.repository import Repository
 
+if TYPE_CHECKING:
+    from src.api.spapi import SpApiClient
+
 logger = logging.getLogger(__name__)
 
+# Confidence recorded for candidates created during import
+CONFIDENCE_CSV_HINT = Decimal("0.99")
+CONFIDENCE_EAN_MATCH = Decimal("0.95")
+
+# Shown under the required headers
+_BRAND_VALUES_TEXT = ", ".join(Brand.values())
+
+# Preview columns, in the order of CsvImporter.get_required_headers()
+_PREVIEW_GETTER = attrgetter(
+    "brand",
+    "supplier",
+    "part_number",
+    "description",
+    "ean",
+    "mpn",
+    "asin",
+    "cost_ex_vat_1",
+    "cost_ex_vat_5plus",
+    "pack_qty",
+)
+
+# Preview cells are selectable but never editable
+_PREVIEW_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+# Preview column widths in characters, in the same order. Fixed widths stop
+# the view from measuring every cell on resize.
+_PREVIEW_COLUMN_CHARS = (8, 16, 12, 30, 13, 12, 10, 8, 8, 4)
+
+
+def _preview_cells(row: CsvRow) -> tuple[str, ...]:
+    """Format a parsed row's preview columns once, as display strings."""
+    return tuple(
+        val if isinstance(val, str)
+        else format(val, "f") if isinstance(val, Decimal)
+        else str(val)
+        for val in _PREVIEW_GETTER(row)
+    )
+
+
+class PreviewModel(QAbstractTableModel):
+    """Read-only table model for the CSV preview rows."""
+
+    def __init__(self, headers: tuple[str, ...], parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: list[tuple[str, ...]] = []
+
+    def set_rows(self, rows: list[tuple[str, ...]]) -> None:
+        """Replace the preview rows."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._headers)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return _PREVIEW_FLAGS
+
 
 class AsinSearchWorker(QThread):
     """Optimized background worker to search for ASINs via SP-API with batching."""
@@ -39,16 +138,23 @@ class AsinSearchWorker(QThread):
     error = pyqtSignal(str)
 
     BATCH_SIZE = 20
-    BATCH_DELAY = 1.0  # seconds between batches
+    FETCH_CHUNK = 500  # supplier items loaded per query
+    WRITE_QUEUE_SIZE = 4  # search batches buffered ahead of the DB writer
+    CONCURRENT_BATCHES = 2  # catalog search allows a burst of 2 requests
 
     def __init__(
         self,
-        items: list[SupplierItem],
+        item_ids: list[int],
+        repo: Repository | None = None,
         parent: QWidget | None = None,
     ) -> None:
         super().__init__(parent)
-        self._items = items
+        self._item_ids = item_ids
+        self._repo = repo or Repository()
         self._cancelled = False
+        # Matches counted by the DB writer once their batch has committed
+        self._total_candidates = 0
+        self._items_with_matches = 0
 
     def cancel(self) -> None:
         """Cancel the search operation."""
@@ -56,85 +162,106 @@ class AsinSearchWorker(QThread):
 
     def run(self) -> None:
         """Run optimized batch ASIN search."""
-        import time
-        from decimal import Decimal
-        from src.api.spapi import SpApiClient
+        from src.api.spapi import UK_MARKETPLACE_ID, SpApiClient
         from src.core.config import get_settings
 
         settings = get_settings()
         spapi = SpApiClient(settings)
-        repo = Repository()
-
-        total = len(self._items)
-        total_candidates = 0
-        items_with_matches = 0
-
-        # Build EAN -> items mapping
-        ean_to_items: dict[str, list[SupplierItem]] = {}
-        for item in self._items:
-            if item.asin_hint:
-                continue  # Skip items that already have ASINs
-            ean = (item.ean or "").strip()
-            if ean and len(ean) >= 8:
-                if ean not in ean_to_items:
-                    ean_to_items[ean] = []
-                ean_to_items[ean].append(item)
+        repo = self._repo.for_thread()
+
+        total = len(self._item_ids)
+
+        # Build EAN -> items mapping, loading only items that can be searched.
+        # CsvImporter strips EANs, so stored values need no normalising here.
+        ean_to_items: defaultdict[str, list[SupplierItem]] = defaultdict(list)
+        for start in range(0, total, self.FETCH_CHUNK):
+            chunk = self._item_ids[start:start + self.FETCH_CHUNK]
+            for item in repo.get_supplier_items_by_ids(chunk):
+                if item.asin_hint:
+                    continue  # Skip items that already have ASINs
+                ean = item.ean
+                if ean and len(ean) >= 8:
+                    ean_to_items[ean].append(item)
+
+        # Candidate writes run on a single writer thread so the next API call
+        # overlaps the previous batch's commit. Each batch carries the ids of
+        # the items it matches, reported once the batch is committed.
+        write_q: queue.Queue[tuple[list[tuple[str, Any]], list[int]] | None] = queue.Queue(
+            maxsize=self.WRITE_QUEUE_SIZE
+        )
+        writer = threading.Thread(
+            target=self._db_writer_loop, args=(write_q,), name="asin-db-writer", daemon=True
+        )
+        writer.start()
 
         unique_eans = list(ean_to_items.keys())
         total_batches = (len(unique_eans) + self.BATCH_SIZE - 1) // self.BATCH_SIZE
         
         self.progress.emit(0, total, f"Found {len(unique_eans)} unique EANs...")
 
-        # Process in batches
-        for batch_idx in range(0, len(unique_eans), self.BATCH_SIZE):
+        # Process in batches; later batches are already in flight meanwhile
+        for batch_idx, results, pending in self._search_batches(
+            spapi, repo, unique_eans
+        ):
             if self._cancelled:
                 break
 
-            batch_eans = unique_eans[batch_idx:batch_idx + self.BATCH_SIZE]
             current_batch = batch_idx // self.BATCH_SIZE + 1
-            
+
             self.progress.emit(
                 batch_idx, len(unique_eans),
-                f"Batch {current_batch}/{total_batches} | Found: {total_candidates}"
+                f"Batch {current_batch}/{total_batches} | Found: {self._total_candidates}"
             )
 
             try:
-                results = spapi.search_catalog_by_identifiers_batch(batch_eans, "EAN")
-                
+                fetched = pending.result()
+                results.update(fetched)
+
+                # Existing candidates for every item in this batch, in one query
+                # Results only hold EANs from this batch, all keys of ean_to_items
+                batch_item_ids = [item.id for ean in results for item in ean_to_items[ean]]
+                existing_by_item = repo.get_candidates_for_items(batch_item_ids)
+
+                updates: list[dict] = []
+                inserts: list[AsinCandidate] = []
+                primaries: list[tuple[int, str]] = []
+                seen: set[tuple[int, str]] = set()  # (item_id, asin) already queued this batch
                 for ean, api_items in results.items():
-                    for item in ean_to_items.get(ean, []):
+                    for item in ean_to_items[ean]:
+                        existing = existing_by_item.get(item.id, {})
                         for api_item in api_items:
                             asin = api_item.get("asin", "")
-                            if not asin:
-                                continue
-
-                            existing = repo.get_candidate_by_asin(item.id, asin)
-                            if existing:
+                            if not asin or asin in existing or (item.id, asin) in seen:
                                 continue
 
                             # Extract title/brand
-                            summaries = api_item.get("summaries", [])
-                            title, amazon_brand = "", ""
-                            for s in summaries:
-                                if s.get("marketplaceId") == "A1F83G8C2ARO7P":
-                                    title = s.get("itemName", "")
-                                    amazon_brand = s.get("brand", "")
-                                    break
+                            summary = next(
+                                (
+                                    s for s in api_item.get("summaries", ())
+                                    if s.get("marketplaceId") == UK_MARKETPLACE_ID
+                                ),
+                                None,
+                            )
+                            if summary:
+                                title = summary.get("itemName", "")
+                                amazon_brand = summary.get("brand", "")
+                            else:
+                                title, amazon_brand = "", ""
 
                             # Update existing empty or create new
-                            empty = repo.get_empty_candidate(item.id)
+                            empty = existing.get("")
                             if empty and empty.id:
-                                repo.update_candidate_asin(
-                                    candidate_id=empty.id,
-                                    asin=asin,
-                                    title=title,
-                                    amazon_brand=amazon_brand,
-                                    confidence_score=Decimal("0.95"),
-                                    source=CandidateSource.SPAPI_EAN.value,
-                                    match_reason=f"EAN match: {ean}",
-                                )
+                                updates.append({
+                                    "candidate_id": empty.id,
+                                    "asin": asin,
+                                    "title": title,
+                                    "amazon_brand": amazon_brand,
+                                    "confidence_score": CONFIDENCE_EAN_MATCH,
+                                    "source": CandidateSource.SPAPI_EAN.value,
+                                    "match_reason": f"EAN match: {ean}",
+                                })
                             else:
-                                candidate = AsinCandidate(
+                                inserts.append(AsinCandidate(
                                     supplier_item_id=item.id,
                                     brand=item.brand,
                                     supplier=item.supplier,
@@ -143,25 +270,189 @@ class AsinSearchWorker(QThread):
                                     title=title,
                                     amazon_brand=amazon_brand,
                                     match_reason=f"EAN match: {ean}",
-                                    confidence_score=Decimal("0.95"),
+                                    confidence_score=CONFIDENCE_EAN_MATCH,
                                     source=CandidateSource.SPAPI_EAN,
                                     is_active=True,
                                     is_primary=True,
-                                )
-                                repo.save_asin_candidate(candidate)
+                                ))
 
-                            total_candidates += 1
-                            items_with_matches += 1
-                            self.item_found.emit(item.id, 1)
-                            repo.clear_other_primaries(item.id, asin)
+                            primaries.append((item.id, asin))
+                            seen.add((item.id, asin))
                             break  # One ASIN per item
 
-                time.sleep(self.BATCH_DELAY)
+                # Blocks only if the writer has fallen WRITE_QUEUE_SIZE batches behind
+                write_q.put(([
+                    # Failed requests also come back empty, so only matches are cached
+                    ("cache", {ean: items for ean, items in fetched.items() if items}),
+                    *(("update", params) for params in updates),
+                    ("insert", inserts),
+                    ("clear_primaries", primaries),
+                ], [item_id for item_id, _ in primaries]))
 
             except Exception as e:
-                logger.warning(f"Batch search failed: {e}")
+                logger.warning("Batch search failed: %s", e)
+
+        write_q.put(None)
+        writer.join()
+        self.finished_signal.emit(self._items_with_matches, self._total_candidates)
+
+    def _search_batches(
+        self, spapi: SpApiClient, repo: Repository, eans: list[str]
+    ) -> Iterator[tuple[int, dict[str, list[dict]], Future[dict[str, list[dict]]]]]:
+        """Yield (offset, cached_results, pending_fetch) in batch order.
+
+        Up to CONCURRENT_BATCHES SP-API requests run ahead of the caller. Only
+        EANs missing from the catalog cache are requested.
+        """
+        def fetch(uncached: list[str]) -> dict[str, list[dict]]:
+            # SpApiClient paces these calls with its catalog rate limiter
+            if not uncached:
+                return {}
+            return spapi.search_catalog_by_identifiers_batch(uncached, "EAN")
+
+        with ThreadPoolExecutor(
+            max_workers=self.CONCURRENT_BATCHES, thread_name_prefix="spapi-search"
+        ) as pool:
+            in_flight: deque[tuple[int, dict[str, list[dict]], Future]] = deque()
+            for batch_idx in range(0, len(eans), self.BATCH_SIZE):
+                if self._cancelled:
+                    break
+                batch_eans = eans[batch_idx:batch_idx + self.BATCH_SIZE]
+                cached = repo.get_cached_catalog_items(batch_eans)
+                uncached = [ean for ean in batch_eans if ean not in cached]
+                in_flight.append((batch_idx, cached, pool.submit(fetch, uncached)))
+                if len(in_flight) >= self.CONCURRENT_BATCHES:
+                    yield in_flight.popleft()
+            while in_flight:
+                yield in_flight.popleft()
+
+    def _db_writer_loop(
+        self, write_q: queue.Queue[tuple[list[tuple[str, Any]], list[int]] | None]
+    ) -> None:
+        """Apply queued candidate writes, one transaction per search batch.
+
+        A batch's matches are counted and reported only after it commits.
+        """
+        repo = self._repo.for_thread()
+        while True:
+            batch = write_q.get()
+            if batch is None:
+                break
+            ops, found = batch
+            try:
+                with repo.transaction():
+                    for op, params in ops:
+                        if op == "update":
+                            repo.update_candidate_asin(**params)
+                        elif op == "insert":
+                            repo.save_asin_candidates_upsert(params)
+                        elif op == "clear_primaries":
+                            repo.clear_other_primaries_batch(params)
+                        elif op == "cache":
+                            repo.cache_catalog_items(params)
+            except Exception as e:
+                logger.warning("Candidate write failed: %s", e)
+                continue
+
+            self._total_candidates += len(found)
+            self._items_with_matches += len(found)
+            for item_id in found:
+                self.item_found.emit(item_id, 1)
+
+
+class ImportWorker(QThread):
+    """Background worker that parses a supplier CSV and saves the new items."""
+
+    progress = pyqtSignal(int)  # percent complete
+    # result, items saved, duplicates skipped, CSV-hint candidates, ids needing ASIN search
+    finished_signal = pyqtSignal(object, int, int, int, list)
+    failed = pyqtSignal(str)  # nothing importable; message for the user
+    error = pyqtSignal(str)
+
+    def __init__(
+        self,
+        file_path: str,
+        importer: CsvImporter,
+        repo: Repository | None = None,
+        parent: QWidget | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.file_path = file_path
+        self._importer = importer
+        self._repo = repo or Repository()
+
+    def run(self) -> None:
+        """Parse the file, skip known part numbers and save the rest."""
+        try:
+            items, result = self._importer.import_file(self.file_path)
+
+            if not items:
+                msg = "No valid items to import."
+                if result.errors:
+                    msg += "\n\nErrors:\n" + "\n".join(result.errors)
+                self.failed.emit(msg)
+                return
+
+            self.progress.emit(30)
+            repo = self._repo.for_thread()
+
+            # Check for duplicates (incremental import)
+            new_items = []
+            duplicates_skipped = 0
+
+            # Look up only the (brand, part_number) pairs present in this CSV
+            existing_pairs = repo.get_existing_pairs(
+                [(item.brand.value, item.part_number) for item in items]
+            )
+
+            # Pairs already accepted from this file, so a part number repeated
+            # within the CSV is only saved once
+            seen_csv_pairs: set[tuple[str, str]] = set()
+
+            for item in items:
+                key = (item.brand.value, item.part_number)
+                if key in existing_pairs or key in seen_csv_pairs:
+                    duplicates_skipped += 1
+                    continue
+                seen_csv_pairs.add(key)
+                new_items.append(item)
+
+            saved_items = repo.save_supplier_items_batch(new_items) if new_items else []
+            self.progress.emit(70)
+
+            # Create ASIN candidates from CSV hints
+            hint_candidates = []
+            items_without_asin = []
+            source = CandidateSource.MANUAL_CSV
+            for item in saved_items:
+                if item.asin_hint and item.id:
+                    hint_candidates.append(AsinCandidate(
+                        supplier_item_id=item.id,
+                        brand=item.brand,
+                        supplier=item.supplier,
+                        part_number=item.part_number,
+                        asin=item.asin_hint,
+                        match_reason="Provided in CSV",
+                        confidence_score=CONFIDENCE_CSV_HINT,
+                        source=source,
+                        is_active=True,
+                        is_primary=True,
+                    ))
+                else:
+                    # Track items that need ASIN search
+                    items_without_asin.append(item.id)
+
+            # Existing mappings are skipped by the database's unique index
+            inserted_ids = repo.save_asin_candidates_upsert(hint_candidates)
+            candidates_from_csv = sum(1 for new_id in inserted_ids if new_id is not None)
+
+            self.finished_signal.emit(
+                result, len(saved_items), duplicates_skipped, candidates_from_csv, items_without_asin
+            )
 
-        self.finished_signal.emit(items_with_matches, total_candidates)
+        except Exception as e:
+            logger.exception("Import failed")
+            self.error.emit(str(e))
 
 
 class ImportsTab(QWidget):
@@ -169,14 +460,28 @@ class ImportsTab(QWidget):
 
     import_completed = pyqtSignal(str)  # Signal emitted with batch_id after import
 
+    PREVIEW_ROWS = 10
+    PROGRESS_INTERVAL_MS = 100
+    VALIDATION_MAX_LINES = 100
+    HISTORY_MAX_LINES = 500
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._repo = Repository()
         self._importer = CsvImporter()
+        self._required_headers = tuple(self._importer.get_required_headers())
+        self._headers_csv = ", ".join(self._required_headers)
         self._current_file: str | None = None
         self._search_worker: AsinSearchWorker | None = None
+        self._import_worker: ImportWorker | None = None
         self._build_ui()
 
+        # Worker progress is applied at most every PROGRESS_INTERVAL_MS
+        self._pending_progress: tuple[int, int, str] | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(self.PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_search_progress)
+
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
 
@@ -196,10 +501,9 @@ class ImportsTab(QWidget):
         # Required headers info
         headers_group = QGroupBox("Required CSV Headers")
         headers_layout = QVBoxLayout(headers_group)
-        headers_text = ", ".join(self._importer.get_required_headers())
-        headers_layout.addWidget(QLabel(headers_text))
+        headers_layout.addWidget(QLabel(self._headers_csv))
         headers_layout.addWidget(QLabel(
-            "Brand must be one of: " + ", ".join(Brand.values())
+            "Brand must be one of: " + _BRAND_VALUES_TEXT
         ))
         layout.addWidget(headers_group)
 
@@ -207,9 +511,20 @@ class ImportsTab(QWidget):
         preview_group = QGroupBox("Preview (First 10 Rows)")
         preview_layout = QVBoxLayout(preview_group)
 
-        self.preview_table = QTableWidget()
+        self._preview_model = PreviewModel(self._required_headers, self)
+        self.preview_table = QTableView()
+        self.preview_table.setModel(self._preview_model)
         self.preview_table.setAlternatingRowColors(True)
-        self.preview_table.horizontalHeader().setStretchLastSection(True)
+        header = self.preview_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        header.setStretchLastSection(True)
+        metrics = self.preview_table.fontMetrics()
+        char_width = metrics.horizontalAdvance("0")
+        for i, (title, chars) in enumerate(
+            zip(self._required_headers, _PREVIEW_COLUMN_CHARS)
+        ):
+            width = max(metrics.horizontalAdvance(title), char_width * chars)
+            self.preview_table.setColumnWidth(i, int(width * 1.2))
         preview_layout.addWidget(self.preview_table)
 
         layout.addWidget(preview_group)
@@ -218,8 +533,9 @@ class ImportsTab(QWidget):
         validation_group = QGroupBox("Validation")
         validation_layout = QVBoxLayout(validation_group)
 
-        self.validation_text = QTextEdit()
+        self.validation_text = QPlainTextEdit()
         self.validation_text.setReadOnly(True)
+        self.validation_text.setMaximumBlockCount(self.VALIDATION_MAX_LINES)
         self.validation_text.setMaximumHeight(120)
         validation_layout.addWidget(self.validation_text)
 
@@ -257,8 +573,9 @@ class ImportsTab(QWidget):
         history_group = QGroupBox("Import Log")
         history_layout = QVBoxLayout(history_group)
 
-        self.history_text = QTextEdit()
+        self.history_text = QPlainTextEdit()
         self.history_text.setReadOnly(True)
+        self.history_text.setMaximumBlockCount(self.HISTORY_MAX_LINES)
         self.history_text.setMaximumHeight(150)
         history_layout.addWidget(self.history_text)
 
@@ -280,219 +597,204 @@ class ImportsTab(QWidget):
         self.file_label.setText(Path(file_path).name)
         self._preview_file(file_path)
 
+    def _append_validation(self, color: Qt.GlobalColor, text: str) -> None:
+        """Append colored text to the validation log without emitting signals."""
+        fmt = QTextCharFormat()
+        fmt.setForeground(QColor(color))
+        with QSignalBlocker(self.validation_text):
+            self.validation_text.setCurrentCharFormat(fmt)
+            self.validation_text.appendPlainText(text)
+
     def _preview_file(self, file_path: str) -> None:
         """Preview the CSV file contents."""
         self.validation_text.clear()
-        self.preview_table.clear()
 
+        # preview() stops reading after PREVIEW_ROWS rows, so this stays fast for large files
         try:
-            rows, errors = self._importer.preview(file_path, max_rows=10)
+            rows, errors = self._importer.preview(file_path, max_rows=self.PREVIEW_ROWS)
         except CsvValidationError as e:
-            self.validation_text.setTextColor(Qt.GlobalColor.red)
-            self.validation_text.setText(str(e))
+            message = str(e)
             if e.missing_headers:
-                self.validation_text.append(
-                    f"\nRequired headers: {', '.join(self._importer.get_required_headers())}"
-                )
+                message += f"\n\nRequired headers: {self._headers_csv}"
+            self._append_validation(Qt.GlobalColor.red, message)
+            self._clear_preview()
             self.import_btn.setEnabled(False)
             return
         except FileNotFoundError as e:
-            self.validation_text.setTextColor(Qt.GlobalColor.red)
-            self.validation_text.setText(str(e))
+            self._append_validation(Qt.GlobalColor.red, str(e))
+            self._clear_preview()
             self.import_btn.setEnabled(False)
             return
 
         # Show errors
         if errors:
-            self.validation_text.setTextColor(Qt.GlobalColor.red)
-            for err in errors:
-                self.validation_text.append(err)
+            self._append_validation(Qt.GlobalColor.red, "\n".join(errors))
             self.import_btn.setEnabled(False)
         else:
-            self.validation_text.setTextColor(Qt.GlobalColor.darkGreen)
-            self.validation_text.setText(f"Validation passed. {len(rows)} preview rows loaded.")
+            self._append_validation(
+                Qt.GlobalColor.darkGreen, f"Validation passed. {len(rows)} preview rows loaded."
+            )
             self.import_btn.setEnabled(True)
 
-        # Show warnings
-        for row in rows:
+        # Collect preview cells and warnings in one pass
+        preview_rows = []
+        warnings = []
+        for row in rows[: self.PREVIEW_ROWS]:
+            preview_rows.append(_preview_cells(row))
             if row.warnings:
-                self.validation_text.setTextColor(Qt.GlobalColor.darkYellow)
-                for warn in row.warnings:
-                    self.validation_text.append(f"Warning: {warn}")
-
-        # Populate preview table
-        if rows:
-            headers = self._importer.get_required_headers()
-            self.preview_table.setColumnCount(len(headers))
-            self.preview_table.setHorizontalHeaderLabels(headers)
-            self.preview_table.setRowCount(len(rows))
-
-            for i, row in enumerate(rows):
-                values = [
-                    row.brand,
-                    row.supplier,
-                    row.part_number,
-                    row.description,
-                    row.ean,
-                    row.mpn,
-                    row.asin,
-                    str(row.cost_ex_vat_1),
-                    str(row.cost_ex_vat_5plus),
-                    str(row.pack_qty),
-                ]
-                for j, val in enumerate(values):
-                    item = QTableWidgetItem(val)
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.preview_table.setItem(i, j, item)
+                warnings.extend(f"Warning: {warn}" for warn in row.warnings)
+
+        # Show warnings
+        if warnings:
+            self._append_validation(Qt.GlobalColor.darkYellow, "\n".join(warnings))
+
+        # Replace the previous preview with a single model reset
+        self._preview_model.set_rows(preview_rows)
+
+    def _clear_preview(self) -> None:
+        """Remove all preview rows."""
+        self._preview_model.set_rows([])
 
     def _on_import(self) -> None:
-        """Execute the import."""
+        """Start importing the selected file on a worker thread."""
         if not self._current_file:
             return
 
+        # Busy indicator until the worker reports back
         self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setMaximum(100)
+        self.progress_bar.setRange(0, 0)
         self.import_btn.setEnabled(False)
 
-        try:
-            items, result = self._importer.import_file(self._current_file)
-
-            self.progress_bar.setValue(30)
-
-            if not items:
-                msg = "No valid items to import."
-                if result.errors:
-                    msg += "\n\nErrors:\n" + "\n".join(result.errors)
-                QMessageBox.warning(self, "Import Failed", msg)
-                self.progress_bar.setVisible(False)
-                self.import_btn.setEnabled(True)
-                return
-
-            # Check for duplicates (incremental import)
-            new_items = []
-            duplicates_skipped = 0
-            
-            # Get existing part numbers by brand
-            existing_by_brand: dict[str, set[str]] = {}
-            for item in items:
-                brand_key = item.brand.value
-                if brand_key not in existing_by_brand:
-                    existing_by_brand[brand_key] = self._repo.get_existing_part_numbers(brand_key)
-            
-            for item in items:
-                brand_key = item.brand.value
-                if item.part_number in existing_by_brand[brand_key]:
-                    duplicates_skipped += 1
-                else:
-                    new_items.append(item)
-                    existing_by_brand[brand_key].add(item.part_number)  # Track newly added
-            
-            if duplicates_skipped > 0:
-                self.history_text.append(f"  Skipped {duplicates_skipped} duplicate part numbers\n")
+        self._import_worker = ImportWorker(self._current_file, self._importer, self._repo, self)
+        self._import_worker.progress.connect(self._on_import_progress)
+        self._import_worker.finished_signal.connect(self._on_import_finished)
+        self._import_worker.failed.connect(self._on_import_failed)
+        self._import_worker.error.connect(self._on_import_error)
+        self._import_worker.start()
+
+    @pyqtSlot(int)
+    def _on_import_progress(self, percent: int) -> None:
+        """Switch the progress bar from busy to the worker's percentage."""
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+
+    @pyqtSlot(object, int, int, int, list)
+    def _on_import_finished(
+        self,
+        result: ImportResult,
+        saved_count: int,
+        duplicates_skipped: int,
+        candidates_from_csv: int,
+        search_item_ids: list[int],
+    ) -> None:
+        """Report a completed import and start the ASIN search if enabled."""
+        file_name = Path(self._import_worker.file_path).name if self._import_worker else ""
+        self._import_worker = None
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(100)
+
+        if duplicates_skipped > 0:
+            self.history_text.appendPlainText(f"  Skipped {duplicates_skipped} duplicate part numbers\n")
+
+        # Log the import
+        parts = [
+            f"Import completed: {result.batch_id}",
+            f"  File: {file_name}",
+            f"  Items in CSV: {result.items_imported}",
+            f"  New items saved: {saved_count}",
+            f"  Duplicates skipped: {duplicates_skipped}",
+            f"  Invalid rows: {result.items_skipped}",
+            f"  ASIN candidates from CSV: {candidates_from_csv}",
+            f"  Items needing ASIN search: {len(search_item_ids)}",
+        ]
+        if result.warnings:
+            parts.append(f"  Warnings: {len(result.warnings)}")
+        log_msg = "\n".join(parts) + "\n"
+
+        self.history_text.appendPlainText(log_msg)
+        logger.info(log_msg)
 
-            # Save to database
-            saved_items = self._repo.save_supplier_items_batch(new_items) if new_items else []
-            self.progress_bar.setValue(60)
+        # Emit import completed signal
+        self.import_completed.emit(result.batch_id)
 
-            # Create ASIN candidates from CSV hints
-            candidates_from_csv = 0
-            items_without_asin = []
-            for item in saved_items:
-                if item.asin_hint and item.id:
-                    # Check for existing candidate
-                    existing = self._repo.get_candidate_by_asin(item.id, item.asin_hint)
-                    if not existing:
-                        candidate = AsinCandidate(
-                            supplier_item_id=item.id,
-                            brand=item.brand,
-                            supplier=item.supplier,
-                            part_number=item.part_number,
-                            asin=item.asin_hint,
-                            match_reason="Provided in CSV",
-                            confidence_score=__import__("decimal").Decimal("0.99"),
-                            source=CandidateSource.MANUAL_CSV,
-                            is_active=True,
-                            is_primary=True,
-                        )
-                        self._repo.save_asin_candidate(candidate)
-                        candidates_from_csv += 1
-                else:
-                    # Track items that need ASIN search
-                    items_without_asin.append(item)
-
-            self.progress_bar.setValue(100)
-
-            # Log the import
-            log_msg = (
-                f"Import completed: {result.batch_id}\n"
-                f"  File: {Path(self._current_file).name}\n"
-                f"  Items in CSV: {result.items_imported}\n"
-                f"  New items saved: {len(saved_items)}\n"
-                f"  Duplicates skipped: {duplicates_skipped}\n"
-                f"  Invalid rows: {result.items_skipped}\n"
-                f"  ASIN candidates from CSV: {candidates_from_csv}\n"
-                f"  Items needing ASIN search: {len(items_without_asin)}\n"
+        # Auto-search for ASINs if enabled and there are items without ASINs
+        if self.auto_search_checkbox.isChecked() and search_item_ids:
+            self.history_text.appendPlainText(
+                f"\nStarting auto-ASIN search for {len(search_item_ids)} items...\n"
+            )
+            self._start_asin_search(search_item_ids)
+        else:
+            QMessageBox.information(
+                self,
+                "Import Complete",
+                f"Successfully imported {result.items_imported} items.\n"
+                f"Created {candidates_from_csv} ASIN candidate mappings from CSV.",
             )
-
-            if result.warnings:
-                log_msg += f"  Warnings: {len(result.warnings)}\n"
-
-            self.history_text.append(log_msg)
-            logger.info(log_msg)
-
-            # Emit import completed signal
-            self.import_completed.emit(result.batch_id)
-
-            # Auto-search for ASINs if enabled and there are items without ASINs
-            if self.auto_search_checkbox.isChecked() and items_without_asin:
-                self.history_text.append(
-                    f"\nStarting auto-ASIN search for {len(items_without_asin)} items...\n"
-                )
-                self._start_asin_search(items_without_asin)
-            else:
-                QMessageBox.information(
-                    self,
-                    "Import Complete",
-                    f"Successfully imported {result.items_imported} items.\n"
-                    f"Created {candidates_from_csv} ASIN candidate mappings from CSV.",
-                )
-                self.progress_bar.setVisible(False)
-                self.import_btn.setEnabled(True)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Import Error", f"Import failed: {e}")
-            logger.exception("Import failed")
             self.progress_bar.setVisible(False)
             self.import_btn.setEnabled(True)
 
-    def _start_asin_search(self, items: list[SupplierItem]) -> None:
+    @pyqtSlot(str)
+    def _on_import_failed(self, message: str) -> None:
+        """Handle a file that contained nothing to import."""
+        self._import_worker = None
+        self.progress_bar.setRange(0, 100)
+        QMessageBox.warning(self, "Import Failed", message)
+        self.progress_bar.setVisible(False)
+        self.import_btn.setEnabled(True)
+
+    @pyqtSlot(str)
+    def _on_import_error(self, error_msg: str) -> None:
+        """Handle an unexpected import error."""
+        self._import_worker = None
+        self.progress_bar.setRange(0, 100)
+        QMessageBox.critical(self, "Import Error", f"Import failed: {error_msg}")
+        self.progress_bar.setVisible(False)
+        self.import_btn.setEnabled(True)
+
+    def _start_asin_search(self, item_ids: list[int]) -> None:
         """Start the background ASIN search."""
         self.progress_bar.setValue(0)
-        self.progress_bar.setMaximum(len(items))
+        self.progress_bar.setMaximum(len(item_ids))
         self.progress_label.setVisible(True)
         self.progress_label.setText("Starting ASIN search...")
         self.cancel_btn.setVisible(True)
 
-        self._search_worker = AsinSearchWorker(items, self)
+        self._search_worker = AsinSearchWorker(item_ids, self._repo, self)
         self._search_worker.progress.connect(self._on_search_progress)
         self._search_worker.item_found.connect(self._on_item_found)
         self._search_worker.finished_signal.connect(self._on_search_finished)
         self._search_worker.error.connect(self._on_search_error)
+        self._progress_timer.start()
         self._search_worker.start()
 
+    @pyqtSlot(int, int, str)
     def _on_search_progress(self, current: int, total: int, message: str) -> None:
-        """Handle search progress updates."""
+        """Record search progress; the progress timer applies the latest value."""
+        self._pending_progress = (current, total, message)
+
+    def _flush_search_progress(self) -> None:
+        """Show the most recent search progress, if it changed."""
+        if self._pending_progress is None:
+            return
+        current, total, message = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.setValue(current)
         self.progress_label.setText(f"{current}/{total}: {message}")
-        QApplication.processEvents()
 
+    def _stop_search_progress(self) -> None:
+        """Stop applying progress once the search is over."""
+        self._progress_timer.stop()
+        self._pending_progress = None
+
+    @pyqtSlot(int, int)
     def _on_item_found(self, supplier_item_id: int, candidates_found: int) -> None:
         """Handle when ASINs are found for an item."""
-        self.history_text.append(f"  Found {candidates_found} ASINs for item #{supplier_item_id}")
+        self.history_text.appendPlainText(f"  Found {candidates_found} ASINs for item #{supplier_item_id}")
 
+    @pyqtSlot(int, int)
     def _on_search_finished(self, items_with_matches: int, total_candidates: int) -> None:
         """Handle search completion."""
+        self._stop_search_progress()
         self.progress_bar.setVisible(False)
         self.progress_label.setVisible(False)
         self.cancel_btn.setVisible(False)
@@ -503,7 +805,7 @@ class ImportsTab(QWidget):
             f"  Items with matches: {items_with_matches}\n"
             f"  Total ASIN candidates found: {total_candidates}\n"
         )
-        self.history_text.append(log_msg)
+        self.history_text.appendPlainText(log_msg)
         logger.info(log_msg)
 
         QMessageBox.information(
@@ -516,14 +818,15 @@ class ImportsTab(QWidget):
 
     def _on_search_error(self, error_msg: str) -> None:
         """Handle search error."""
-        self.history_text.append(f"  Error: {error_msg}")
-        logger.error(f"ASIN search error: {error_msg}")
+        self.history_text.appendPlainText(f"  Error: {error_msg}")
+        logger.error("ASIN search error: %s", error_msg)
 
     def _on_cancel_search(self) -> None:
         """Cancel the running ASIN search."""
         if self._search_worker:
             self._search_worker.cancel()
-            self.history_text.append("\nASIN search cancelled by user.\n")
+            self._stop_search_progress()
+            self.history_text.appendPlainText("\nASIN search cancelled by user.\n")
             self.progress_bar.setVisible(False)
             self.progress_label.setVisible(False)
             self.cancel_btn.setVisible(False)
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from functools import partial
 
-from PyQt6.QtGui import QKeySequence, QShortcut
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QKeySequence
 from PyQt6.QtWidgets import (
     QApplication,
     QHBoxLayout,
@@ -23,6 +26,7 @@ from PyQt6.QtWidgets import (
 from src.core.config import Settings, get_settings
 from src.core.models import Alert, Brand, ScoreResult
 from src.core.scheduler import RefreshController
+from src.core.scoring import ScoringEngine
 from src.core.sounds import SoundEffect, get_sound_player
 from src.core.updater import UpdateInfo, Updater, get_current_version
 from src.db.repository import Repository
@@ -39,16 +43,180 @@ from .widgets import TokenStatusWidget
 
 logger = logging.getLogger(__name__)
 
+# Brands in tab order, built once for the refresh paths
+_ALL_BRANDS: tuple[Brand, ...] = tuple(Brand)
+
+# Scored rows of one brand: candidate_id -> (scoring inputs key, result)
+ScoreCache = dict[int, tuple[tuple, ScoreResult]]
+
+# Sparkline profits of one brand: candidate_id -> (latest score id, profits)
+HistoryCache = dict[int, tuple[int, list[float]]]
+
+# Sparklines show the newest records of each candidate
+SPARKLINE_POINTS = 20
+
+
+class BrandRefreshSignals(QObject):
+    """Signals for BrandRefreshWorker."""
+
+    # brand, generation, results, titles, profit history, score cache, history cache
+    finished = pyqtSignal(object, int, list, dict, dict, dict, dict)
+    failed = pyqtSignal(object, int, str)
+    # brand; emitted after finished or failed, whatever happened in the worker
+    done = pyqtSignal(object)
+
+
+class BrandRefreshWorker(QRunnable):
+    """Load and score the candidates of one brand off the GUI thread."""
+
+    def __init__(
+        self,
+        brand: Brand,
+        generation: int,
+        repo: Repository,
+        engine: ScoringEngine,
+        cache: ScoreCache,
+        history_cache: HistoryCache,
+        signals: BrandRefreshSignals,
+    ) -> None:
+        super().__init__()
+        self._brand = brand
+        self._generation = generation
+        self._repo = repo
+        self._engine = engine
+        self._cache = cache
+        self._history_cache = history_cache
+        self.signals = signals
+
+    def run(self) -> None:
+        """Refresh the brand; done is emitted even if the refresh itself breaks."""
+        try:
+            self._refresh()
+        finally:
+            self.signals.done.emit(self._brand)
+
+    def _refresh(self) -> None:
+        """Build the brand's results and emit them with the new caches."""
+        try:
+            repo = self._repo.for_thread()
+
+            # Get all scored active candidates with their latest data in one query
+            bundle = repo.get_latest_brand_bundle(self._brand)
+
+            # A sparkline only changes when its candidate gets a new score
+            stale = [
+                candidate.id
+                for candidate, _, latest, _, _ in bundle
+                if self._history_cache.get(candidate.id, (None,))[0] != latest.id
+            ]
+            if len(stale) * 2 > len(bundle):
+                history = repo.get_brand_profit_history(self._brand, limit=SPARKLINE_POINTS)
+            elif stale:
+                history = repo.get_profit_history_for_candidates(stale, limit=SPARKLINE_POINTS)
+            else:
+                history = {}
+
+            results: list[ScoreResult] = []
+            titles: dict[str, str] = {}
+            # candidate_id -> list of profits, oldest first
+            profit_history: dict[int, list[float]] = {}
+            # Rebuilt each refresh so inactive candidates drop out
+            cache: ScoreCache = {}
+            history_cache: HistoryCache = {}
+
+            for candidate, item, latest, keepa, spapi in bundle:
+                profits = history.get(candidate.id)
+                if profits is None:
+                    # The history is a separate query; a candidate that left the
+                    # brand in between may have neither a row nor a cache entry
+                    profits = self._history_cache.get(candidate.id, (None, []))[1]
+                history_cache[candidate.id] = (latest.id, profits)
+                profit_history[candidate.id] = profits
+
+                # Reuse the last result while none of the engine's inputs changed;
+                # settings changes clear the cache instead of being part of the key
+                key = (
+                    item.id,
+                    item.updated_at,
+                    candidate.updated_at,
+                    getattr(keepa, "id", None),
+                    getattr(spapi, "id", None),
+                )
+                cached = self._cache.get(candidate.id)
+                if cached and cached[0] == key:
+                    result = cached[1]
+                else:
+                    # Recompute score with latest data
+                    result = self._engine.calculate(item, candidate, keepa, spapi)
+                cache[candidate.id] = (key, result)
+                results.append(result)
+
+                if candidate.title:
+                    titles[candidate.asin] = candidate.title
+        except Exception as e:
+            logger.exception(f"Refresh of {self._brand.value} failed")
+            self.signals.failed.emit(self._brand, self._generation, str(e))
+            return
+
+        self.signals.finished.emit(
+            self._brand, self._generation, results, titles, profit_history, cache, history_cache
+        )
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    REFRESH_DEBOUNCE_MS = 250
+    LOG_FLUSH_MS = 100
+    ALERT_NOTIFY_INTERVAL_MS = 5000
+
     def __init__(self, settings: Settings | None = None) -> None:
         super().__init__()
         self._settings = settings or get_settings()
         self._repo = Repository()
+        self._scoring_engine = ScoringEngine(self._settings)
         self._refresh_controller: RefreshController | None = None
         self._web_server: WebServer | None = None
+        self._score_cache: dict[Brand, ScoreCache] = {}
+        self._history_cache: dict[Brand, HistoryCache] = {}
+
+        # Brand tabs are loaded on the thread pool; a refresh only applies
+        # if no newer one was started for its brand since. One refresh per
+        # brand runs at a time, requests meanwhile fold into one rerun.
+        self._refresh_generation: dict[Brand, int] = dict.fromkeys(_ALL_BRANDS, 0)
+        self._refreshes_running: set[Brand] = set()
+        self._refreshes_queued: set[Brand] = set()
+        # Results for brand tabs not on screen, applied when shown
+        self._held_results: dict[
+            BrandTab, tuple[list[ScoreResult], dict[str, str], dict[int, list[float]]]
+        ] = {}
+        self._brand_refresh_signals = BrandRefreshSignals(self)
+        self._brand_refresh_signals.finished.connect(self._apply_brand_refresh)
+        self._brand_refresh_signals.failed.connect(self._on_brand_refresh_failed)
+        self._brand_refresh_signals.done.connect(self._end_brand_refresh)
+
+        # Refresh signals arrive in bursts; collapse them into one repaint
+        self._pending_brands: set[Brand] = set()
+        self._pending_dashboard = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_pending_refresh)
+
+        # Worker log lines are buffered and written to the diagnostics log together
+        self._log_buffer: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_logs)
+
+        # At most one tray notification and sound per interval; alerts
+        # arriving in between are summarised in the next one
+        self._pending_alerts: list[Alert] = []
+        self._alert_notify_timer = QTimer(self)
+        self._alert_notify_timer.setSingleShot(True)
+        self._alert_notify_timer.setInterval(self.ALERT_NOTIFY_INTERVAL_MS)
+        self._alert_notify_timer.timeout.connect(self._flush_alert_notification)
 
         self.setWindowTitle("Seller Opportunity Scanner")
         self.setMinimumSize(1200, 800)
@@ -57,9 +225,9 @@ class MainWindow(QMainWindow):
         self._build_ui()
         self._setup_shortcuts()
         self._setup_tray_icon()
-        self._connect_signals()
         self._load_initial_data()
-        self._check_for_updates_on_startup()
+        # Once the event loop is running, so the window paints first
+        QTimer.singleShot(0, self._check_for_updates_on_startup)
 
     def _build_ui(self) -> None:
         """Build the main window UI."""
@@ -120,33 +288,36 @@ class MainWindow(QMainWindow):
         self.dashboard_tab = DashboardTab()
         self.tabs.addTab(self.dashboard_tab, "Dashboard")
 
+        # The other tabs are built the first time they are shown; a
+        # placeholder holds each tab's slot until then
+        self._tab_factories: dict[QWidget, Callable[[], QWidget]] = {}
+
         # Brand tabs
         self.brand_tabs: dict[str, BrandTab] = {}
-        for brand in Brand:
-            tab = BrandTab(brand)
-            tab.selection_changed.connect(self._on_brand_selection_changed)
-            self.tabs.addTab(tab, brand.value)
-            self.brand_tabs[brand.value] = tab
+        for brand in _ALL_BRANDS:
+            self._add_lazy_tab(brand.value, partial(self._create_brand_tab, brand))
 
         # Mappings tab
-        self.mappings_tab = MappingsTab()
-        self.tabs.addTab(self.mappings_tab, "Mappings")
+        self.mappings_tab: MappingsTab | None = None
+        self._add_lazy_tab("Mappings", self._create_mappings_tab)
 
         # Competitors tab
-        self.competitors_tab = CompetitorsTab()
-        self.tabs.addTab(self.competitors_tab, "Competitors")
+        self.competitors_tab: CompetitorsTab | None = None
+        self._add_lazy_tab("Competitors", self._create_competitors_tab)
 
         # Imports tab
-        self.imports_tab = ImportsTab()
-        self.tabs.addTab(self.imports_tab, "Imports")
+        self.imports_tab: ImportsTab | None = None
+        self._add_lazy_tab("Imports", self._create_imports_tab)
 
         # Settings tab
-        self.settings_tab = SettingsTab()
-        self.tabs.addTab(self.settings_tab, "Settings")
+        self.settings_tab: SettingsTab | None = None
+        self._add_lazy_tab("Settings", self._create_settings_tab)
 
         # Diagnostics tab
-        self.diagnostics_tab = DiagnosticsTab()
-        self.tabs.addTab(self.diagnostics_tab, "Diagnostics")
+        self.diagnostics_tab: DiagnosticsTab | None = None
+        self._add_lazy_tab("Diagnostics", self._create_diagnostics_tab)
+
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         main_layout.addWidget(self.tabs)
 
@@ -220,32 +391,33 @@ class MainWindow(QMainWindow):
         """Setup keyboard shortcuts."""
         # Tab navigation: Ctrl+1 through Ctrl+9
         for i in range(min(9, self.tabs.count())):
-            shortcut = QShortcut(QKeySequence(f"Ctrl+{i + 1}"), self)
-            shortcut.activated.connect(lambda idx=i: self.tabs.setCurrentIndex(idx))
+            self._add_shortcut(partial(self.tabs.setCurrentIndex, i), f"Ctrl+{i + 1}")
 
         # Refresh data: F5 or Ctrl+R
-        refresh_shortcut = QShortcut(QKeySequence("F5"), self)
-        refresh_shortcut.activated.connect(self._refresh_all)
-        refresh_shortcut2 = QShortcut(QKeySequence("Ctrl+R"), self)
-        refresh_shortcut2.activated.connect(self._refresh_all)
+        self._add_shortcut(self._refresh_all, "F5", "Ctrl+R")
 
         # Toggle refresh: Ctrl+Shift+R
-        toggle_refresh = QShortcut(QKeySequence("Ctrl+Shift+R"), self)
-        toggle_refresh.activated.connect(self.refresh_btn.click)
+        self._add_shortcut(self.refresh_btn.click, "Ctrl+Shift+R")
 
         # Export current tab: Ctrl+E
-        export_shortcut = QShortcut(QKeySequence("Ctrl+E"), self)
-        export_shortcut.activated.connect(self._export_current_tab)
+        self._add_shortcut(self._export_current_tab, "Ctrl+E")
 
         # Search focus: Ctrl+F
-        search_shortcut = QShortcut(QKeySequence("Ctrl+F"), self)
-        search_shortcut.activated.connect(self._focus_search)
+        self._add_shortcut(self._focus_search, "Ctrl+F")
+
+    def _add_shortcut(self, slot: Callable[[], object], *keys: str) -> None:
+        """Bind window-wide key sequences to a slot through one action."""
+        action = QAction(self)
+        action.setShortcuts([QKeySequence(key) for key in keys])
+        action.triggered.connect(lambda _checked=False: slot())
+        self.addAction(action)
 
     def _refresh_all(self) -> None:
         """Refresh all data."""
-        for brand in Brand:
+        for brand in _ALL_BRANDS:
             self._refresh_brand_tab(brand)
-        self.mappings_tab.refresh_data()
+        if self.mappings_tab:
+            self.mappings_tab.refresh_data()
         self.dashboard_tab.refresh_data()
         self.status_bar.showMessage("Data refreshed", 3000)
 
@@ -267,69 +439,141 @@ class MainWindow(QMainWindow):
                 tab.filter_input.selectAll()
                 return
 
-    def _connect_signals(self) -> None:
-        """Connect signals between components."""
-        # Import completed -> refresh mappings and data
-        self.imports_tab.import_completed.connect(self._on_import_completed)
+    def _load_initial_data(self) -> None:
+        """Load the dashboard; the other tabs load when first shown."""
+        self.dashboard_tab.refresh_data()
+
+    def _add_lazy_tab(self, title: str, factory: Callable[[], QWidget]) -> None:
+        """Add a placeholder tab that is replaced by factory() when first shown."""
+        placeholder = QWidget()
+        self.tabs.addTab(placeholder, title)
+        self._tab_factories[placeholder] = factory
+
+    def _on_tab_changed(self, index: int) -> None:
+        """Build a deferred tab the first time it is shown, or show held results."""
+        widget = self.tabs.widget(index)
+        held = self._held_results.pop(widget, None)
+        if held:
+            widget.update_results(*held)
+        factory = self._tab_factories.pop(widget, None)
+        if factory is None:
+            return
 
+        tab = factory()
+        text = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, text)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        widget.deleteLater()
+
+    def _create_mappings_tab(self) -> MappingsTab:
+        """Create and load the mappings tab."""
+        self.mappings_tab = MappingsTab()
         # Mapping updated -> refresh brand tabs
         self.mappings_tab.mapping_updated.connect(self._on_mapping_updated)
+        self.mappings_tab.refresh_data()
+        return self.mappings_tab
+
+    def _create_competitors_tab(self) -> CompetitorsTab:
+        """Create the competitors tab."""
+        self.competitors_tab = CompetitorsTab()
+        return self.competitors_tab
+
+    def _create_imports_tab(self) -> ImportsTab:
+        """Create the imports tab."""
+        self.imports_tab = ImportsTab()
+        # Import completed -> refresh mappings and data
+        self.imports_tab.import_completed.connect(self._on_import_completed)
+        return self.imports_tab
 
+    def _create_settings_tab(self) -> SettingsTab:
+        """Create the settings tab."""
+        self.settings_tab = SettingsTab()
         # Settings changed -> reload
         self.settings_tab.settings_changed.connect(self._on_settings_changed)
+        return self.settings_tab
 
-    def _load_initial_data(self) -> None:
-        """Load initial data from database into UI."""
-        for brand in Brand:
-            self._refresh_brand_tab(brand)
-
-        self.mappings_tab.refresh_data()
+    def _create_diagnostics_tab(self) -> DiagnosticsTab:
+        """Create and load the diagnostics tab, including logs buffered so far."""
+        self.diagnostics_tab = DiagnosticsTab()
         self.diagnostics_tab.refresh_data()
-        self.dashboard_tab.refresh_data()
+        self._flush_logs()
+        return self.diagnostics_tab
+
+    def _create_brand_tab(self, brand: Brand) -> BrandTab:
+        """Create and load the tab for a brand."""
+        tab = BrandTab(brand)
+        tab.selection_changed.connect(self._on_brand_selection_changed)
+        self.brand_tabs[brand.value] = tab
+        self._refresh_brand_tab(brand)
+        return tab
 
     def _refresh_brand_tab(self, brand: Brand) -> None:
-        """Refresh data for a brand tab."""
-        tab = self.brand_tabs.get(brand.value)
-        if not tab:
+        """Start a background refresh of a brand tab."""
+        if brand.value not in self.brand_tabs:
+            return
+        if brand in self._refreshes_running:
+            self._refreshes_queued.add(brand)
             return
 
-        # Get all active candidates with latest scores
-        candidates = self._repo.get_candidates_by_brand(brand, active_only=True)
-
-        results: list[ScoreResult] = []
-        titles: dict[str, str] = {}
-        profit_history: dict[int, list[float]] = {}  # candidate_id -> list of profits
-
-        for candidate in candidates:
-            if candidate.id:
-                # Get latest score
-                latest = self._repo.get_latest_score(candidate.id)
-                if latest:
-                    # Get supplier item for this candidate
-                    item = self._repo.get_supplier_item_by_id(candidate.supplier_item_id)
-                    if item:
-                        # Get latest snapshots
-                        keepa = self._repo.get_latest_keepa_snapshot(candidate.id)
-                        spapi = self._repo.get_latest_spapi_snapshot(candidate.id)
-
-                        # Recompute score with latest data
-                        from src.core.scoring import ScoringEngine
-
-                        engine = ScoringEngine(self._settings)
-                        result = engine.calculate(item, candidate, keepa, spapi)
-                        results.append(result)
-
-                        if candidate.title:
-                            titles[candidate.asin] = candidate.title
-
-                        # Get profit history for sparkline (last 20 records)
-                        history = self._repo.get_score_history(candidate.id, limit=20)
-                        if history:
-                            # Extract profit values, oldest first
-                            profits = [float(h.profit_net) for h in reversed(history)]
-                            profit_history[candidate.id] = profits
+        self._refreshes_running.add(brand)
+        self._refresh_generation[brand] += 1
+        worker = BrandRefreshWorker(
+            brand,
+            self._refresh_generation[brand],
+            self._repo,
+            self._scoring_engine,
+            self._score_cache.get(brand, {}),
+            self._history_cache.get(brand, {}),
+            self._brand_refresh_signals,
+        )
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_brand_refresh(
+        self,
+        brand: Brand,
+        generation: int,
+        results: list[ScoreResult],
+        titles: dict[str, str],
+        profit_history: dict[int, list[float]],
+        cache: ScoreCache,
+        history_cache: HistoryCache,
+    ) -> None:
+        """Show a finished brand refresh unless it has been invalidated.
+
+        Hidden tabs hold only their newest results until they are shown.
+        """
+        if generation == self._refresh_generation[brand]:
+            self._score_cache[brand] = cache
+            self._history_cache[brand] = history_cache
+            tab = self.brand_tabs[brand.value]
+            if tab is self.tabs.currentWidget():
+                self._held_results.pop(tab, None)
+                tab.update_results(results, titles, profit_history)
+            else:
+                self._held_results[tab] = (results, titles, profit_history)
+
+    def _on_brand_refresh_failed(self, brand: Brand, generation: int, error: str) -> None:
+        """Report a failed brand refresh."""
+        if generation == self._refresh_generation[brand]:
+            self._queue_log(f"ERROR: {brand.value} refresh failed: {error}")
+
+    def _end_brand_refresh(self, brand: Brand) -> None:
+        """Start the refresh requested while the brand's last one ran, if any."""
+        self._refreshes_running.discard(brand)
+        if brand in self._refreshes_queued:
+            self._refreshes_queued.discard(brand)
+            self._refresh_brand_tab(brand)
 
-        tab.update_results(results, titles, profit_history)
+    def _invalidate_scores(self, brands: tuple[Brand, ...] = _ALL_BRANDS) -> None:
+        """Drop cached scores, including those of refreshes still running."""
+        for brand in brands:
+            self._score_cache.pop(brand, None)
+            self._refresh_generation[brand] += 1
 
     def _on_toggle_web(self, checked: bool) -> None:
         """Toggle web dashboard server."""
@@ -385,7 +629,7 @@ class MainWindow(QMainWindow):
 
         # Connect refresh signals
         self._refresh_controller.token_status_updated.connect(self._on_token_update)
-        self._refresh_controller.score_updated.connect(self._on_score_updated)
+        self._refresh_controller.scores_updated.connect(self._on_scores_updated)
         self._refresh_controller.batch_completed.connect(self._on_batch_completed)
         self._refresh_controller.error_occurred.connect(self._on_refresh_error)
         self._refresh_controller.log_message.connect(self._on_refresh_log)
@@ -408,11 +652,14 @@ class MainWindow(QMainWindow):
         """Handle token status update from refresh worker."""
         self.token_widget.update_status(tokens_left, refill_rate, refill_in)
 
-    def _on_score_updated(self, brand: str, asin: str, score: int) -> None:
-        """Handle individual score update."""
-        # Refresh the brand tab periodically (debounced)
-        # For now just track that we need refresh
-        pass
+    def _on_scores_updated(self, updates: list[tuple[str, str, int]]) -> None:
+        """Handle a batch of (brand, asin, score) updates."""
+        for brand in {brand for brand, _, _ in updates}:
+            try:
+                self._pending_brands.add(Brand(brand))
+            except ValueError:
+                continue
+        self._refresh_timer.start()
 
     def _on_batch_completed(self, pass_name: str, success: int, fail: int) -> None:
         """Handle batch completion."""
@@ -422,48 +669,94 @@ class MainWindow(QMainWindow):
         self.last_refresh_label.setText(f"Last refresh: {now}")
         self.status_bar.showMessage(f"{pass_name}: {success} ok, {fail} failed")
 
-        # Refresh all brand tabs and dashboard
-        for brand in Brand:
-            self._refresh_brand_tab(brand)
-        self.dashboard_tab.refresh_data()
+        # Refresh all brand tabs and dashboard once the burst settles
+        self._pending_brands.update(_ALL_BRANDS)
+        self._pending_dashboard = True
+        self._refresh_timer.start()
+
+    def _do_pending_refresh(self) -> None:
+        """Refresh the brand tabs and dashboard queued since the last refresh."""
+        brands = self._pending_brands
+        self._pending_brands = set()
+        for brand in _ALL_BRANDS:
+            if brand in brands:
+                self._refresh_brand_tab(brand)
+        if self._pending_dashboard:
+            self._pending_dashboard = False
+            self.dashboard_tab.refresh_data()
 
     def _on_refresh_error(self, error: str) -> None:
         """Handle refresh error."""
         self.status_bar.showMessage(f"Error: {error}")
-        self.diagnostics_tab.append_log(f"ERROR: {error}")
+        self._queue_log(f"ERROR: {error}")
 
     def _on_refresh_log(self, message: str) -> None:
         """Handle refresh log message."""
-        self.diagnostics_tab.append_log(message)
+        self._queue_log(message)
+
+    def _queue_log(self, message: str) -> None:
+        """Buffer a diagnostics log line until the next flush."""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_logs(self) -> None:
+        """Write buffered log lines to the diagnostics tab.
+
+        Until the tab is first shown, only the lines it would keep are held.
+        """
+        if self.diagnostics_tab is None:
+            del self._log_buffer[:-DiagnosticsTab.APP_LOG_MAX_LINES]
+            return
+        if self._log_buffer:
+            messages = self._log_buffer
+            self._log_buffer = []
+            self.diagnostics_tab.append_logs(messages)
 
     def _on_alert_triggered(self, alert: Alert) -> None:
         """Handle a new alert from the refresh worker."""
-        from src.core.models import AlertType
-
         self._alert_count += 1
         self.alert_label.setText(f"🔔 {self._alert_count}")
         self.alert_label.setStyleSheet("color: #dc3545; font-weight: bold;")  # Red when alerts
         self.alert_label.setToolTip(f"Latest: {alert.message}")
 
         # Log the alert
-        self.diagnostics_tab.append_log(f"ALERT: {alert.message}")
+        self._queue_log(f"ALERT: {alert.message}")
 
         # Show in status bar
         self.status_bar.showMessage(f"Alert: {alert.message}", 5000)
 
+        self._pending_alerts.append(alert)
+        if not self._alert_notify_timer.isActive():
+            self._flush_alert_notification()
+
+    def _flush_alert_notification(self) -> None:
+        """Notify about the alerts since the last notification, then wait an interval."""
+        from src.core.models import AlertType
+
+        alerts = self._pending_alerts
+        if not alerts:
+            return
+        self._pending_alerts = []
+        self._alert_notify_timer.start()
+
+        message = alerts[-1].message
+        if len(alerts) > 1:
+            message += f" (+{len(alerts) - 1} more)"
+
         # Show tray notification
         if self._tray_icon and self._settings.alerts.show_notification:
             self._tray_icon.showMessage(
                 "Seller Opportunity Scanner",
-                alert.message,
+                message,
                 QSystemTrayIcon.MessageIcon.Information,
                 5000,
             )
 
-        # Play sound based on alert type
+        # Play sound based on alert type, favouring new opportunities
         if self._settings.alerts.play_sound:
             sound_player = get_sound_player()
-            if alert.alert_type == AlertType.SCORE_THRESHOLD:
+            if any(a.alert_type == AlertType.SCORE_THRESHOLD for a in alerts):
                 sound_player.play(SoundEffect.NEW_OPPORTUNITY)
             else:
                 sound_player.play(SoundEffect.ALERT)
@@ -472,15 +765,17 @@ class MainWindow(QMainWindow):
         """Handle CSV import completion."""
         self.status_bar.showMessage(f"Import completed: {batch_id}")
 
-        # Refresh all tabs
-        for brand in Brand:
-            self._refresh_brand_tab(brand)
-        self.mappings_tab.refresh_data()
+        # Only brands with candidates in this batch can have changed
+        candidates = self._repo.get_candidates_by_batch(batch_id)
+        brands_touched = {c.brand for c in candidates}
+        for brand in _ALL_BRANDS:
+            if brand in brands_touched:
+                self._refresh_brand_tab(brand)
+        if self.mappings_tab:
+            self.mappings_tab.refresh_data()
 
         # If refresh is running, queue priority refresh for newly imported items
         if self._refresh_controller and self._refresh_controller.is_running:
-            # Get ASINs from the import batch
-            candidates = self._repo.get_candidates_by_batch(batch_id)
             asins = list({c.asin for c in candidates if c.asin})
             if asins:
                 self._refresh_controller.queue_priority_refresh(asins)
@@ -488,10 +783,13 @@ class MainWindow(QMainWindow):
                     f"Import completed: {batch_id}. Queued {len(asins)} ASINs for immediate refresh."
                 )
 
-    def _on_mapping_updated(self) -> None:
-        """Handle mapping update."""
-        for brand in Brand:
+    def _on_mapping_updated(self, brand_value: str) -> None:
+        """Handle mapping update for one brand, or all brands if empty."""
+        brands = (Brand(brand_value),) if brand_value else _ALL_BRANDS
+        self._invalidate_scores(brands)
+        for brand in brands:
             self._refresh_brand_tab(brand)
+        self.dashboard_tab.refresh_data()
 
     def _on_brand_selection_changed(self, count: int, total_profit: float, avg_score: float) -> None:
         """Handle selection change in brand tabs."""
@@ -507,6 +805,8 @@ class MainWindow(QMainWindow):
         from src.core.config import reload_settings
 
         self._settings = reload_settings()
+        self._scoring_engine = ScoringEngine(self._settings)
+        self._invalidate_scores()  # Scores depend on fee and VAT settings
         self.status_bar.showMessage("Settings updated")
 
         # Restart refresh if running
@@ -585,4 +885,7 @@ class MainWindow(QMainWindow):
         if self._web_server:
             self._web_server.stop()
 
+        # Let brand refreshes finish before their signals object goes away
+        QThreadPool.globalInstance().waitForDone()
+
         event.accept()
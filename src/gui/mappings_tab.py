@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from decimal import Decimal
 from typing import Any
 
-from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QThread, pyqtSignal
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
-    QApplication,
     QComboBox,
     QHBoxLayout,
     QLabel,
@@ -18,17 +22,72 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QSplitter,
     QTableView,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
-from src.core.models import AsinCandidate, Brand, SupplierItem
+from src.api.spapi import SpApiClient
+from src.core.config import get_settings
+from src.core.models import AsinCandidate, Brand, CandidateSource, SupplierItem
 from src.db.repository import Repository
 
 logger = logging.getLogger(__name__)
 
+# Brands in filter order, built once for the per-brand loops
+_ALL_BRANDS: tuple[Brand, ...] = tuple(Brand)
+
+# Candidate table backgrounds, built once instead of per painted cell
+_PRIMARY_BG = QColor(220, 255, 220)  # Green for primary
+_INACTIVE_BG = QColor(240, 240, 240)  # Gray for inactive
+_CONFIDENCE_BGS = (
+    (0.90, QColor(200, 255, 200)),  # Bright green
+    (0.75, QColor(230, 255, 230)),  # Light green
+    (0.50, QColor(255, 255, 200)),  # Yellow
+)
+_LOW_CONFIDENCE_BG = QColor(255, 220, 220)  # Light red
+
+# Column of the confidence score in CandidateTableModel.COLUMNS
+_CONFIDENCE_COLUMN = 2
+
+# Roles the mappings models answer; views ask for many more on every paint
+_MODEL_ROLES = frozenset({
+    Qt.ItemDataRole.DisplayRole,
+    Qt.ItemDataRole.BackgroundRole,
+    Qt.ItemDataRole.UserRole,
+})
+
+
+def _candidate_cells(c: AsinCandidate) -> tuple[str, ...]:
+    """Display text of a candidate row, in CandidateTableModel.COLUMNS order."""
+    return (
+        c.asin,
+        c.title,
+        f"{c.confidence_score:.0%}",
+        c.source.value,
+        "Yes" if c.is_active else "No",
+        "* PRIMARY" if c.is_primary else "",
+        "Locked" if c.is_locked else "",
+    )
+
+
+def _candidate_backgrounds(c: AsinCandidate) -> tuple[QColor | None, ...]:
+    """Background of each cell of a candidate row."""
+    if c.is_primary:
+        return (_PRIMARY_BG,) * 7
+    if not c.is_active:
+        return (_INACTIVE_BG,) * 7
+
+    # Confidence-based coloring
+    conf = float(c.confidence_score)
+    conf_bg = next(
+        (color for threshold, color in _CONFIDENCE_BGS if conf >= threshold),
+        _LOW_CONFIDENCE_BG,
+    )
+    backgrounds: list[QColor | None] = [None] * 7
+    backgrounds[_CONFIDENCE_COLUMN] = conf_bg
+    return tuple(backgrounds)
+
 
 class AsinSearchWorkerSingle(QThread):
     """Optimized background worker for ASIN search with parallel batching."""
@@ -38,16 +97,20 @@ class AsinSearchWorkerSingle(QThread):
     error = pyqtSignal(str)
 
     BATCH_SIZE = 20  # SP-API max identifiers per request
-    MAX_WORKERS = 1  # Single worker to avoid rate limits
-    BATCH_DELAY = 1.0  # Seconds between batches
+    MAX_WORKERS = 2  # catalog search allows a burst of 2 requests
+    PROGRESS_INTERVAL = 0.1  # Minimum seconds between progress signals
 
     def __init__(
         self,
         items: list[SupplierItem],
+        repo: Repository | None = None,
+        spapi: SpApiClient | None = None,
         parent: QWidget | None = None,
     ) -> None:
         super().__init__(parent)
         self._items = items
+        self._repo = repo or Repository()
+        self._spapi = spapi
         self._cancelled = False
 
     def cancel(self) -> None:
@@ -56,16 +119,8 @@ class AsinSearchWorkerSingle(QThread):
 
     def run(self) -> None:
         """Run optimized ASIN search with parallel batch processing."""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        from src.api.spapi import SpApiClient
-        from src.core.config import get_settings
-        from src.core.models import CandidateSource
-        from decimal import Decimal
-        import time
-
-        settings = get_settings()
-        spapi = SpApiClient(settings)
-        repo = Repository()
+        spapi = self._spapi or SpApiClient(get_settings())
+        repo = self._repo.for_thread()
 
         total = len(self._items)
         total_candidates = 0
@@ -125,13 +180,12 @@ class AsinSearchWorkerSingle(QThread):
         ]
 
         def process_batch(batch_eans: list[str]) -> dict[str, list[dict]]:
-            """Process a single batch of EANs with rate limit protection."""
+            """Process a single batch of EANs."""
             if self._cancelled:
                 return {}
             try:
-                result = spapi.search_catalog_by_identifiers_batch(batch_eans, "EAN")
-                time.sleep(self.BATCH_DELAY)  # Pace requests to avoid rate limits
-                return result
+                # SpApiClient paces these calls with its catalog rate limiter
+                return spapi.search_catalog_by_identifiers_batch(batch_eans, "EAN")
             except Exception as e:
                 logger.warning(f"Batch failed: {e}")
                 return {}
@@ -139,26 +193,36 @@ class AsinSearchWorkerSingle(QThread):
         # Process batches with thread pool - save results in real-time
         start_time = time.time()
         completed_batches = 0
+        last_progress = 0.0
         
         def save_batch_results(batch_result: dict[str, list[dict]]) -> tuple[int, int]:
             """Save batch results to database immediately. Returns (items_matched, candidates_saved)."""
             batch_matches = 0
             batch_candidates = 0
-            
+
+            # Existing candidates for every item in this batch, in one query
+            batch_item_ids = [
+                item.id for ean in batch_result for item in ean_to_items.get(ean, [])
+            ]
+            existing_by_item = repo.get_candidates_for_items(batch_item_ids)
+
+            updates: list[dict] = []
+            inserts: list[AsinCandidate] = []
+            primaries: dict[int, str] = {}  # item_id -> ASIN to keep primary
+            searched_ids: list[int] = []
+
             for ean, api_items in batch_result.items():
                 items_for_ean = ean_to_items.get(ean, [])
                 
                 for item in items_for_ean:
                     item_saved = 0
+                    existing = existing_by_item.get(item.id, {})
+                    empty_candidate = existing.get("")
+                    known_asins = set(existing)
                     
                     for api_item in api_items:
                         asin = api_item.get("asin", "")
-                        if not asin:
-                            continue
-                        
-                        # Check if this ASIN already exists for this item
-                        existing_with_asin = repo.get_candidate_by_asin(item.id, asin)
-                        if existing_with_asin:
+                        if not asin or asin in known_asins:
                             continue  # Already have this ASIN
                         
                         # Extract title and brand
@@ -173,23 +237,21 @@ class AsinSearchWorkerSingle(QThread):
                         
                         confidence = Decimal("0.95")
                         
-                        # Check for existing empty candidate to UPDATE
-                        empty_candidate = repo.get_empty_candidate(item.id)
                         if empty_candidate and empty_candidate.id:
                             # Update existing empty candidate
-                            repo.update_candidate_asin(
-                                candidate_id=empty_candidate.id,
-                                asin=asin,
-                                title=title,
-                                amazon_brand=amazon_brand,
-                                confidence_score=confidence,
-                                source=CandidateSource.SPAPI_EAN.value,
-                                match_reason=f"EAN match: {ean}",
-                            )
-                            item_saved += 1
+                            updates.append({
+                                "candidate_id": empty_candidate.id,
+                                "asin": asin,
+                                "title": title,
+                                "amazon_brand": amazon_brand,
+                                "confidence_score": confidence,
+                                "source": CandidateSource.SPAPI_EAN.value,
+                                "match_reason": f"EAN match: {ean}",
+                            })
+                            empty_candidate = None
                         else:
                             # Create new candidate
-                            candidate = AsinCandidate(
+                            inserts.append(AsinCandidate(
                                 supplier_item_id=item.id,
                                 brand=item.brand,
                                 supplier=item.supplier,
@@ -202,21 +264,28 @@ class AsinSearchWorkerSingle(QThread):
                                 source=CandidateSource.SPAPI_EAN,
                                 is_active=True,
                                 is_primary=True,
-                            )
-                            repo.save_asin_candidate(candidate)
-                            item_saved += 1
+                            ))
+                        known_asins.add(asin)
+                        item_saved += 1
                         
-                        # Clear other primaries for this item
-                        repo.clear_other_primaries(item.id, asin)
+                        # Clear other primaries for this item; the last ASIN stays primary
+                        primaries[item.id] = asin
                     
                     if item_saved > 0:
                         batch_candidates += item_saved
                         batch_matches += 1
-                    else:
+                    elif empty_candidate and empty_candidate.id:
                         # Mark as searched but not found (update empty candidate's match_reason)
-                        empty = repo.get_empty_candidate(item.id)
-                        if empty and empty.id:
-                            repo.mark_search_attempted(empty.id)
+                        searched_ids.append(empty_candidate.id)
+
+            # One transaction for the whole batch
+            with repo.transaction():
+                for params in updates:
+                    repo.update_candidate_asin(**params)
+                repo.save_asin_candidates_upsert(inserts)
+                repo.clear_other_primaries_batch(list(primaries.items()))
+                for candidate_id in searched_ids:
+                    repo.mark_search_attempted(candidate_id)
             
             return batch_matches, batch_candidates
         
@@ -225,6 +294,8 @@ class AsinSearchWorkerSingle(QThread):
             
             for future in as_completed(futures):
                 if self._cancelled:
+                    # Drop the batches that have not started yet
+                    executor.shutdown(wait=False, cancel_futures=True)
                     break
                     
                 batch_idx = futures[future]
@@ -238,9 +309,15 @@ class AsinSearchWorkerSingle(QThread):
                     processed += len(result) 
                     
                     completed_batches += 1
+                    remaining = total_batches - completed_batches
+                    # Each signal repaints the progress dialog, so coalesce fast batches
+                    now = time.monotonic()
+                    if remaining and now - last_progress < self.PROGRESS_INTERVAL:
+                        continue
+                    last_progress = now
+
                     elapsed = time.time() - start_time
                     rate = completed_batches / elapsed if elapsed > 0 else 0
-                    remaining = total_batches - completed_batches
                     eta = int(remaining / rate) if rate > 0 else 0
                     
                     self.progress.emit(
@@ -263,25 +340,65 @@ class AsinSearchWorkerSingle(QThread):
 class CandidateTableModel(QAbstractTableModel):
     """Table model for ASIN candidates."""
 
-    COLUMNS = [
-        ("ASIN", "asin"),
-        ("Title", "title"),
-        ("Confidence", "confidence"),
-        ("Source", "source"),
-        ("Active", "active"),
-        ("Primary", "primary"),
-        ("Locked", "locked"),
-    ]
+    # Cell text comes from _candidate_cells, in this order
+    COLUMNS = ("ASIN", "Title", "Confidence", "Source", "Active", "Primary", "Locked")
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._candidates: list[AsinCandidate] = []
+        # Cell text and backgrounds, built when candidates are set so that
+        # data() is a plain lookup
+        self._cells: list[tuple[str, ...]] = []
+        self._backgrounds: list[tuple[QColor | None, ...]] = []
 
     def set_candidates(self, candidates: list[AsinCandidate]) -> None:
+        # Re-reading the same candidates (after a status toggle) updates the
+        # rows in place, keeping the view's selection and scroll position
+        if candidates and [c.id for c in candidates] == [c.id for c in self._candidates]:
+            self._set_rows(candidates)
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(candidates) - 1, len(self.COLUMNS) - 1),
+                [
+                    Qt.ItemDataRole.DisplayRole,
+                    Qt.ItemDataRole.BackgroundRole,
+                    Qt.ItemDataRole.UserRole,
+                ],
+            )
+            return
+
         self.beginResetModel()
-        self._candidates = candidates
+        self._set_rows(candidates)
         self.endResetModel()
 
+    def _set_rows(self, candidates: list[AsinCandidate]) -> None:
+        self._candidates = candidates
+        self._cells = [_candidate_cells(c) for c in candidates]
+        self._backgrounds = [_candidate_backgrounds(c) for c in candidates]
+
+    def update_candidates(self, changes: dict[int, dict[str, Any]]) -> None:
+        """Apply field changes to candidates by id, redrawing only changed rows."""
+        last_column = len(self.COLUMNS) - 1
+        for row, old in enumerate(self._candidates):
+            fields = changes.get(old.id) if old.id is not None else None
+            if not fields:
+                continue
+            candidate = replace(old, **fields)
+            if candidate == old:
+                continue
+            self._candidates[row] = candidate
+            self._cells[row] = _candidate_cells(candidate)
+            self._backgrounds[row] = _candidate_backgrounds(candidate)
+            self.dataChanged.emit(
+                self.index(row, 0),
+                self.index(row, last_column),
+                [
+                    Qt.ItemDataRole.DisplayRole,
+                    Qt.ItemDataRole.BackgroundRole,
+                    Qt.ItemDataRole.UserRole,
+                ],
+            )
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return len(self._candidates)
 
@@ -290,52 +407,21 @@ class CandidateTableModel(QAbstractTableModel):
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
-            return self.COLUMNS[section][0]
+            return self.COLUMNS[section]
         return None
 
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
-        if not index.isValid() or index.row() >= len(self._candidates):
+        if role not in _MODEL_ROLES or not index.isValid() or index.row() >= len(self._candidates):
             return None
 
-        c = self._candidates[index.row()]
-        col_key = self.COLUMNS[index.column()][1]
-
         if role == Qt.ItemDataRole.DisplayRole:
-            match col_key:
-                case "asin":
-                    return c.asin
-                case "title":
-                    return c.title
-                case "confidence":
-                    return f"{c.confidence_score:.0%}"
-                case "source":
-                    return c.source.value
-                case "active":
-                    return "Yes" if c.is_active else "No"
-                case "primary":
-                    return "* PRIMARY" if c.is_primary else ""
-                case "locked":
-                    return "Locked" if c.is_locked else ""
+            return self._cells[index.row()][index.column()]
 
         if role == Qt.ItemDataRole.BackgroundRole:
-            if c.is_primary:
-                return QColor(220, 255, 220)  # Green for primary
-            if not c.is_active:
-                return QColor(240, 240, 240)  # Gray for inactive
-            # Confidence-based coloring
-            if col_key == "confidence":
-                conf = float(c.confidence_score)
-                if conf >= 0.90:
-                    return QColor(200, 255, 200)  # Bright green
-                elif conf >= 0.75:
-                    return QColor(230, 255, 230)  # Light green
-                elif conf >= 0.50:
-                    return QColor(255, 255, 200)  # Yellow
-                else:
-                    return QColor(255, 220, 220)  # Light red
+            return self._backgrounds[index.row()][index.column()]
 
         if role == Qt.ItemDataRole.UserRole:
-            return c
+            return self._candidates[index.row()]
 
         return None
 
@@ -345,16 +431,148 @@ class CandidateTableModel(QAbstractTableModel):
         return None
 
 
+class SupplierItemModel(QAbstractTableModel):
+    """Model for the supplier items list; the view asks only for visible rows."""
+
+    COLUMNS = ["Part Number", "Brand", "Supplier", "EAN", "MPN"]
+    # Display text per column, in COLUMNS order
+    _TEXT = (
+        lambda item: item.part_number,
+        lambda item: item.brand.value,
+        lambda item: item.supplier,
+        lambda item: item.ean,
+        lambda item: item.mpn,
+    )
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._items: list[SupplierItem] = []
+
+    def set_items(self, items: list[SupplierItem]) -> None:
+        """Replace the items.
+
+        Rows are matched to the current ones by item id, so views are only
+        told about removed, inserted and changed rows instead of a full
+        reset. This keeps hidden rows, selection and scroll position.
+        """
+        new_ids = [item.id for item in items]
+        new_id_set = set(new_ids)
+        old_ids = [item.id for item in self._items]
+        old_id_set = set(old_ids)
+        if (
+            len(new_id_set) != len(new_ids)
+            or len(old_id_set) != len(old_ids)
+            or old_id_set.isdisjoint(new_id_set)
+            or [i for i in old_ids if i in new_id_set] != [i for i in new_ids if i in old_id_set]
+        ):
+            # Nothing to match up, or rows moved; replace everything
+            self.beginResetModel()
+            self._items = items
+            self.endResetModel()
+            return
+
+        # Remove runs of rows that are gone, bottom-up so row numbers stay valid
+        row = len(old_ids) - 1
+        while row >= 0:
+            if old_ids[row] in new_id_set:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and old_ids[row] not in new_id_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._items[row + 1:last + 1]
+            self.endRemoveRows()
+
+        # Insert runs of new rows, top-down
+        row = 0
+        while row < len(new_ids):
+            if new_ids[row] in old_id_set:
+                row += 1
+                continue
+            first = row
+            while row < len(new_ids) and new_ids[row] not in old_id_set:
+                row += 1
+            self.beginInsertRows(QModelIndex(), first, row - 1)
+            self._items[first:first] = items[first:row]
+            self.endInsertRows()
+
+        # Kept rows may carry edited fields
+        self._items = items
+        if items:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(items) - 1, len(self.COLUMNS) - 1),
+                [Qt.ItemDataRole.DisplayRole],
+            )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role not in _MODEL_ROLES or not index.isValid() or index.row() >= len(self._items):
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._TEXT[index.column()](self._items[index.row()])
+
+        if role == Qt.ItemDataRole.UserRole:
+            return self._items[index.row()].id
+
+        return None
+
+    def get_item(self, row: int) -> SupplierItem | None:
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+
 class MappingsTab(QWidget):
     """Tab widget for managing ASIN mappings."""
 
-    mapping_updated = pyqtSignal()
+    mapping_updated = pyqtSignal(str)  # brand value, or "" for any brand
+
+    FILTER_DEBOUNCE_MS = 200
+    # Seconds a brand's supplier items are reused across handlers
+    ITEMS_CACHE_TTL = 5.0
+    # Items whose candidates are kept for reselection, and for how many seconds;
+    # the imports tab and the refresh scheduler write candidates behind our back
+    CANDIDATE_CACHE_SIZE = 128
+    CANDIDATE_CACHE_TTL = 5.0
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._repo = Repository()
         self._search_worker: AsinSearchWorkerSingle | None = None
+        # Kept across searches so its HTTP session and access token are reused
+        self._spapi: SpApiClient | None = None
         self._progress_dialog: QProgressDialog | None = None
+        # Filter keys of each item row: (brand, part number, EAN), lowercased
+        self._tree_rows: list[tuple[str, str, str]] = []
+        # Hidden state of each item row, and the (brand, search) filter that set it
+        self._row_hidden: list[bool] = []
+        self._applied_filter: tuple[str, str] = ("All", "")
+        # Supplier items per brand with the monotonic time they were fetched
+        self._items_cache: dict[Brand, tuple[float, list[SupplierItem]]] = {}
+        self.mapping_updated.connect(self._items_cache.clear)
+        # Candidates of recently selected items with the monotonic time they were
+        # fetched, least recently used first
+        self._candidate_cache: OrderedDict[int, tuple[float, list[AsinCandidate]]] = OrderedDict()
+
+        # Filter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -365,13 +583,13 @@ class MappingsTab(QWidget):
         toolbar.addWidget(QLabel("Brand:"))
         self.brand_filter = QComboBox()
         self.brand_filter.addItems(["All"] + Brand.values())
-        self.brand_filter.currentTextChanged.connect(self._on_filter_changed)
+        self.brand_filter.currentTextChanged.connect(self._apply_filter)
         toolbar.addWidget(self.brand_filter)
 
         toolbar.addWidget(QLabel("Search:"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Part number or EAN...")
-        self.search_input.textChanged.connect(self._on_filter_changed)
+        self.search_input.textChanged.connect(self._filter_timer.start)
         toolbar.addWidget(self.search_input, stretch=1)
 
         refresh_btn = QPushButton("Refresh")
@@ -404,10 +622,16 @@ class MappingsTab(QWidget):
         left_layout.setContentsMargins(0, 0, 0, 0)
         left_layout.addWidget(QLabel("Supplier Items"))
 
-        self.items_tree = QTreeWidget()
-        self.items_tree.setHeaderLabels(["Part Number", "Brand", "Supplier", "EAN", "MPN"])
+        self.items_model = SupplierItemModel(self)
+        self.items_tree = QTreeView()
+        self.items_tree.setModel(self.items_model)
+        self.items_tree.setRootIsDecorated(False)
+        self.items_tree.setUniformRowHeights(True)
         self.items_tree.setColumnWidth(0, 150)
-        self.items_tree.currentItemChanged.connect(self._on_item_selected)
+        self.items_tree.selectionModel().currentRowChanged.connect(self._on_item_selected)
+        self.items_model.modelReset.connect(self._on_items_reset)
+        self.items_model.rowsInserted.connect(self._on_item_rows_inserted)
+        self.items_model.rowsRemoved.connect(self._on_item_rows_removed)
         left_layout.addWidget(self.items_tree)
         splitter.addWidget(left_widget)
 
@@ -450,49 +674,124 @@ class MappingsTab(QWidget):
         layout.addWidget(splitter)
 
     def refresh_data(self) -> None:
-        """Reload data from database."""
-        self.items_tree.clear()
+        """Reload data from database.
+
+        Every brand is loaded; the brand and search filters only hide rows.
+        """
+        self._filter_timer.stop()
+        # An explicit reload (e.g. after an import) always goes to the database
+        self._items_cache.clear()
+        items = self._get_items(_ALL_BRANDS)
+
+        # Only added and removed rows reach the view; _row_hidden follows
+        # through the model's row signals
+        self.items_model.set_items(items)
+        self._tree_rows = [
+            (item.brand.value, item.part_number.lower(), item.ean.lower()) for item in items
+        ]
 
-        brand_filter = self.brand_filter.currentText()
-        search_text = self.search_input.text().lower()
+        # A kept current row shows its reloaded candidates
+        self._candidate_cache.clear()
+        self._on_item_selected(self.items_tree.currentIndex(), QModelIndex())
 
-        brands = Brand.values() if brand_filter == "All" else [brand_filter]
+        # Kept rows keep their hidden state, so check every row against the filter
+        self._applied_filter = ("", "")
+        self._apply_filter()
 
-        for brand_name in brands:
-            try:
-                brand = Brand.from_string(brand_name)
-            except ValueError:
-                continue
+    def _on_items_reset(self) -> None:
+        self._row_hidden = [False] * self.items_model.rowCount()
 
-            items = self._repo.get_supplier_items_by_brand(brand)
+    def _on_item_rows_inserted(self, _parent: QModelIndex, first: int, last: int) -> None:
+        self._row_hidden[first:first] = [False] * (last - first + 1)
 
-            for item in items:
-                if search_text and search_text not in item.part_number.lower() and search_text not in item.ean.lower():
-                    continue
+    def _on_item_rows_removed(self, _parent: QModelIndex, first: int, last: int) -> None:
+        del self._row_hidden[first:last + 1]
 
-                tree_item = QTreeWidgetItem([
-                    item.part_number,
-                    item.brand.value,
-                    item.supplier,
-                    item.ean,
-                    item.mpn,
-                ])
-                tree_item.setData(0, Qt.ItemDataRole.UserRole, item.id)
-                self.items_tree.addTopLevelItem(tree_item)
-
-    def _on_filter_changed(self) -> None:
-        self.refresh_data()
+    def _get_items(self, brands: tuple[Brand, ...]) -> list[SupplierItem]:
+        """Get the brands' supplier items, reusing fetches from the last few seconds.
+
+        Brands without a recent fetch are read together in one query.
+        """
+        now = time.monotonic()
+        stale = [
+            brand for brand in brands
+            if brand not in self._items_cache
+            or now - self._items_cache[brand][0] >= self.ITEMS_CACHE_TTL
+        ]
+        if stale:
+            fetched: dict[Brand, list[SupplierItem]] = {brand: [] for brand in stale}
+            for item in self._repo.get_supplier_items_by_brands(stale):
+                fetched[item.brand].append(item)
+            for brand, items in fetched.items():
+                self._items_cache[brand] = (now, items)
+        return [item for brand in brands for item in self._items_cache[brand][1]]
+
+    def _get_spapi(self) -> SpApiClient:
+        """Get the SP-API client, rebuilt only when the settings are reloaded."""
+        settings = get_settings()
+        if self._spapi is None or self._spapi.settings is not settings:
+            self._spapi = SpApiClient(settings)
+        return self._spapi
 
-    def _on_item_selected(self, current: QTreeWidgetItem | None, _previous: QTreeWidgetItem | None) -> None:
+    def _selected_brands(self) -> tuple[Brand, ...]:
+        """Get the brands chosen in the brand filter."""
+        brand_filter = self.brand_filter.currentText()
+        return _ALL_BRANDS if brand_filter == "All" else (Brand(brand_filter),)
+
+    def _apply_filter(self) -> None:
+        """Show only the loaded rows matching the brand and search filters."""
+        self._filter_timer.stop()
+        brand_filter = self.brand_filter.currentText()
+        search_text = self.search_input.text().lower()
+        # Typing more of the same text can only hide rows, so hidden ones are skipped
+        applied_brand, applied_text = self._applied_filter
+        narrowing = brand_filter == applied_brand and applied_text in search_text
+        self._applied_filter = (brand_filter, search_text)
+
+        self.items_tree.setUpdatesEnabled(False)
+        try:
+            for i, (brand, part_number, ean) in enumerate(self._tree_rows):
+                was_hidden = self._row_hidden[i]
+                if narrowing and was_hidden:
+                    continue
+                hidden = (brand_filter != "All" and brand != brand_filter) or bool(
+                    search_text and search_text not in part_number and search_text not in ean
+                )
+                # Only rows that change are touched; each setHidden relayouts the view
+                if hidden != was_hidden:
+                    self._row_hidden[i] = hidden
+                    self.items_tree.setRowHidden(i, QModelIndex(), hidden)
+        finally:
+            self.items_tree.setUpdatesEnabled(True)
+
+        current = self.items_tree.currentIndex()
+        if current.isValid() and self._row_hidden[current.row()]:
+            self.items_tree.setCurrentIndex(QModelIndex())
+
+    def _on_item_selected(self, current: QModelIndex, _previous: QModelIndex) -> None:
         """Handle item selection in the tree."""
-        if not current:
+        item = self.items_model.get_item(current.row()) if current.isValid() else None
+        if not item:
             self.candidate_model.set_candidates([])
             return
 
-        item_id = current.data(0, Qt.ItemDataRole.UserRole)
+        item_id = item.id
         if item_id:
-            candidates = self._repo.get_candidates_by_supplier_item(item_id, active_only=False)
-            self.candidate_model.set_candidates(candidates)
+            # The model edits its list in place, so it must not share the cached one
+            self.candidate_model.set_candidates(list(self._get_candidates(item_id)))
+
+    def _get_candidates(self, item_id: int) -> list[AsinCandidate]:
+        """Get an item's candidates, reusing them if it was selected recently."""
+        now = time.monotonic()
+        cached = self._candidate_cache.pop(item_id, None)
+        if cached is not None and now - cached[0] < self.CANDIDATE_CACHE_TTL:
+            self._candidate_cache[item_id] = cached
+            return cached[1]
+        candidates = self._repo.get_candidates_by_supplier_item(item_id, active_only=False)
+        if len(self._candidate_cache) >= self.CANDIDATE_CACHE_SIZE:
+            self._candidate_cache.popitem(last=False)
+        self._candidate_cache[item_id] = (now, candidates)
+        return candidates
 
     def _get_selected_candidate(self) -> AsinCandidate | None:
         indexes = self.candidate_table.selectionModel().selectedRows()
@@ -504,52 +803,39 @@ class MappingsTab(QWidget):
         candidate = self._get_selected_candidate()
         if candidate and candidate.id:
             self._repo.set_primary_candidate(candidate.supplier_item_id, candidate.id)
-            self._refresh_candidates()
-            self.mapping_updated.emit()
+            self._candidate_cache.pop(candidate.supplier_item_id, None)
+            # Mirror the write in the table rather than re-reading the item
+            model = self.candidate_model
+            model.update_candidates({
+                c.id: {"is_primary": c.id == candidate.id}
+                for c in (model.get_candidate(row) for row in range(model.rowCount()))
+                if c is not None and c.id is not None
+            })
+            self.mapping_updated.emit(candidate.brand.value)
 
     def _on_toggle_active(self) -> None:
         candidate = self._get_selected_candidate()
         if candidate and candidate.id:
             self._repo.update_candidate_status(candidate.id, is_active=not candidate.is_active)
-            self._refresh_candidates()
-            self.mapping_updated.emit()
+            self._candidate_cache.pop(candidate.supplier_item_id, None)
+            self.candidate_model.update_candidates({candidate.id: {"is_active": not candidate.is_active}})
+            self.mapping_updated.emit(candidate.brand.value)
 
     def _on_toggle_lock(self) -> None:
         candidate = self._get_selected_candidate()
         if candidate and candidate.id:
             self._repo.update_candidate_status(candidate.id, is_locked=not candidate.is_locked)
-            self._refresh_candidates()
-
-    def _refresh_candidates(self) -> None:
-        current = self.items_tree.currentItem()
-        if current:
-            self._on_item_selected(current, None)
+            self._candidate_cache.pop(candidate.supplier_item_id, None)
+            self.candidate_model.update_candidates({candidate.id: {"is_locked": not candidate.is_locked}})
 
     def _on_search_asins(self) -> None:
         """Search for ASINs for items without candidates."""
-        # Get items that have no candidates
-        brand_filter = self.brand_filter.currentText()
-        brands = Brand.values() if brand_filter == "All" else [brand_filter]
-
-        items_without_candidates: list[SupplierItem] = []
-
-        for brand_name in brands:
-            try:
-                brand = Brand.from_string(brand_name)
-            except ValueError:
-                continue
-
-            items = self._repo.get_supplier_items_by_brand(brand)
-            for item in items:
-                if item.id:
-                    candidates = self._repo.get_candidates_by_supplier_item(item.id, active_only=False)
-                    # Check if no candidates OR all candidates have empty ASINs AND not already searched
-                    needs_search = (
-                        not candidates or 
-                        all(not c.asin and c.source != "spapi_ean_not_found" for c in candidates)
-                    )
-                    if needs_search:
-                        items_without_candidates.append(item)
+        # Get items that have no candidates, or only empty ones not yet searched
+        brands = self._selected_brands()
+        missing_ids = self._repo.get_item_ids_without_asins(list(brands))
+        items_without_candidates: list[SupplierItem] = [
+            item for item in self._get_items(brands) if item.id in missing_ids
+        ]
 
         if not items_without_candidates:
             QMessageBox.information(
@@ -588,7 +874,9 @@ class MappingsTab(QWidget):
         self._progress_dialog.show()
 
         # Start worker
-        self._search_worker = AsinSearchWorkerSingle(items_without_candidates, self)
+        self._search_worker = AsinSearchWorkerSingle(
+            items_without_candidates, self._repo, self._get_spapi(), self
+        )
         self._search_worker.progress.connect(self._on_search_progress)
         self._search_worker.finished_signal.connect(self._on_search_finished)
         self._search_worker.error.connect(self._on_search_error)
@@ -599,7 +887,6 @@ class MappingsTab(QWidget):
         if self._progress_dialog:
             self._progress_dialog.setValue(current)
             self._progress_dialog.setLabelText(f"{current}/{total}: {message}")
-            QApplication.processEvents()
 
     def _on_search_finished(self, items_with_matches: int, total_candidates: int) -> None:
         """Handle search completion with detailed statistics."""
@@ -610,27 +897,18 @@ class MappingsTab(QWidget):
         self._search_worker = None
 
         # Calculate detailed stats
-        brand_filter = self.brand_filter.currentText()
-        brands = Brand.values() if brand_filter == "All" else [brand_filter]
-        
         total_items = 0
         items_with_asin = 0
         items_no_match = 0
         
-        for brand_name in brands:
-            try:
-                brand = Brand.from_string(brand_name)
-            except ValueError:
-                continue
-            items = self._repo.get_supplier_items_by_brand(brand)
-            for item in items:
-                if item.id:
-                    total_items += 1
-                    candidates = self._repo.get_candidates_by_supplier_item(item.id, active_only=False)
-                    if any(c.asin for c in candidates):
-                        items_with_asin += 1
-                    elif any(c.source == "spapi_ean_not_found" for c in candidates):
-                        items_no_match += 1
+        for item in self._get_items(self._selected_brands()):
+            if item.id:
+                total_items += 1
+                candidates = self._repo.get_candidates_by_supplier_item(item.id, active_only=False)
+                if any(c.asin for c in candidates):
+                    items_with_asin += 1
+                elif any(c.source == "spapi_ean_not_found" for c in candidates):
+                    items_no_match += 1
 
         match_rate = (items_with_asin / total_items * 100) if total_items > 0 else 0
 
@@ -647,9 +925,10 @@ class MappingsTab(QWidget):
             f"  ASINs found: {total_candidates}",
         )
 
-        # Refresh the view
+        # Refresh the view; only the searched brands can have changed
         self.refresh_data()
-        self.mapping_updated.emit()
+        brands = self._selected_brands()
+        self.mapping_updated.emit(brands[0].value if len(brands) == 1 else "")
 
     def _on_search_error(self, error_msg: str) -> None:
         """Handle search error."""
@@ -671,26 +950,16 @@ class MappingsTab(QWidget):
     def _on_keyword_search(self) -> None:
         """Search for ASINs using keywords for items without EAN matches."""
         # Find items that were searched by EAN but not found
-        brand_filter = self.brand_filter.currentText()
-        brands = Brand.values() if brand_filter == "All" else [brand_filter]
-
         items_for_keyword: list[SupplierItem] = []
 
-        for brand_name in brands:
-            try:
-                brand = Brand.from_string(brand_name)
-            except ValueError:
-                continue
-
-            items = self._repo.get_supplier_items_by_brand(brand)
-            for item in items:
-                if item.id:
-                    candidates = self._repo.get_candidates_by_supplier_item(item.id, active_only=False)
-                    # Items with "not found" status or no EAN
-                    for c in candidates:
-                        if c.source == "spapi_ean_not_found" or (not c.asin and not item.ean):
-                            items_for_keyword.append(item)
-                            break
+        for item in self._get_items(self._selected_brands()):
+            if item.id:
+                candidates = self._repo.get_candidates_by_supplier_item(item.id, active_only=False)
+                # Items with "not found" status or no EAN
+                for c in candidates:
+                    if c.source == "spapi_ean_not_found" or (not c.asin and not item.ean):
+                        items_for_keyword.append(item)
+                        break
 
         if not items_for_keyword:
             QMessageBox.information(
@@ -124,3 +124,21 @@ def invalid_csv_path(tmp_path: Path) -> Path:
     csv_file = tmp_path / "invalid.csv"
     csv_file.write_text(csv_content, encoding="utf-8")
     return csv_file
+
+
+@pytest.fixture
+def temp_repo(tmp_path: Path):
+    """Repository bound to a fresh temporary database."""
+    from unittest.mock import patch
+
+    import src.db.session as session_module
+    from src.db.repository import Repository
+
+    with patch("src.db.session.get_db_path", return_value=tmp_path / "repo.db"):
+        session_module._engine = None
+        session_module._session_factory = None
+        try:
+            session_module.init_database(use_migrations=False)
+            yield Repository()
+        finally:
+            session_module.close_database()
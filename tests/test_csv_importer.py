@@ -75,6 +75,21 @@ class TestCsvImport:
         assert len(errors) == 0
         assert rows[0].brand == "Makita"
 
+    def test_preview_stops_after_max_rows(self, tmp_path: Path) -> None:
+        """Preview never decodes past the rows it returns."""
+        header = b"Brand,Supplier,PartNumber,Description,EAN,MPN,ASIN,CostExVAT_1,CostExVAT_5Plus,PackQty\n"
+        row = b"Makita,Dist A,P1,Drill,,P1,,45.99,42.50,1\n"
+        csv_file = tmp_path / "large.csv"
+        # Undecodable bytes well past the first read would fail a full-file read
+        csv_file.write_bytes(header + row * 2000 + b"\xff\xfe\n")
+
+        rows, errors = CsvImporter().preview(csv_file, max_rows=10, buffer_size=4096)
+
+        assert len(rows) == 10
+        assert errors == []
+        with pytest.raises(UnicodeDecodeError):
+            CsvImporter(newlines_in_values=True).import_file(csv_file)
+
     def test_invalid_brand(self, tmp_path: Path) -> None:
         csv_content = (
             "Brand,Supplier,PartNumber,Description,EAN,MPN,ASIN,CostExVAT_1,CostExVAT_5Plus,PackQty\n"
@@ -103,3 +118,99 @@ class TestCsvImport:
         assert len(items) == 1
         assert items[0].pack_qty == 10
         assert items[0].cost_per_unit_ex_vat_1 == items[0].cost_ex_vat_1 / 10
+
+
+class TestFastChunker:
+    """Tests for the vectorised delimiter scan (newlines_in_values=False)."""
+
+    def test_matches_stdlib_reader(self, sample_csv_path: Path) -> None:
+        items, result = CsvImporter().import_file(sample_csv_path)
+        fast_items, fast_result = CsvImporter(newlines_in_values=False).import_file(sample_csv_path)
+
+        assert fast_result.items_imported == result.items_imported
+        assert [i.part_number for i in fast_items] == [i.part_number for i in items]
+        assert [i.ean for i in fast_items] == [i.ean for i in items]
+        assert [i.cost_ex_vat_1 for i in fast_items] == [i.cost_ex_vat_1 for i in items]
+
+    def test_quoted_fields_and_crlf(self, tmp_path: Path) -> None:
+        csv_content = (
+            "\ufeffBrand,Supplier,PartNumber,Description,EAN,MPN,ASIN,CostExVAT_1,CostExVAT_5Plus,PackQty\r\n"
+            'Makita,"Dist, Ltd",DHP482Z,"18V ""LXT"" Drill",123,,,"1,045.99",42.50,1\r\n'
+            "\r\n"
+        )
+        csv_file = tmp_path / "quoted.csv"
+        csv_file.write_bytes(csv_content.encode("utf-8"))
+
+        items, result = CsvImporter(newlines_in_values=False).import_file(csv_file)
+
+        assert result.items_imported == 1
+        assert items[0].supplier == "Dist, Ltd"
+        assert items[0].description == '18V "LXT" Drill'
+        assert items[0].pack_qty == 1
+        assert str(items[0].cost_ex_vat_1) == "1045.99"
+
+    def test_inch_mark_in_unquoted_field(self, tmp_path: Path) -> None:
+        csv_content = (
+            "Brand,Supplier,PartNumber,Description,EAN,MPN,ASIN,CostExVAT_1,CostExVAT_5Plus,PackQty\n"
+            'Makita,S,P1,1/2" Drive Socket,,,,10.00,9.00,1\n'
+            "Makita,S,P2,Drill,,,,20.00,18.00,1\n"
+            "Makita,S,P3,Driver,,,,30.00,27.00,1\n"
+        )
+        csv_file = tmp_path / "inch.csv"
+        csv_file.write_text(csv_content)
+
+        items, result = CsvImporter(newlines_in_values=False).import_file(csv_file)
+
+        assert result.items_imported == 3
+        assert [i.description for i in items] == ['1/2" Drive Socket', "Drill", "Driver"]
+
+    def test_unterminated_quote_falls_back_to_stdlib_reader(self, tmp_path: Path) -> None:
+        csv_content = (
+            "Brand,Supplier,PartNumber,Description,EAN,MPN,ASIN,CostExVAT_1,CostExVAT_5Plus,PackQty\n"
+            "Makita,S,P1,Drill,,,,10.00,9.00,1\n"
+            'Makita,S,P2,"Open quote,,,,20.00,18.00,1\n'
+        )
+        csv_file = tmp_path / "open_quote.csv"
+        csv_file.write_text(csv_content)
+
+        items, result = CsvImporter().import_file(csv_file)
+        fast_items, fast_result = CsvImporter(newlines_in_values=False).import_file(csv_file)
+
+        assert [i.part_number for i in fast_items] == [i.part_number for i in items]
+        assert fast_result.items_imported == result.items_imported
+
+    def test_short_rows_match_stdlib_reader(self, tmp_path: Path) -> None:
+        csv_content = (
+            "Brand,Supplier,PartNumber,Description,EAN,MPN,ASIN,CostExVAT_1,CostExVAT_5Plus,PackQty\n"
+            "Makita,Dist,DHP482Z,Drill\n"
+            "Makita,Dist\n"
+        )
+        csv_file = tmp_path / "short.csv"
+        csv_file.write_text(csv_content)
+
+        items, result = CsvImporter().import_file(csv_file)
+        fast_items, fast_result = CsvImporter(newlines_in_values=False).import_file(csv_file)
+
+        assert [i.part_number for i in fast_items] == [i.part_number for i in items] == ["DHP482Z"]
+        assert fast_result.items_skipped == result.items_skipped == 1
+        assert fast_result.errors == result.errors
+
+    def test_invalid_headers(self, invalid_csv_path: Path) -> None:
+        items, result = CsvImporter(newlines_in_values=False).import_file(invalid_csv_path)
+
+        assert result.items_imported == 0
+        assert len(result.errors) > 0
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        csv_file = tmp_path / "empty.csv"
+        csv_file.write_bytes(b"")
+
+        items, result = CsvImporter(newlines_in_values=False).import_file(csv_file)
+
+        assert items == []
+        assert result.errors == ["CSV file is empty or has no headers"]
+
+    def test_custom_buffer_size(self, sample_csv_path: Path) -> None:
+        items, result = CsvImporter().import_file(sample_csv_path, buffer_size=16 * 1024 * 1024)
+
+        assert result.items_imported == 3
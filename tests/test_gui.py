@@ -6,7 +6,7 @@ from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QModelIndex, Qt
 from PyQt6.QtWidgets import QApplication
 
 from src.core.config import Settings
@@ -305,6 +305,62 @@ class TestScoreTableModel:
         assert result is not None
         assert result.asin == "B001234567"
 
+    def test_model_update_emits_data_changed_for_changed_rows(self, qtbot, score_result):
+        """Test refreshing with one changed row does not reset the model."""
+        from dataclasses import replace
+
+        from src.gui.brand_tab import ScoreTableModel
+
+        other = replace(score_result, asin_candidate_id=2, asin="B007654321")
+        model = ScoreTableModel()
+        model.set_results([score_result, other])
+
+        changed = []
+        model.dataChanged.connect(lambda top, bottom, roles: changed.append(top.row()))
+        model.modelReset.connect(lambda: changed.append("reset"))
+        model.set_results([score_result, replace(other, score=90)])
+
+        assert changed == [1]
+        assert model.data(model.index(1, 0)) == 90
+
+    def test_model_update_inserts_and_removes_rows(self, qtbot, score_result):
+        """Test added and dropped candidates become row inserts/removes."""
+        from dataclasses import replace
+
+        from src.gui.brand_tab import ScoreTableModel
+
+        second = replace(score_result, asin_candidate_id=2, asin="B000000002")
+        third = replace(score_result, asin_candidate_id=3, asin="B000000003")
+        model = ScoreTableModel()
+        model.set_results([score_result, second])
+
+        events = []
+        model.rowsInserted.connect(lambda parent, first, last: events.append(("ins", first)))
+        model.rowsRemoved.connect(lambda parent, first, last: events.append(("rem", first)))
+        model.modelReset.connect(lambda: events.append("reset"))
+        model.set_results([second, third])
+
+        assert events == [("rem", 0), ("ins", 1)]
+        assert [r.asin for r in model.get_all_results()] == ["B000000002", "B000000003"]
+
+    def test_model_reorder_keeps_persistent_indexes(self, qtbot, score_result):
+        """Test reordered rows keep persistent indexes (and so selection)."""
+        from dataclasses import replace
+
+        from PyQt6.QtCore import QPersistentModelIndex
+
+        from src.gui.brand_tab import ScoreTableModel
+
+        second = replace(score_result, asin_candidate_id=2, asin="B000000002")
+        model = ScoreTableModel()
+        model.set_results([score_result, second])
+
+        pinned = QPersistentModelIndex(model.index(0, 3))
+        model.set_results([second, score_result])
+
+        assert pinned.row() == 1
+        assert model.data(model.index(pinned.row(), 3)) == "B001234567"
+
     def test_model_get_result_invalid_row(self, qtbot):
         """Test getting result with invalid row."""
         from src.gui.brand_tab import ScoreTableModel
@@ -379,6 +435,615 @@ class TestImportsTab:
             assert hasattr(tab, 'cancel_btn')
             assert tab.import_btn.isEnabled() == False  # No file selected
 
+    def test_preview_populates_model(self, qtbot, sample_csv_path):
+        """Test previews are loaded into the table model in one reset."""
+        from src.gui.imports_tab import ImportsTab
+
+        with patch('src.gui.imports_tab.Repository'):
+            tab = ImportsTab()
+            qtbot.addWidget(tab)
+
+            model = tab.preview_table.model()
+            tab._preview_file(str(sample_csv_path))
+            tab._preview_file(str(sample_csv_path))
+
+            assert model.rowCount() == 3
+            assert model.columnCount() == 10
+            assert model.data(model.index(0, 0)) == "Makita"
+            assert model.data(model.index(0, 0), Qt.ItemDataRole.ToolTipRole) is None
+            assert model.headerData(2, Qt.Orientation.Horizontal) == "PartNumber"
+            assert not model.flags(model.index(0, 0)) & Qt.ItemFlag.ItemIsEditable
+
+            resets = []
+            model.modelReset.connect(lambda: resets.append(True))
+            tab._preview_file(str(sample_csv_path))
+            assert len(resets) == 1
+
+            tab._preview_file(str(sample_csv_path.parent / "missing.csv"))
+            assert model.rowCount() == 0
+
+    def test_preview_formats_decimals_without_exponent(self, qtbot, tmp_path):
+        """Test costs are pre-formatted in fixed-point notation."""
+        from src.gui.imports_tab import ImportsTab
+
+        csv_file = tmp_path / "exp.csv"
+        csv_file.write_text(
+            "Brand,Supplier,PartNumber,Description,EAN,MPN,ASIN,CostExVAT_1,CostExVAT_5Plus,PackQty\n"
+            "Makita,Dist A,P1,Drill,,P1,,1E+1,9.50,2\n",
+            encoding="utf-8",
+        )
+
+        with patch('src.gui.imports_tab.Repository'):
+            tab = ImportsTab()
+            qtbot.addWidget(tab)
+
+            tab._preview_file(str(csv_file))
+
+            model = tab.preview_table.model()
+            assert [model.data(model.index(0, col)) for col in (7, 8, 9)] == ["10", "9.50", "2"]
+
+    def test_preview_columns_have_fixed_widths(self, qtbot, sample_csv_path):
+        """Test preview column widths do not change with the data."""
+        from PyQt6.QtWidgets import QHeaderView
+        from src.gui.imports_tab import ImportsTab
+
+        with patch('src.gui.imports_tab.Repository'):
+            tab = ImportsTab()
+            qtbot.addWidget(tab)
+
+            header = tab.preview_table.horizontalHeader()
+            assert header.sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+            widths = [tab.preview_table.columnWidth(i) for i in range(9)]
+            tab._preview_file(str(sample_csv_path))
+            assert [tab.preview_table.columnWidth(i) for i in range(9)] == widths
+            assert tab.preview_table.columnWidth(3) > tab.preview_table.columnWidth(8)  # Description vs cost
+
+    def test_validation_errors_are_shown_in_red(self, qtbot, invalid_csv_path):
+        """Test header errors are written to the bounded validation log."""
+        from src.gui.imports_tab import ImportsTab
+
+        with patch('src.gui.imports_tab.Repository'):
+            tab = ImportsTab()
+            qtbot.addWidget(tab)
+
+            tab._preview_file(str(invalid_csv_path))
+
+            assert "Missing required columns" in tab.validation_text.toPlainText()
+            block = tab.validation_text.document().firstBlock()
+            color = block.begin().fragment().charFormat().foreground().color()
+            assert color == Qt.GlobalColor.red
+            assert tab.history_text.maximumBlockCount() == ImportsTab.HISTORY_MAX_LINES
+            assert not tab.import_btn.isEnabled()
+
+    def test_preview_warnings_follow_status_line(self, qtbot, tmp_path):
+        """Test row warnings are listed after the validation status."""
+        from src.gui.imports_tab import ImportsTab
+
+        csv_file = tmp_path / "warn.csv"
+        csv_file.write_text(
+            "Brand,Supplier,PartNumber,Description,EAN,MPN,ASIN,CostExVAT_1,CostExVAT_5Plus,PackQty\n"
+            "Makita,Dist A,P1,Drill,,P1,,45.99,42.50,0\n"
+            "Makita,Dist A,P2,Drill,,P2,,45.99,42.50,0\n",
+            encoding="utf-8",
+        )
+
+        with patch('src.gui.imports_tab.Repository'):
+            tab = ImportsTab()
+            qtbot.addWidget(tab)
+
+            tab._preview_file(str(csv_file))
+
+            lines = tab.validation_text.toPlainText().splitlines()
+            assert lines[0].startswith("Validation passed")
+            assert lines[1:] == [
+                "Warning: Row 2: PackQty must be >= 1, using 1",
+                "Warning: Row 3: PackQty must be >= 1, using 1",
+            ]
+            assert tab.preview_table.model().rowCount() == 2
+
+    def test_search_progress_is_coalesced(self, qtbot):
+        """Only the latest progress update is shown on each timer tick."""
+        from src.gui.imports_tab import ImportsTab
+
+        with patch('src.gui.imports_tab.Repository'):
+            tab = ImportsTab()
+            qtbot.addWidget(tab)
+            tab.progress_bar.setMaximum(100)
+
+            tab._on_search_progress(10, 100, "first")
+            tab._on_search_progress(40, 100, "second")
+            assert tab.progress_bar.value() != 40
+
+            tab._flush_search_progress()
+            assert tab.progress_bar.value() == 40
+            assert tab.progress_label.text() == "40/100: second"
+
+
+    def test_import_saves_hint_candidates_in_one_call(self, qtbot, temp_repo, sample_csv_path):
+        """CSV ASIN hints are written with a single upsert for the whole file."""
+        from src.db.repository import Repository
+        from src.gui.imports_tab import ImportsTab
+
+        tab = ImportsTab()
+        qtbot.addWidget(tab)
+        tab.auto_search_checkbox.setChecked(False)
+        tab._current_file = str(sample_csv_path)
+
+        upsert = Repository.save_asin_candidates_upsert
+        with patch('src.gui.imports_tab.QMessageBox'), \
+                patch.object(
+                    Repository, 'save_asin_candidates_upsert', autospec=True, side_effect=upsert,
+                ) as spy:
+            tab._on_import()
+            qtbot.waitUntil(lambda: tab._import_worker is None, timeout=5000)
+
+        assert spy.call_count == 1
+        assert [c.asin for c in spy.call_args.args[1]] == ["B07RBJYQQN"]
+        assert "ASIN candidates from CSV: 1" in tab.history_text.toPlainText()
+
+
+class TestImportWorker:
+    """Tests for the CSV import worker."""
+
+    def test_run_skips_part_numbers_repeated_in_csv(self, qtbot, temp_repo, tmp_path):
+        """A part number listed twice in one file is saved once."""
+        from src.core.csv_importer import CsvImporter
+        from src.gui.imports_tab import ImportWorker
+
+        csv_file = tmp_path / "dupes.csv"
+        csv_file.write_text(
+            "Brand,Supplier,PartNumber,Description,EAN,MPN,ASIN,CostExVAT_1,CostExVAT_5Plus,PackQty\n"
+            "Makita,Dist A,DHP482Z,Drill,0088381694049,DHP482Z,,45.99,42.50,1\n"
+            "Makita,Dist B,DHP482Z,Drill,0088381694049,DHP482Z,,44.99,41.50,1\n",
+            encoding="utf-8",
+        )
+
+        worker = ImportWorker(str(csv_file), CsvImporter())
+        finished = []
+        worker.finished_signal.connect(lambda *args: finished.append(args))
+        worker.run()
+
+        _, saved_count, duplicates_skipped, _, search_ids = finished[0]
+        assert saved_count == 1
+        assert duplicates_skipped == 1
+        assert len(search_ids) == 1
+        assert len(temp_repo.get_supplier_items_by_ids(search_ids)) == 1
+
+
+    def test_run_reports_progress(self, qtbot, temp_repo, sample_csv_path):
+        """Progress is reported after parsing and after the item save."""
+        from src.core.csv_importer import CsvImporter
+        from src.gui.imports_tab import ImportWorker
+
+        worker = ImportWorker(str(sample_csv_path), CsvImporter(), temp_repo)
+        progress = []
+        worker.progress.connect(progress.append)
+        worker.run()
+
+        assert progress == [30, 70]
+
+    def test_reimport_creates_no_new_candidates(self, qtbot, temp_repo, sample_csv_path):
+        """Importing the same file twice leaves the CSV-hint mapping untouched."""
+        from src.core.csv_importer import CsvImporter
+        from src.gui.imports_tab import ImportWorker
+
+        results = []
+        for _ in range(2):
+            worker = ImportWorker(str(sample_csv_path), CsvImporter(), temp_repo)
+            worker.finished_signal.connect(lambda *args: results.append(args))
+            worker.run()
+
+        assert results[0][1:4] == (3, 0, 1)  # saved, duplicates, CSV-hint candidates
+        assert results[1][1:4] == (0, 3, 0)
+        candidates = temp_repo.get_candidates_by_brand(Brand.MAKITA)
+        assert [c.asin for c in candidates] == ["B07RBJYQQN"]
+
+
+class TestBrandRefreshWorker:
+    """Tests for the background brand refresh."""
+
+    @pytest.fixture
+    def scored_repo(self, temp_repo, sample_csv_path):
+        """Repository holding one scored Makita candidate."""
+        from src.core.csv_importer import CsvImporter
+        from src.gui.imports_tab import ImportWorker
+
+        ImportWorker(str(sample_csv_path), CsvImporter(), temp_repo).run()
+        [candidate] = temp_repo.get_candidates_by_brand(Brand.MAKITA)
+        temp_repo.save_score_history(candidate.id, ScoreResult(asin=candidate.asin, score=50))
+        return temp_repo
+
+    def _run(self, repo, engine, cache, history_cache=None):
+        from src.gui.main_window import BrandRefreshSignals, BrandRefreshWorker
+
+        signals = BrandRefreshSignals()
+        finished = []
+        signals.finished.connect(lambda *args: finished.append(args))
+        BrandRefreshWorker(
+            Brand.MAKITA, 7, repo, engine, cache, history_cache or {}, signals
+        ).run()
+        return finished[0]
+
+    def test_run_emits_results_and_history(self, qtbot, scored_repo):
+        """The brand's scored candidates are emitted with their generation."""
+        from src.core.scoring import ScoringEngine
+
+        brand, generation, results, _, profit_history, cache, _ = self._run(
+            scored_repo, ScoringEngine(Settings()), {}
+        )
+
+        assert (brand, generation) == (Brand.MAKITA, 7)
+        assert [r.asin for r in results] == ["B07RBJYQQN"]
+        assert list(profit_history.values()) == [[0.0]]
+        assert list(cache) == [results[0].asin_candidate_id]
+
+    def test_run_reuses_cached_scores(self, qtbot, scored_repo):
+        """Unchanged inputs are not scored again."""
+        from src.core.scoring import ScoringEngine
+
+        *_, cache, _ = self._run(scored_repo, ScoringEngine(Settings()), {})
+        engine = MagicMock()
+        _, _, results, *_ = self._run(scored_repo, engine, cache)
+
+        engine.calculate.assert_not_called()
+        assert len(results) == 1
+
+    def test_new_score_row_keeps_cached_score(self, qtbot, scored_repo):
+        """Only the engine's inputs, not the score history, invalidate a result."""
+        from src.core.scoring import ScoringEngine
+
+        *_, cache, _ = self._run(scored_repo, ScoringEngine(Settings()), {})
+        [candidate] = scored_repo.get_candidates_by_brand(Brand.MAKITA)
+        scored_repo.save_score_history(candidate.id, ScoreResult(asin=candidate.asin, score=60))
+        engine = MagicMock()
+        self._run(scored_repo, engine, cache)
+
+        engine.calculate.assert_not_called()
+
+    def test_sparklines_reread_only_for_new_scores(self, qtbot, scored_repo):
+        """Cached profit history is reused until the candidate's latest score changes."""
+        from src.core.scoring import ScoringEngine
+
+        engine = ScoringEngine(Settings())
+        *_, cache, history_cache = self._run(scored_repo, engine, {})
+
+        with patch.object(scored_repo, "get_brand_profit_history") as brand_history, \
+                patch.object(scored_repo, "get_profit_history_for_candidates") as candidate_history:
+            *_, profit_history, _, _ = self._run(scored_repo, engine, cache, history_cache)
+        brand_history.assert_not_called()
+        candidate_history.assert_not_called()
+        assert list(profit_history.values()) == [[0.0]]
+
+        [candidate] = scored_repo.get_candidates_by_brand(Brand.MAKITA)
+        scored_repo.save_score_history(candidate.id, ScoreResult(asin=candidate.asin, score=60))
+        *_, profit_history, _, _ = self._run(scored_repo, engine, cache, history_cache)
+        assert list(profit_history.values()) == [[0.0, 0.0]]
+
+    def test_scoring_error_reports_failure(self, qtbot, scored_repo):
+        """An exception while scoring emits failed instead of finished."""
+        from src.gui.main_window import BrandRefreshSignals, BrandRefreshWorker
+
+        engine = MagicMock()
+        engine.calculate.side_effect = RuntimeError("boom")
+        signals = BrandRefreshSignals()
+        finished, failed = [], []
+        signals.finished.connect(lambda *args: finished.append(args))
+        signals.failed.connect(lambda *args: failed.append(args))
+
+        BrandRefreshWorker(Brand.MAKITA, 7, scored_repo, engine, {}, {}, signals).run()
+
+        assert finished == []
+        assert failed == [(Brand.MAKITA, 7, "boom")]
+
+    def test_brand_refreshes_again_after_failed_worker(self, qtbot, scored_repo):
+        """A failed refresh frees its brand, so the next refresh runs and applies."""
+        from types import SimpleNamespace
+
+        from src.core.scoring import ScoringEngine
+        from src.gui.main_window import BrandRefreshSignals, MainWindow
+
+        engine = MagicMock()
+        engine.calculate.side_effect = RuntimeError("boom")
+        window = SimpleNamespace(
+            brand_tabs={Brand.MAKITA.value: MagicMock()},
+            _refreshes_running=set(),
+            _refreshes_queued=set(),
+            _refresh_generation={Brand.MAKITA: 0},
+            _repo=scored_repo,
+            _scoring_engine=engine,
+            _score_cache={},
+            _history_cache={},
+            _brand_refresh_signals=BrandRefreshSignals(),
+        )
+        window._refresh_brand_tab = lambda brand: MainWindow._refresh_brand_tab(window, brand)
+        signals = window._brand_refresh_signals
+        finished, failed = [], []
+        signals.finished.connect(lambda *args: finished.append(args))
+        signals.failed.connect(lambda *args: failed.append(args))
+        signals.done.connect(lambda brand: MainWindow._end_brand_refresh(window, brand))
+
+        with patch('src.gui.main_window.QThreadPool') as pool:
+            pool.globalInstance.return_value.start.side_effect = lambda worker: worker.run()
+            window._refresh_brand_tab(Brand.MAKITA)
+            assert len(failed) == 1
+            assert window._refreshes_running == set()
+
+            window._scoring_engine = ScoringEngine(Settings())
+            window._refresh_brand_tab(Brand.MAKITA)
+
+        assert [args[:2] for args in finished] == [(Brand.MAKITA, 2)]
+        assert window._refreshes_running == set()
+
+    def test_candidate_missing_from_history_gets_empty_sparkline(self, qtbot, scored_repo):
+        """A candidate absent from the history query and the cache still scores."""
+        from src.core.scoring import ScoringEngine
+
+        with patch.object(scored_repo, "get_brand_profit_history", return_value={}):
+            _, _, results, _, profit_history, _, _ = self._run(
+                scored_repo, ScoringEngine(Settings()), {}
+            )
+
+        assert len(results) == 1
+        assert list(profit_history.values()) == [[]]
+
+
+class TestAsinSearchWorker:
+    """Tests for the import-time ASIN search worker."""
+
+    def test_run_saves_matches_through_writer(self, qtbot, temp_repo):
+        """Matches found by EAN are written before finished_signal fires."""
+        from src.core.models import SupplierItem
+        from src.gui.imports_tab import AsinSearchWorker
+
+        item = temp_repo.save_supplier_item(SupplierItem(
+            brand=Brand.MAKITA, supplier="Test", part_number="P1", ean="0088381694049",
+        ))
+        spapi = MagicMock()
+        spapi.search_catalog_by_identifiers_batch.return_value = {
+            "0088381694049": [{"asin": "B07RBJYQQN", "summaries": []}],
+        }
+
+        worker = AsinSearchWorker([item.id])
+        finished = []
+        worker.finished_signal.connect(lambda *args: finished.append(args))
+        with patch('src.api.spapi.SpApiClient', return_value=spapi), \
+                patch('src.core.config.get_settings'):
+            worker.run()
+
+        assert finished == [(1, 1)]
+        candidates = temp_repo.get_candidates_by_supplier_item(item.id)
+        assert [c.asin for c in candidates] == ["B07RBJYQQN"]
+        assert candidates[0].is_primary
+        assert temp_repo.get_cached_catalog_items(["0088381694049"]) == {
+            "0088381694049": [{"asin": "B07RBJYQQN", "summaries": []}],
+        }
+
+    def test_failed_write_reports_no_matches(self, qtbot, temp_repo):
+        """Matches in a batch whose commit fails are neither emitted nor counted."""
+        from src.core.models import SupplierItem
+        from src.gui.imports_tab import AsinSearchWorker
+
+        item = temp_repo.save_supplier_item(SupplierItem(
+            brand=Brand.MAKITA, supplier="Test", part_number="P1", ean="0088381694049",
+        ))
+        spapi = MagicMock()
+        spapi.search_catalog_by_identifiers_batch.return_value = {
+            "0088381694049": [{"asin": "B07RBJYQQN", "summaries": []}],
+        }
+
+        worker = AsinSearchWorker([item.id])
+        found = []
+        finished = []
+        worker.item_found.connect(lambda *args: found.append(args))
+        worker.finished_signal.connect(lambda *args: finished.append(args))
+        with patch('src.api.spapi.SpApiClient', return_value=spapi), \
+                patch('src.core.config.get_settings'), \
+                patch('src.db.repository.Repository.save_asin_candidates_upsert',
+                      side_effect=RuntimeError("database is locked")):
+            worker.run()
+
+        assert found == []
+        assert finished == [(0, 0)]
+        assert temp_repo.get_candidates_by_supplier_item(item.id) == []
+
+    def test_run_dedups_repeated_items(self, qtbot, temp_repo):
+        """An item id passed twice is only written once."""
+        from src.core.models import SupplierItem
+        from src.gui.imports_tab import AsinSearchWorker
+
+        item = temp_repo.save_supplier_item(SupplierItem(
+            brand=Brand.MAKITA, supplier="Test", part_number="P1", ean="0088381694049",
+        ))
+        spapi = MagicMock()
+        spapi.search_catalog_by_identifiers_batch.return_value = {
+            "0088381694049": [{"asin": "B07RBJYQQN", "summaries": []}],
+        }
+
+        worker = AsinSearchWorker([item.id, item.id])
+        worker.FETCH_CHUNK = 1  # Each copy is loaded by its own query
+        finished = []
+        worker.finished_signal.connect(lambda *args: finished.append(args))
+        with patch('src.api.spapi.SpApiClient', return_value=spapi), \
+                patch('src.core.config.get_settings'):
+            worker.run()
+
+        assert finished == [(1, 1)]
+
+    def test_run_handles_concurrent_batches(self, qtbot, temp_repo):
+        """Every batch is processed when several requests are in flight."""
+        from src.core.models import SupplierItem
+        from src.gui.imports_tab import AsinSearchWorker
+
+        eans = ["5035048641811", "5035048641812", "5035048641813"]
+        items = [
+            temp_repo.save_supplier_item(SupplierItem(
+                brand=Brand.DEWALT, supplier="Test", part_number=f"P{i}", ean=ean,
+            ))
+            for i, ean in enumerate(eans)
+        ]
+        spapi = MagicMock()
+        spapi.search_catalog_by_identifiers_batch.side_effect = lambda batch, _type: {
+            ean: [{"asin": f"B00000000{ean[-1]}", "summaries": []}] for ean in batch
+        }
+
+        worker = AsinSearchWorker([item.id for item in items])
+        worker.BATCH_SIZE = 1
+        finished = []
+        worker.finished_signal.connect(lambda *args: finished.append(args))
+        with patch('src.api.spapi.SpApiClient', return_value=spapi), \
+                patch('src.core.config.get_settings'):
+            worker.run()
+
+        assert finished == [(3, 3)]
+        assert spapi.search_catalog_by_identifiers_batch.call_count == 3
+        for item in items:
+            assert len(temp_repo.get_candidates_by_supplier_item(item.id)) == 1
+
+    def test_run_inserts_batch_in_one_call(self, qtbot, temp_repo):
+        """New candidates from one API batch are written with a single upsert."""
+        from src.core.models import SupplierItem
+        from src.db.repository import Repository
+        from src.gui.imports_tab import AsinSearchWorker
+
+        eans = ["5035048641811", "5035048641812", "5035048641813"]
+        items = [
+            temp_repo.save_supplier_item(SupplierItem(
+                brand=Brand.DEWALT, supplier="Test", part_number=f"P{i}", ean=ean,
+            ))
+            for i, ean in enumerate(eans)
+        ]
+        spapi = MagicMock()
+        spapi.search_catalog_by_identifiers_batch.side_effect = lambda batch, _type: {
+            ean: [{"asin": f"B00000000{ean[-1]}", "summaries": []}] for ean in batch
+        }
+
+        worker = AsinSearchWorker([item.id for item in items])
+        upsert = Repository.save_asin_candidates_upsert
+        with patch('src.api.spapi.SpApiClient', return_value=spapi), \
+                patch('src.core.config.get_settings'), \
+                patch.object(
+                    Repository, 'save_asin_candidates_upsert', autospec=True, side_effect=upsert,
+                ) as spy:
+            worker.run()
+
+        assert spy.call_count == 1
+        assert len(spy.call_args.args[1]) == 3
+
+    def test_run_skips_api_for_cached_eans(self, qtbot, temp_repo):
+        """EANs with a fresh cache entry are not sent to SP-API."""
+        from src.core.models import SupplierItem
+        from src.gui.imports_tab import AsinSearchWorker
+
+        item = temp_repo.save_supplier_item(SupplierItem(
+            brand=Brand.MAKITA, supplier="Test", part_number="P1", ean="0088381694049",
+        ))
+        temp_repo.cache_catalog_items({
+            "0088381694049": [{"asin": "B07RBJYQQN", "summaries": []}],
+        })
+        spapi = MagicMock()
+
+        worker = AsinSearchWorker([item.id])
+        with patch('src.api.spapi.SpApiClient', return_value=spapi), \
+                patch('src.core.config.get_settings'):
+            worker.run()
+
+        spapi.search_catalog_by_identifiers_batch.assert_not_called()
+        candidates = temp_repo.get_candidates_by_supplier_item(item.id)
+        assert [c.asin for c in candidates] == ["B07RBJYQQN"]
+
+
+class TestAsinSearchWorkerSingle:
+    """Tests for the mappings-tab ASIN search worker."""
+
+    def test_run_writes_batch_against_existing_candidates(self, qtbot, temp_repo):
+        """Known ASINs are skipped, the placeholder is filled and unmatched items marked."""
+        from src.core.models import AsinCandidate, SupplierItem
+        from src.gui.mappings_tab import AsinSearchWorkerSingle
+
+        matched = temp_repo.save_supplier_item(SupplierItem(
+            brand=Brand.MAKITA, supplier="Test", part_number="P1", ean="0088381694049",
+        ))
+        unmatched = temp_repo.save_supplier_item(SupplierItem(
+            brand=Brand.MAKITA, supplier="Test", part_number="P2", ean="0088381694056",
+        ))
+        temp_repo.save_asin_candidates_upsert([
+            AsinCandidate(supplier_item_id=matched.id, asin="B000000001"),
+            AsinCandidate(supplier_item_id=matched.id, asin=""),
+            AsinCandidate(supplier_item_id=unmatched.id, asin=""),
+        ])
+        spapi = MagicMock()
+        spapi.search_catalog_by_identifiers_batch.return_value = {
+            "0088381694049": [
+                {"asin": asin, "summaries": []}
+                for asin in ("B000000001", "B000000002", "B000000003", "B000000003")
+            ],
+            "0088381694056": [],
+        }
+
+        worker = AsinSearchWorkerSingle([matched, unmatched], temp_repo, spapi)
+        finished = []
+        worker.finished_signal.connect(lambda *args: finished.append(args))
+        worker.run()
+
+        assert finished == [(1, 2)]
+        candidates = temp_repo.get_candidates_by_supplier_item(matched.id)
+        assert sorted(c.asin for c in candidates) == ["B000000001", "B000000002", "B000000003"]
+        assert [c.asin for c in candidates if c.is_primary] == ["B000000003"]
+        assert temp_repo.get_item_ids_without_asins([Brand.MAKITA]) == set()
+
+    def test_cancel_skips_pending_batches(self, qtbot, temp_repo):
+        """Batches not yet sent when the search is cancelled never reach SP-API."""
+        from src.core.models import SupplierItem
+        from src.gui.mappings_tab import AsinSearchWorkerSingle
+
+        eans = ["503504864181", "503504864182", "503504864183", "503504864184"]
+        items = [
+            temp_repo.save_supplier_item(SupplierItem(
+                brand=Brand.DEWALT, supplier="Test", part_number=f"P{i}", ean=ean,
+            ))
+            for i, ean in enumerate(eans)
+        ]
+        spapi = MagicMock()
+        worker = AsinSearchWorkerSingle(items, temp_repo, spapi)
+        worker.BATCH_SIZE = 1
+
+        def search(batch, _type):
+            worker.cancel()
+            return {ean: [] for ean in batch}
+
+        spapi.search_catalog_by_identifiers_batch.side_effect = search
+        worker.run()
+
+        assert spapi.search_catalog_by_identifiers_batch.call_count <= worker.MAX_WORKERS
+
+    def test_progress_is_throttled(self, qtbot, temp_repo):
+        """Fast batches are coalesced, but the last batch always reports."""
+        from src.core.models import SupplierItem
+        from src.gui.mappings_tab import AsinSearchWorkerSingle
+
+        eans = ["503504864181", "503504864182", "503504864183", "503504864184"]
+        items = [
+            temp_repo.save_supplier_item(SupplierItem(
+                brand=Brand.DEWALT, supplier="Test", part_number=f"P{i}", ean=ean,
+            ))
+            for i, ean in enumerate(eans)
+        ]
+        spapi = MagicMock()
+        spapi.search_catalog_by_identifiers_batch.side_effect = lambda batch, _type: {
+            ean: [] for ean in batch
+        }
+
+        worker = AsinSearchWorkerSingle(items, temp_repo, spapi)
+        worker.BATCH_SIZE = 1
+        worker.PROGRESS_INTERVAL = 60
+        progress = []
+        worker.progress.connect(lambda *args: progress.append(args))
+        worker.run()
+
+        # The "found N unique EANs" notice, the first batch and the last
+        assert len(progress) == 3
+        assert progress[-1][2].startswith("Batch 4/4")
+
 
 class TestMappingsTab:
     """Tests for MappingsTab widget."""
@@ -394,3 +1059,378 @@ class TestMappingsTab:
             # Check key widgets exist
             assert hasattr(tab, 'brand_filter')
             assert hasattr(tab, 'items_tree')
+
+    def test_filters_hide_loaded_rows_without_requery(self, qtbot):
+        """Brand and search filters work on the loaded rows, not the database."""
+        from src.core.models import SupplierItem
+        from src.gui.mappings_tab import MappingsTab
+
+        items = {
+            Brand.MAKITA: [
+                SupplierItem(id=1, brand=Brand.MAKITA, part_number="DHP482Z", ean="0088381694049"),
+                SupplierItem(id=2, brand=Brand.MAKITA, part_number="DTD153Z"),
+            ],
+            Brand.DEWALT: [SupplierItem(id=3, brand=Brand.DEWALT, part_number="DCD776C2")],
+        }
+        with patch('src.gui.mappings_tab.Repository') as repo_cls:
+            repo = repo_cls.return_value
+            repo.get_supplier_items_by_brands.side_effect = (
+                lambda brands: [item for brand in brands for item in items.get(brand, [])]
+            )
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+            tab.refresh_data()
+            repo.get_supplier_items_by_brands.reset_mock()
+
+            def visible():
+                model = tab.items_model
+                return [
+                    model.get_item(row).part_number
+                    for row in range(model.rowCount())
+                    if not tab.items_tree.isRowHidden(row, QModelIndex())
+                ]
+
+            assert visible() == ["DHP482Z", "DTD153Z", "DCD776C2"]
+
+            tab.search_input.setText("d")
+            tab.search_input.setText("dhp")
+            assert tab._filter_timer.isActive()
+            tab._filter_timer.timeout.emit()
+            assert visible() == ["DHP482Z"]
+
+            tab.search_input.setText("69404")
+            tab.brand_filter.setCurrentText("DeWalt")
+            assert visible() == []
+
+            repo.get_supplier_items_by_brands.assert_not_called()
+
+    def test_widening_filter_shows_rows_again(self, qtbot):
+        """Rows hidden by a narrower search reappear when the search is shortened."""
+        from src.core.models import SupplierItem
+        from src.gui.mappings_tab import MappingsTab
+
+        items = [
+            SupplierItem(id=1, brand=Brand.MAKITA, part_number="DHP482Z"),
+            SupplierItem(id=2, brand=Brand.MAKITA, part_number="DTD153Z"),
+        ]
+        with patch('src.gui.mappings_tab.Repository') as repo_cls:
+            repo_cls.return_value.get_supplier_items_by_brands.return_value = items
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+            tab.refresh_data()
+
+            def visible():
+                model = tab.items_model
+                return [
+                    model.get_item(row).part_number
+                    for row in range(model.rowCount())
+                    if not tab.items_tree.isRowHidden(row, QModelIndex())
+                ]
+
+            for text, expected in [
+                ("dh", ["DHP482Z"]),
+                ("dhp4", ["DHP482Z"]),
+                ("dhx", []),
+                ("d", ["DHP482Z", "DTD153Z"]),
+                ("", ["DHP482Z", "DTD153Z"]),
+            ]:
+                tab.search_input.setText(text)
+                tab._apply_filter()
+                assert visible() == expected, text
+
+
+    def test_selecting_item_loads_its_candidates(self, qtbot):
+        """The current row's candidates are shown until a filter hides it."""
+        from src.core.models import AsinCandidate, SupplierItem
+        from src.gui.mappings_tab import MappingsTab
+
+        items = [
+            SupplierItem(id=1, brand=Brand.MAKITA, part_number="DHP482Z"),
+            SupplierItem(id=2, brand=Brand.MAKITA, part_number="DTD153Z"),
+        ]
+        candidate = AsinCandidate(id=5, supplier_item_id=2, asin="B000000005")
+        with patch('src.gui.mappings_tab.Repository') as repo_cls:
+            repo = repo_cls.return_value
+            repo.get_supplier_items_by_brands.return_value = items
+            repo.get_candidates_by_supplier_item.return_value = [candidate]
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+            tab.refresh_data()
+
+            tab.items_tree.setCurrentIndex(tab.items_model.index(1, 0))
+            repo.get_candidates_by_supplier_item.assert_called_once_with(2, active_only=False)
+            assert tab.candidate_model.rowCount() == 1
+
+            tab.search_input.setText("dhp")
+            tab._apply_filter()
+            assert not tab.items_tree.currentIndex().isValid()
+            assert tab.candidate_model.rowCount() == 0
+
+    def test_reselecting_item_reuses_its_candidates(self, qtbot):
+        """Returning to a viewed item doesn't re-read it; an edit or refresh does."""
+        from src.core.models import AsinCandidate, SupplierItem
+        from src.gui.mappings_tab import MappingsTab
+
+        items = [
+            SupplierItem(id=1, brand=Brand.MAKITA, part_number="DHP482Z"),
+            SupplierItem(id=2, brand=Brand.MAKITA, part_number="DTD153Z"),
+        ]
+        with patch('src.gui.mappings_tab.Repository') as repo_cls:
+            repo = repo_cls.return_value
+            repo.get_supplier_items_by_brands.return_value = items
+            repo.get_candidates_by_supplier_item.side_effect = lambda item_id, active_only: [
+                AsinCandidate(id=item_id, supplier_item_id=item_id, asin=f"B00000000{item_id}")
+            ]
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+            tab.refresh_data()
+
+            for row in (1, 0, 1):
+                tab.items_tree.setCurrentIndex(tab.items_model.index(row, 0))
+            assert repo.get_candidates_by_supplier_item.call_count == 2
+
+            tab.candidate_table.selectRow(0)
+            tab._on_toggle_lock()
+            tab.items_tree.setCurrentIndex(tab.items_model.index(0, 0))
+            tab.items_tree.setCurrentIndex(tab.items_model.index(1, 0))
+            assert repo.get_candidates_by_supplier_item.call_count == 3
+
+            tab.refresh_data()
+            assert repo.get_candidates_by_supplier_item.call_count == 4
+
+    def test_cached_candidates_expire_and_are_not_shared(self, qtbot):
+        """Other writers' candidates show up after the TTL; edits stay out of the cache."""
+        from src.core.models import AsinCandidate, SupplierItem
+        from src.gui.mappings_tab import MappingsTab
+
+        items = [
+            SupplierItem(id=1, brand=Brand.MAKITA, part_number="DHP482Z"),
+            SupplierItem(id=2, brand=Brand.MAKITA, part_number="DTD153Z"),
+        ]
+        with patch('src.gui.mappings_tab.Repository') as repo_cls, \
+                patch('src.gui.mappings_tab.time.monotonic') as monotonic:
+            monotonic.return_value = 100.0
+            repo = repo_cls.return_value
+            repo.get_supplier_items_by_brands.return_value = items
+            repo.get_candidates_by_supplier_item.side_effect = lambda item_id, active_only: [
+                AsinCandidate(id=item_id, supplier_item_id=item_id, asin=f"B00000000{item_id}")
+            ]
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+            tab.refresh_data()
+
+            tab.items_tree.setCurrentIndex(tab.items_model.index(0, 0))
+            cached = tab._candidate_cache[1][1]
+            assert tab.candidate_model._candidates is not cached
+
+            tab.items_tree.setCurrentIndex(tab.items_model.index(1, 0))
+            monotonic.return_value += MappingsTab.CANDIDATE_CACHE_TTL
+            tab.items_tree.setCurrentIndex(tab.items_model.index(0, 0))
+            assert repo.get_candidates_by_supplier_item.call_count == 3
+
+    def test_toggle_active_reports_candidate_brand(self, qtbot):
+        """A status change names the brand whose scores it affects."""
+        from src.core.models import AsinCandidate
+        from src.gui.mappings_tab import MappingsTab
+
+        candidate = AsinCandidate(id=5, supplier_item_id=1, brand=Brand.DEWALT, asin="B000000005")
+        with patch('src.gui.mappings_tab.Repository') as repo_cls:
+            repo_cls.return_value.get_candidates_by_supplier_item.return_value = [candidate]
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+            tab.candidate_model.set_candidates([candidate])
+            tab.candidate_table.selectRow(0)
+
+            with qtbot.waitSignal(tab.mapping_updated) as blocker:
+                tab._on_toggle_active()
+
+        assert blocker.args == ["DeWalt"]
+        repo_cls.return_value.update_candidate_status.assert_called_once_with(5, is_active=False)
+        repo_cls.return_value.get_candidates_by_supplier_item.assert_not_called()
+        assert tab.candidate_model.data(tab.candidate_model.index(0, 4)) == "No"
+
+    def test_set_primary_updates_rows_in_place(self, qtbot):
+        """Set Primary moves the flag in the table without re-reading candidates."""
+        from src.core.models import AsinCandidate
+        from src.gui.mappings_tab import MappingsTab
+
+        candidates = [
+            AsinCandidate(id=5, supplier_item_id=1, asin="B000000005", is_primary=True),
+            AsinCandidate(id=6, supplier_item_id=1, asin="B000000006"),
+        ]
+        with patch('src.gui.mappings_tab.Repository') as repo_cls:
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+            model = tab.candidate_model
+            model.set_candidates(candidates)
+            tab.candidate_table.selectRow(1)
+            changed = []
+            model.dataChanged.connect(lambda top, bottom, _roles: changed.append((top.row(), bottom.row())))
+
+            tab._on_set_primary()
+
+        repo_cls.return_value.set_primary_candidate.assert_called_once_with(1, 6)
+        repo_cls.return_value.get_candidates_by_supplier_item.assert_not_called()
+        assert [model.get_candidate(row).is_primary for row in range(2)] == [False, True]
+        assert sorted(changed) == [(0, 0), (1, 1)]
+
+    def test_supplier_items_reused_until_reload(self, qtbot):
+        """Handlers share a recent fetch; refresh and mapping updates refetch."""
+        from src.gui.mappings_tab import MappingsTab
+
+        with patch('src.gui.mappings_tab.Repository') as repo_cls:
+            repo = repo_cls.return_value
+            repo.get_supplier_items_by_brands.return_value = []
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+
+            tab._get_items((Brand.MAKITA,))
+            tab._get_items((Brand.MAKITA,))
+            repo.get_supplier_items_by_brands.assert_called_once_with([Brand.MAKITA])
+
+            tab.mapping_updated.emit(Brand.MAKITA.value)
+            tab._get_items((Brand.MAKITA, Brand.DEWALT))
+            assert repo.get_supplier_items_by_brands.call_args.args == ([Brand.MAKITA, Brand.DEWALT],)
+
+            repo.get_supplier_items_by_brands.reset_mock()
+            tab.refresh_data()
+            tab._get_items((Brand.MAKITA,))
+            repo.get_supplier_items_by_brands.assert_called_once_with(list(Brand))
+
+    def test_spapi_client_reused_until_settings_reload(self, qtbot):
+        """Searches share one SP-API client; reloaded settings get a new one."""
+        from src.gui.mappings_tab import MappingsTab
+
+        first, second = MagicMock(), MagicMock()
+        with patch('src.gui.mappings_tab.Repository'), \
+                patch('src.gui.mappings_tab.get_settings', side_effect=[first, first, second]), \
+                patch('src.gui.mappings_tab.SpApiClient', side_effect=lambda s: MagicMock(settings=s)):
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+
+            client = tab._get_spapi()
+            assert tab._get_spapi() is client
+            assert tab._get_spapi().settings is second
+
+
+    def test_reload_keeps_filtered_rows_hidden(self, qtbot):
+        """A reload adding an item keeps the filter applied to kept and new rows."""
+        from src.core.models import SupplierItem
+        from src.gui.mappings_tab import MappingsTab
+
+        items = [
+            SupplierItem(id=1, brand=Brand.MAKITA, part_number="DHP482Z"),
+            SupplierItem(id=3, brand=Brand.MAKITA, part_number="DTD153Z"),
+        ]
+        with patch('src.gui.mappings_tab.Repository') as repo_cls:
+            repo = repo_cls.return_value
+            repo.get_supplier_items_by_brands.side_effect = lambda _brands: list(items)
+            tab = MappingsTab()
+            qtbot.addWidget(tab)
+            tab.refresh_data()
+            tab.search_input.setText("dhp")
+            tab._apply_filter()
+
+            items.insert(1, SupplierItem(id=2, brand=Brand.MAKITA, part_number="DHP483Z"))
+            tab.refresh_data()
+
+            model = tab.items_model
+            assert [
+                model.get_item(row).part_number
+                for row in range(model.rowCount())
+                if not tab.items_tree.isRowHidden(row, QModelIndex())
+            ] == ["DHP482Z", "DHP483Z"]
+            assert tab._row_hidden == [False, False, True]
+
+
+class TestCandidateTableModel:
+    """Tests for the mappings tab candidate model."""
+
+    def test_same_candidates_update_in_place(self, qtbot):
+        """Re-reading the same candidates emits dataChanged instead of a reset."""
+        from src.core.models import AsinCandidate
+        from src.gui.mappings_tab import CandidateTableModel
+
+        model = CandidateTableModel()
+        model.set_candidates([
+            AsinCandidate(id=1, asin="B000000001"),
+            AsinCandidate(id=2, asin="B000000002"),
+        ])
+
+        resets, changes = [], []
+        model.modelReset.connect(lambda: resets.append(True))
+        model.dataChanged.connect(lambda top, bottom, roles: changes.append((top.row(), bottom.row())))
+
+        model.set_candidates([
+            AsinCandidate(id=1, asin="B000000001", is_active=False),
+            AsinCandidate(id=2, asin="B000000002"),
+        ])
+        assert not resets
+        assert changes == [(0, 1)]
+        assert model.data(model.index(0, 4)) == "No"
+
+        model.set_candidates([AsinCandidate(id=3, asin="B000000003")])
+        assert resets == [True]
+        assert model.rowCount() == 1
+
+    def test_display_and_background(self, qtbot):
+        """Cells show each column's text and confidence-banded backgrounds."""
+        from src.core.models import AsinCandidate
+        from src.gui.mappings_tab import CandidateTableModel
+
+        model = CandidateTableModel()
+        model.set_candidates([
+            AsinCandidate(id=1, asin="B000000001", confidence_score=Decimal("0.8"), is_locked=True),
+            AsinCandidate(id=2, asin="B000000002", confidence_score=Decimal("0.3"), is_primary=True),
+        ])
+
+        texts = [model.data(model.index(0, col)) for col in range(model.columnCount())]
+        assert texts == ["B000000001", "", "80%", "spapi_keyword", "Yes", "", "Locked"]
+
+        background = Qt.ItemDataRole.BackgroundRole
+        assert model.data(model.index(0, 2), background).getRgb()[:3] == (230, 255, 230)
+        assert model.data(model.index(0, 0), background) is None
+        assert model.data(model.index(1, 0), background).getRgb()[:3] == (220, 255, 220)
+
+
+class TestSupplierItemModel:
+    """Tests for the mappings tab supplier item model."""
+
+    def test_display_text_and_unhandled_roles(self, qtbot):
+        """Columns show the item fields; roles the model doesn't serve return None."""
+        from src.core.models import SupplierItem
+        from src.gui.mappings_tab import SupplierItemModel
+
+        model = SupplierItemModel()
+        model.set_items([SupplierItem(
+            id=7, brand=Brand.TIMCO, supplier="Test", part_number="C50", ean="5012345678900", mpn="M1",
+        )])
+
+        texts = [model.data(model.index(0, col)) for col in range(model.columnCount())]
+        assert texts == ["C50", "Timco", "Test", "5012345678900", "M1"]
+        assert model.data(model.index(0, 0), Qt.ItemDataRole.UserRole) == 7
+        assert model.data(model.index(0, 0), Qt.ItemDataRole.ToolTipRole) is None
+
+    def test_reload_inserts_and_removes_rows_without_reset(self, qtbot):
+        """Items matched by id keep their rows; only the differences are signalled."""
+        from src.core.models import SupplierItem
+        from src.gui.mappings_tab import SupplierItemModel
+
+        def items(*ids):
+            return [SupplierItem(id=i, part_number=f"P{i}") for i in ids]
+
+        model = SupplierItemModel()
+        model.set_items(items(1, 2, 3, 4))
+        events = []
+        model.modelReset.connect(lambda: events.append("reset"))
+        model.rowsRemoved.connect(lambda _p, first, last: events.append(("removed", first, last)))
+        model.rowsInserted.connect(lambda _p, first, last: events.append(("inserted", first, last)))
+
+        model.set_items(items(1, 5, 6, 3))
+
+        assert events == [("removed", 3, 3), ("removed", 1, 1), ("inserted", 1, 2)]
+        assert [model.get_item(row).id for row in range(model.rowCount())] == [1, 5, 6, 3]
+
+        model.set_items(items(7))
+        assert events[-1] == "reset"
+
@@ -57,6 +57,7 @@ class TestMigrations:
                 "brand_settings",
                 "global_settings",
                 "api_logs",
+                "spapi_ean_cache",
             }
 
             assert expected_tables.issubset(tables), f"Missing tables: {expected_tables - tables}"
@@ -105,3 +106,66 @@ class TestMigrations:
                 close_database()
         finally:
             Path(db_path).unlink(missing_ok=True)
+
+    def test_unique_asin_migration_keeps_flagged_duplicate_and_history(self):
+        """Test that 002 merges duplicate mappings without orphaning snapshots."""
+        from alembic import command
+        from alembic.config import Config
+        from sqlalchemy import text
+
+        import src
+        package_dir = Path(src.__file__).parent.parent
+
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            db_path = f.name
+
+        try:
+            alembic_cfg = Config(str(package_dir / "alembic.ini"))
+            alembic_cfg.set_main_option("script_location", str(package_dir / "migrations"))
+
+            with patch('src.core.config.get_db_path', return_value=Path(db_path)):
+                command.upgrade(alembic_cfg, "001")
+
+                engine = create_engine(f"sqlite:///{db_path}")
+                with engine.begin() as conn:
+                    conn.execute(text(
+                        "INSERT INTO supplier_items (id, brand, supplier, part_number) "
+                        "VALUES (1, 'Makita', 'Supplier', 'P1')"
+                    ))
+                    # Oldest row is plain; the locked, primary duplicate came later
+                    for cid, locked, primary in ((1, 0, 0), (2, 1, 1), (3, 0, 0)):
+                        conn.execute(text(
+                            "INSERT INTO asin_candidates (id, supplier_item_id, brand, supplier, "
+                            "part_number, asin, is_locked, is_primary) "
+                            "VALUES (:id, 1, 'Makita', 'Supplier', 'P1', 'B000000001', :l, :p)"
+                        ), {"id": cid, "l": locked, "p": primary})
+                        conn.execute(text(
+                            "INSERT INTO keepa_snapshots (candidate_id, asin) "
+                            "VALUES (:id, 'B000000001')"
+                        ), {"id": cid})
+                        conn.execute(text(
+                            "INSERT INTO spapi_snapshots (candidate_id, asin) "
+                            "VALUES (:id, 'B000000001')"
+                        ), {"id": cid})
+                        conn.execute(text(
+                            "INSERT INTO score_history (candidate_id, asin) "
+                            "VALUES (:id, 'B000000001')"
+                        ), {"id": cid})
+
+                command.upgrade(alembic_cfg, "002")
+
+                with engine.connect() as conn:
+                    rows = conn.execute(text(
+                        "SELECT id, is_locked, is_primary FROM asin_candidates"
+                    )).all()
+                    assert [tuple(r) for r in rows] == [(2, 1, 1)]
+
+                    for table in ("keepa_snapshots", "spapi_snapshots", "score_history"):
+                        ids = conn.execute(text(f"SELECT candidate_id FROM {table}")).scalars().all()
+                        assert ids == [2, 2, 2], table
+
+                    indexes = {ix["name"] for ix in inspect(conn).get_indexes("asin_candidates")}
+                    assert "ux_asin_candidates_item_asin" in indexes
+                engine.dispose()
+        finally:
+            Path(db_path).unlink(missing_ok=True)
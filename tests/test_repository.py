@@ -1,3 +1,5 @@
+import pytest
+
 
 class TestTokenUsageStats:
     """Tests for token usage statistics."""
@@ -12,3 +14,375 @@ class TestTokenUsageStats:
         assert "total_calls" in stats
         assert "success_count" in stats
         assert stats["total_tokens"] == 0
+
+
+def _save_item(repo, part_number="P1"):
+    from src.core.models import Brand, SupplierItem
+
+    return repo.save_supplier_item(
+        SupplierItem(brand=Brand.MAKITA, supplier="Test", part_number=part_number)
+    )
+
+
+class TestCandidateUpsert:
+    """Tests for save_asin_candidates_upsert."""
+
+    def test_existing_mappings_are_skipped(self, temp_repo):
+        """Rows already stored, or repeated in the input, return None."""
+        from src.core.models import AsinCandidate
+
+        item = _save_item(temp_repo)
+
+        first = temp_repo.save_asin_candidates_upsert([
+            AsinCandidate(supplier_item_id=item.id, asin="B000000001"),
+            AsinCandidate(supplier_item_id=item.id, asin="B000000001"),
+        ])
+        second = temp_repo.save_asin_candidates_upsert([
+            AsinCandidate(supplier_item_id=item.id, asin="B000000001"),
+            AsinCandidate(supplier_item_id=item.id, asin="B000000002"),
+        ])
+
+        assert first[0] is not None and first[1] is None
+        assert second[0] is None and second[1] is not None
+        assert len(temp_repo.get_candidates_by_supplier_item(item.id)) == 2
+
+
+class TestCandidateByAsin:
+    """Tests for get_candidate_by_asin."""
+
+    def test_sees_writes_from_other_repositories(self, temp_repo):
+        """Each lookup reads the database, so another instance's update shows up."""
+        from src.core.models import AsinCandidate
+        from src.db.repository import Repository
+
+        item = _save_item(temp_repo)
+        temp_repo.save_asin_candidates_upsert([
+            AsinCandidate(supplier_item_id=item.id, asin="B000000001"),
+        ])
+        candidate = temp_repo.get_candidate_by_asin(item.id, "B000000001")
+        assert candidate.is_active
+
+        Repository().update_candidate_status(candidate.id, is_active=False)
+
+        assert not temp_repo.get_candidate_by_asin(item.id, "B000000001").is_active
+
+
+class TestSupplierItemsByIds:
+    """Tests for get_supplier_items_by_ids."""
+
+    def test_fetches_requested_items(self, temp_repo):
+        """Only the requested ids are returned."""
+        first = _save_item(temp_repo, "P1")
+        _save_item(temp_repo, "P2")
+        third = _save_item(temp_repo, "P3")
+
+        items = temp_repo.get_supplier_items_by_ids([first.id, third.id])
+
+        assert sorted(item.part_number for item in items) == ["P1", "P3"]
+        assert temp_repo.get_supplier_items_by_ids([]) == []
+
+
+class TestSupplierItemsByBrands:
+    """Tests for get_supplier_items_by_brands."""
+
+    def test_fetches_items_of_requested_brands(self, temp_repo):
+        """Items of every requested brand come back from one call, by part number."""
+        from src.core.models import Brand, SupplierItem
+
+        temp_repo.save_supplier_item(SupplierItem(brand=Brand.MAKITA, part_number="P2"))
+        temp_repo.save_supplier_item(SupplierItem(brand=Brand.DEWALT, part_number="P1"))
+        temp_repo.save_supplier_item(SupplierItem(brand=Brand.TIMCO, part_number="P3"))
+
+        items = temp_repo.get_supplier_items_by_brands([Brand.MAKITA, Brand.DEWALT])
+
+        assert [item.part_number for item in items] == ["P1", "P2"]
+        assert temp_repo.get_supplier_items_by_brands([]) == []
+
+
+class TestTransaction:
+    """Tests for Repository.transaction."""
+
+    def test_commits_on_exit(self, temp_repo):
+        """Writes inside the block are visible after it closes."""
+        with temp_repo.transaction():
+            first = _save_item(temp_repo, "P1")
+            second = _save_item(temp_repo, "P2")
+
+        assert len(temp_repo.get_supplier_items_by_ids([first.id, second.id])) == 2
+
+    def test_rolls_back_on_error(self, temp_repo):
+        """An exception discards every write made in the block."""
+        from src.core.models import Brand
+
+        with pytest.raises(RuntimeError):
+            with temp_repo.transaction():
+                _save_item(temp_repo, "P1")
+                with temp_repo.transaction():
+                    _save_item(temp_repo, "P2")
+                raise RuntimeError("boom")
+
+        assert temp_repo.get_supplier_items_by_brand(Brand.MAKITA) == []
+
+
+class TestCandidatesForItems:
+    """Tests for get_candidates_for_items."""
+
+    def test_groups_by_item_and_asin(self, temp_repo):
+        """Candidates are keyed by item id and ASIN, with "" for placeholders."""
+        from src.core.models import AsinCandidate
+
+        first = _save_item(temp_repo, "P1")
+        second = _save_item(temp_repo, "P2")
+        temp_repo.save_asin_candidates_upsert([
+            AsinCandidate(supplier_item_id=first.id, asin="B000000001"),
+            AsinCandidate(supplier_item_id=first.id, asin=""),
+        ])
+
+        result = temp_repo.get_candidates_for_items([first.id, second.id])
+
+        assert set(result[first.id]) == {"B000000001", ""}
+        assert result[second.id] == {}
+
+
+class TestItemIdsWithoutAsins:
+    """Tests for get_item_ids_without_asins."""
+
+    def test_skips_mapped_and_searched_items(self, temp_repo):
+        """Items with an ASIN, or an EAN search on record, need no search."""
+        from src.core.models import AsinCandidate, Brand
+
+        mapped = _save_item(temp_repo, "P1")
+        searched = _save_item(temp_repo, "P2")
+        placeholder = _save_item(temp_repo, "P3")
+        bare = _save_item(temp_repo, "P4")
+        _, searched_id, _ = temp_repo.save_asin_candidates_upsert([
+            AsinCandidate(supplier_item_id=mapped.id, asin="B000000001"),
+            AsinCandidate(supplier_item_id=searched.id, asin=""),
+            AsinCandidate(supplier_item_id=placeholder.id, asin=""),
+        ])
+        temp_repo.mark_search_attempted(searched_id)
+
+        assert temp_repo.get_item_ids_without_asins([Brand.MAKITA]) == {placeholder.id, bare.id}
+        assert temp_repo.get_item_ids_without_asins([Brand.DEWALT]) == set()
+
+
+class TestExistingPairs:
+    """Tests for get_existing_pairs."""
+
+    def test_returns_only_stored_pairs(self, temp_repo):
+        """Pairs are matched on brand and part number together."""
+        _save_item(temp_repo, "P1")
+
+        existing = temp_repo.get_existing_pairs([
+            ("Makita", "P1"),
+            ("Makita", "P2"),
+            ("DeWalt", "P1"),
+        ])
+
+        assert existing == {("Makita", "P1")}
+
+
+class TestCatalogCache:
+    """Tests for the SP-API EAN cache."""
+
+    def test_round_trip_and_ttl(self, temp_repo):
+        """Cached entries are returned until they age past the TTL."""
+        temp_repo.cache_catalog_items({"5035048641811": [{"asin": "B000000001"}]})
+        temp_repo.cache_catalog_items({"5035048641811": [{"asin": "B000000002"}]})
+
+        assert temp_repo.get_cached_catalog_items(["5035048641811", "123"]) == {
+            "5035048641811": [{"asin": "B000000002"}],
+        }
+        assert temp_repo.get_cached_catalog_items(["5035048641811"], ttl_days=-1) == {}
+
+
+class TestClearOtherPrimariesBatch:
+    """Tests for clear_other_primaries_batch."""
+
+    def test_keeps_only_named_asin_primary(self, temp_repo):
+        """Each item keeps its own ASIN primary; other items are untouched."""
+        from src.core.models import AsinCandidate
+
+        first = _save_item(temp_repo, "P1")
+        second = _save_item(temp_repo, "P2")
+        temp_repo.save_asin_candidates_upsert([
+            AsinCandidate(supplier_item_id=first.id, asin="B000000001", is_primary=True),
+            AsinCandidate(supplier_item_id=first.id, asin="B000000002", is_primary=True),
+            AsinCandidate(supplier_item_id=second.id, asin="B000000003", is_primary=True),
+        ])
+
+        temp_repo.clear_other_primaries_batch([(first.id, "B000000002")])
+
+        fresh = type(temp_repo)()
+        primaries = {
+            c.asin: c.is_primary
+            for item in (first, second)
+            for c in fresh.get_candidates_by_supplier_item(item.id)
+        }
+        assert primaries == {"B000000001": False, "B000000002": True, "B000000003": True}
+        assert not temp_repo.get_candidate_by_asin(first.id, "B000000001").is_primary
+
+
+class TestForThread:
+    """Tests for per-thread repository instances."""
+
+    def test_owner_thread_gets_same_repository(self, temp_repo):
+        assert temp_repo.for_thread() is temp_repo
+
+    def test_other_thread_gets_its_own_repository(self, temp_repo):
+        import threading
+
+        seen = []
+
+        def worker():
+            seen.append(temp_repo.for_thread())
+            seen.append(temp_repo.for_thread())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen[0] is not temp_repo
+        assert seen[0] is seen[1]
+        _save_item(temp_repo, "P1")
+        assert seen[0].get_existing_pairs([("Makita", "P1")]) == {("Makita", "P1")}
+
+
+def _save_scored_candidate(repo, part_number, asin, scores=(), keepa_times=(), spapi_times=()):
+    from src.core.models import AsinCandidate, KeepaSnapshot, ScoreResult, SpApiSnapshot
+
+    item = _save_item(repo, part_number)
+    [cand_id] = repo.save_asin_candidates_upsert([
+        AsinCandidate(supplier_item_id=item.id, part_number=part_number, asin=asin)
+    ])
+    for score, when in scores:
+        repo.save_score_history(cand_id, ScoreResult(asin=asin, score=score, calculated_at=when))
+    for when in keepa_times:
+        repo.save_keepa_snapshot(cand_id, KeepaSnapshot(asin=asin, snapshot_time=when))
+    for when in spapi_times:
+        repo.save_spapi_snapshot(cand_id, SpApiSnapshot(asin=asin, snapshot_time=when))
+    return cand_id
+
+
+class TestLatestBrandBundle:
+    """Tests for get_latest_brand_bundle."""
+
+    def test_returns_latest_rows_per_candidate(self, temp_repo):
+        from datetime import datetime, timedelta
+
+        from src.core.models import Brand
+
+        now = datetime.now()
+        old, new = now - timedelta(hours=3), now - timedelta(minutes=5)
+        first = _save_scored_candidate(
+            temp_repo, "P1", "B000000001",
+            scores=[(40, old), (70, new)], keepa_times=[old, new], spapi_times=[old, new],
+        )
+        second = _save_scored_candidate(
+            temp_repo, "P2", "B000000002", scores=[(55, new)], spapi_times=[old],
+        )
+        _save_scored_candidate(temp_repo, "P3", "B000000003")  # never scored
+
+        bundle = temp_repo.get_latest_brand_bundle(Brand.MAKITA)
+
+        assert [row[0].id for row in bundle] == [first, second]
+        candidate, item, score, keepa, spapi = bundle[0]
+        assert item.part_number == "P1"
+        assert score.score == 70
+        assert keepa.snapshot_time == new
+        assert spapi.snapshot_time == new
+        # Latest SP-API snapshot is past its TTL; no Keepa data at all
+        assert bundle[1][2].score == 55
+        assert bundle[1][3] is None and bundle[1][4] is None
+
+    def test_matches_per_candidate_getters(self, temp_repo):
+        from datetime import datetime, timedelta
+
+        from src.core.models import Brand
+
+        now = datetime.now()
+        cand_id = _save_scored_candidate(
+            temp_repo, "P1", "B000000001",
+            scores=[(10, now - timedelta(hours=1)), (20, now)],
+            keepa_times=[now - timedelta(hours=1), now],
+            spapi_times=[now],
+        )
+
+        [(_, _, score, keepa, spapi)] = temp_repo.get_latest_brand_bundle(Brand.MAKITA)
+
+        assert score.id == temp_repo.get_latest_score(cand_id).id
+        assert keepa.id == temp_repo.get_latest_keepa_snapshot(cand_id).id
+        assert spapi.id == temp_repo.get_latest_spapi_snapshot(cand_id).id
+
+
+class TestScoreHistoryForCandidates:
+    """Tests for get_score_history_for_candidates."""
+
+    def test_limits_each_candidate_newest_first(self, temp_repo):
+        from datetime import datetime, timedelta
+
+        now = datetime.now()
+        first = _save_scored_candidate(
+            temp_repo, "P1", "B000000001",
+            scores=[(score, now - timedelta(minutes=score)) for score in (1, 2, 3)],
+        )
+        second = _save_scored_candidate(
+            temp_repo, "P2", "B000000002", scores=[(9, now)],
+        )
+        unscored = _save_scored_candidate(temp_repo, "P3", "B000000003")
+
+        history = temp_repo.get_score_history_for_candidates([first, second, unscored], limit=2)
+
+        assert [h.score for h in history[first]] == [1, 2]
+        assert [h.score for h in history[second]] == [9]
+        assert unscored not in history
+
+    def test_brand_history_matches_candidate_history(self, temp_repo):
+        from datetime import datetime, timedelta
+
+        from src.core.models import Brand
+
+        now = datetime.now()
+        first = _save_scored_candidate(
+            temp_repo, "P1", "B000000001",
+            scores=[(score, now - timedelta(minutes=score)) for score in (1, 2, 3)],
+        )
+        second = _save_scored_candidate(
+            temp_repo, "P2", "B000000002", scores=[(9, now)],
+        )
+
+        history = temp_repo.get_brand_score_history(Brand.MAKITA, limit=2)
+
+        assert history.keys() == {first, second}
+        assert [h.score for h in history[first]] == [1, 2]
+        assert temp_repo.get_brand_score_history(Brand.DEWALT) == {}
+
+
+class TestProfitHistory:
+    """Tests for get_profit_history_for_candidates and get_brand_profit_history."""
+
+    def test_limits_each_candidate_oldest_first(self, temp_repo):
+        from datetime import datetime, timedelta
+        from decimal import Decimal
+
+        from src.core.models import Brand, ProfitScenario, ScoreResult
+
+        now = datetime.now()
+        first = _save_scored_candidate(temp_repo, "P1", "B000000001")
+        second = _save_scored_candidate(temp_repo, "P2", "B000000002")
+        for cand_id, profit, when in [
+            (first, 1, now - timedelta(minutes=1)),
+            (first, 2, now - timedelta(minutes=2)),
+            (first, 3, now - timedelta(minutes=3)),
+            (second, 9, now),
+        ]:
+            temp_repo.save_score_history(cand_id, ScoreResult(
+                scenario_cost_5plus=ProfitScenario(profit_net=Decimal(profit)),
+                calculated_at=when,
+            ))
+
+        history = temp_repo.get_profit_history_for_candidates([first, second], limit=2)
+
+        assert history == {first: [2.0, 1.0], second: [9.0]}
+        assert temp_repo.get_brand_profit_history(Brand.MAKITA, limit=2) == history
+        assert temp_repo.get_profit_history_for_candidates([]) == {}
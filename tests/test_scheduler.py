@@ -0,0 +1,35 @@
+"""Tests for the background refresh scheduler."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from src.core.config import Settings
+from src.core.models import AsinCandidate, Brand, ScoreResult
+
+
+class TestRefreshWorker:
+    """Tests for RefreshWorker."""
+
+    def test_score_updates_emitted_once_per_flush(self, qtbot):
+        """Scores saved during a batch reach the GUI in one signal."""
+        from src.core.scheduler import RefreshWorker
+
+        with patch("src.core.scheduler.Repository"):
+            worker = RefreshWorker(Settings())
+        worker.repo.get_latest_score.return_value = None
+
+        emitted = []
+        worker.scores_updated.connect(emitted.append)
+        for cand_id, (brand, asin) in enumerate(
+            [(Brand.MAKITA, "B000000001"), (Brand.DEWALT, "B000000002")], start=1
+        ):
+            candidate = AsinCandidate(id=cand_id, brand=brand, asin=asin)
+            worker._save_score_and_check_alerts(candidate, ScoreResult(asin=asin, score=60 + cand_id))
+
+        assert emitted == []
+        worker._flush_score_updates()
+        worker._flush_score_updates()
+
+        assert emitted == [[("Makita", "B000000001", 61), ("DeWalt", "B000000002", 62)]]
+        assert worker.repo.save_score_history.call_count == 2
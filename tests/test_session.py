@@ -0,0 +1,56 @@
+"""Tests for database session management."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy import text
+
+
+class TestEnginePragmas:
+    """Tests for per-connection SQLite settings."""
+
+    def test_connection_uses_wal(self, tmp_path: Path):
+        """Test new connections enable WAL and relaxed syncing."""
+        import src.db.session as session_module
+
+        with patch("src.db.session.get_db_path", return_value=tmp_path / "wal.db"):
+            session_module._engine = None
+            session_module._session_factory = None
+            try:
+                engine = session_module.get_engine()
+                with engine.connect() as conn:
+                    assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                    assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+                    assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+                    assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+                    assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 30000
+            finally:
+                session_module.close_database()
+
+    def test_threads_get_separate_connections(self, tmp_path: Path):
+        """Test a worker thread reads on its own connection while another is checked out."""
+        import threading
+
+        import src.db.session as session_module
+
+        with patch("src.db.session.get_db_path", return_value=tmp_path / "pool.db"):
+            session_module._engine = None
+            session_module._session_factory = None
+            try:
+                engine = session_module.get_engine()
+                seen = []
+
+                def read() -> None:
+                    with engine.connect() as conn:
+                        seen.append((conn.connection.dbapi_connection, conn.execute(text("SELECT 1")).scalar()))
+
+                with engine.connect() as conn:
+                    worker = threading.Thread(target=read)
+                    worker.start()
+                    worker.join(timeout=5)
+                    assert seen and seen[0][1] == 1
+                    assert seen[0][0] is not conn.connection.dbapi_connection
+            finally:
+                session_module.close_database()
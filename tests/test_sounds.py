@@ -56,6 +56,36 @@ class TestSoundPlayer:
         player.play_alert()
         player.play_error()
 
+    def test_player_command_resolved_once(self):
+        """Test the player command is looked up once and reused."""
+        from unittest.mock import patch
+
+        player = SoundPlayer()
+        player._system = "Linux"
+        with patch("src.core.sounds.shutil.which", return_value="/usr/bin/paplay") as which, \
+                patch("src.core.sounds.subprocess.Popen") as popen:
+            popen.return_value.poll.return_value = 0  # finished
+            player.play(SoundEffect.ALERT)
+            player.play(SoundEffect.ALERT)
+
+        which.assert_called_once_with("paplay")
+        assert popen.call_count == 2
+        assert popen.call_args[0][0] == ["/usr/bin/paplay", SoundPlayer.LINUX_SOUND]
+
+    def test_play_skipped_while_previous_sound_runs(self):
+        """Test overlapping alerts do not stack up player processes."""
+        from unittest.mock import patch
+
+        player = SoundPlayer()
+        player._system = "Linux"
+        with patch("src.core.sounds.shutil.which", return_value="/usr/bin/paplay"), \
+                patch("src.core.sounds.subprocess.Popen") as popen:
+            popen.return_value.poll.return_value = None  # still running
+            player.play(SoundEffect.ALERT)
+            player.play(SoundEffect.NEW_OPPORTUNITY)
+
+        assert popen.call_count == 1
+
 
 class TestGlobalSoundPlayer:
     """Tests for global sound player functions."""
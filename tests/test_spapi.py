@@ -0,0 +1,59 @@
+"""Tests for SP-API client."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+from src.api.spapi import RateLimiter, SpApiClient
+from src.core.config import Settings
+
+
+class TestRateLimiter:
+    """Tests for the SP-API token bucket."""
+
+    def test_burst_is_not_delayed(self):
+        """Calls within the burst size return immediately."""
+        limiter = RateLimiter(rate=0.1, burst=2)
+
+        start = time.monotonic()
+        limiter.acquire()
+        limiter.acquire()
+
+        assert time.monotonic() - start < 0.05
+
+    def test_waits_for_next_token(self):
+        """Once the burst is spent, a call waits about 1/rate seconds."""
+        limiter = RateLimiter(rate=20.0, burst=1)
+        limiter.acquire()
+
+        start = time.monotonic()
+        limiter.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    def test_set_rate_ignores_invalid_values(self):
+        """Non-positive rates from headers are ignored."""
+        limiter = RateLimiter(rate=2.0)
+        limiter.set_rate(0)
+        assert limiter.rate == 2.0
+        limiter.set_rate(5.0)
+        assert limiter.rate == 5.0
+
+
+class TestSpApiRateLimitHeader:
+    """Tests for adopting the x-amzn-RateLimit-Limit header."""
+
+    def test_catalog_search_updates_limiter_rate(self):
+        """The catalog limiter follows the rate SP-API reports."""
+        settings = Settings()
+        settings.api.mock_mode = False
+        client = SpApiClient(settings)
+        client._get_lwa_access_token = MagicMock(return_value="token")
+        response = MagicMock(status_code=200, headers={"x-amzn-RateLimit-Limit": "5.0"})
+        response.json.return_value = {"items": []}
+        client.session.request = MagicMock(return_value=response)
+
+        client.search_catalog_by_identifiers_batch(["5035048641811"])
+
+        assert client.catalog_limiter.rate == 5.0